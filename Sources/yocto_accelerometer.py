@@ -106,8 +106,8 @@ class YAccelerometer(YSensor):
 
         On failure, throws an exception or returns YAccelerometer.XVALUE_INVALID.
         """
-        if self._cacheExpiration <= YAPI.GetTickCount():
-            if self.load(YAPI.DefaultCacheValidity) != YAPI.SUCCESS:
+        if self._cacheExpired("xValue"):
+            if self.load(self._cacheValidity()) != YAPI.SUCCESS:
                 return YAccelerometer.XVALUE_INVALID
         return self._xValue
 
@@ -119,8 +119,8 @@ class YAccelerometer(YSensor):
 
         On failure, throws an exception or returns YAccelerometer.YVALUE_INVALID.
         """
-        if self._cacheExpiration <= YAPI.GetTickCount():
-            if self.load(YAPI.DefaultCacheValidity) != YAPI.SUCCESS:
+        if self._cacheExpired("yValue"):
+            if self.load(self._cacheValidity()) != YAPI.SUCCESS:
                 return YAccelerometer.YVALUE_INVALID
         return self._yValue
 
@@ -132,14 +132,14 @@ class YAccelerometer(YSensor):
 
         On failure, throws an exception or returns YAccelerometer.ZVALUE_INVALID.
         """
-        if self._cacheExpiration <= YAPI.GetTickCount():
-            if self.load(YAPI.DefaultCacheValidity) != YAPI.SUCCESS:
+        if self._cacheExpired("zValue"):
+            if self.load(self._cacheValidity()) != YAPI.SUCCESS:
                 return YAccelerometer.ZVALUE_INVALID
         return self._zValue
 
     def get_gravityCancellation(self):
-        if self._cacheExpiration <= YAPI.GetTickCount():
-            if self.load(YAPI.DefaultCacheValidity) != YAPI.SUCCESS:
+        if self._cacheExpired("gravityCancellation"):
+            if self.load(self._cacheValidity()) != YAPI.SUCCESS:
                 return YAccelerometer.GRAVITYCANCELLATION_INVALID
         return self._gravityCancellation
 
@@ -123,8 +123,8 @@ class YAltitude(YSensor):
 
         On failure, throws an exception or returns YAltitude.QNH_INVALID.
         """
-        if self._cacheExpiration <= YAPI.GetTickCount():
-            if self.load(YAPI.DefaultCacheValidity) != YAPI.SUCCESS:
+        if self._cacheExpired("qnh"):
+            if self.load(self._cacheValidity()) != YAPI.SUCCESS:
                 return YAltitude.QNH_INVALID
         return self._qnh
 
@@ -138,8 +138,8 @@ class YAltitude(YSensor):
 
         On failure, throws an exception or returns YAltitude.TECHNOLOGY_INVALID.
         """
-        if self._cacheExpiration <= YAPI.GetTickCount():
-            if self.load(YAPI.DefaultCacheValidity) != YAPI.SUCCESS:
+        if self._cacheExpired("technology"):
+            if self.load(self._cacheValidity()) != YAPI.SUCCESS:
                 return YAltitude.TECHNOLOGY_INVALID
         return self._technology
 
@@ -140,8 +140,8 @@ class YAnButton(YFunction):
 
         On failure, throws an exception or returns YAnButton.CALIBRATEDVALUE_INVALID.
         """
-        if self._cacheExpiration <= YAPI.GetTickCount():
-            if self.load(YAPI.DefaultCacheValidity) != YAPI.SUCCESS:
+        if self._cacheExpired("calibratedValue"):
+            if self.load(self._cacheValidity()) != YAPI.SUCCESS:
                 return YAnButton.CALIBRATEDVALUE_INVALID
         return self._calibratedValue
 
@@ -153,8 +153,8 @@ class YAnButton(YFunction):
 
         On failure, throws an exception or returns YAnButton.RAWVALUE_INVALID.
         """
-        if self._cacheExpiration <= YAPI.GetTickCount():
-            if self.load(YAPI.DefaultCacheValidity) != YAPI.SUCCESS:
+        if self._cacheExpired("rawValue"):
+            if self.load(self._cacheValidity()) != YAPI.SUCCESS:
                 return YAnButton.RAWVALUE_INVALID
         return self._rawValue
 
@@ -166,8 +166,8 @@ class YAnButton(YFunction):
 
         On failure, throws an exception or returns YAnButton.ANALOGCALIBRATION_INVALID.
         """
-        if self._cacheExpiration <= YAPI.GetTickCount():
-            if self.load(YAPI.DefaultCacheValidity) != YAPI.SUCCESS:
+        if self._cacheExpired("analogCalibration"):
+            if self.load(self._cacheValidity()) != YAPI.SUCCESS:
                 return YAnButton.ANALOGCALIBRATION_INVALID
         return self._analogCalibration
 
@@ -194,8 +194,8 @@ class YAnButton(YFunction):
 
         On failure, throws an exception or returns YAnButton.CALIBRATIONMAX_INVALID.
         """
-        if self._cacheExpiration <= YAPI.GetTickCount():
-            if self.load(YAPI.DefaultCacheValidity) != YAPI.SUCCESS:
+        if self._cacheExpired("calibrationMax"):
+            if self.load(self._cacheValidity()) != YAPI.SUCCESS:
                 return YAnButton.CALIBRATIONMAX_INVALID
         return self._calibrationMax
 
@@ -225,8 +225,8 @@ class YAnButton(YFunction):
 
         On failure, throws an exception or returns YAnButton.CALIBRATIONMIN_INVALID.
         """
-        if self._cacheExpiration <= YAPI.GetTickCount():
-            if self.load(YAPI.DefaultCacheValidity) != YAPI.SUCCESS:
+        if self._cacheExpired("calibrationMin"):
+            if self.load(self._cacheValidity()) != YAPI.SUCCESS:
                 return YAnButton.CALIBRATIONMIN_INVALID
         return self._calibrationMin
 
@@ -256,8 +256,8 @@ class YAnButton(YFunction):
 
         On failure, throws an exception or returns YAnButton.SENSITIVITY_INVALID.
         """
-        if self._cacheExpiration <= YAPI.GetTickCount():
-            if self.load(YAPI.DefaultCacheValidity) != YAPI.SUCCESS:
+        if self._cacheExpired("sensitivity"):
+            if self.load(self._cacheValidity()) != YAPI.SUCCESS:
                 return YAnButton.SENSITIVITY_INVALID
         return self._sensitivity
 
@@ -289,8 +289,8 @@ class YAnButton(YFunction):
 
         On failure, throws an exception or returns YAnButton.ISPRESSED_INVALID.
         """
-        if self._cacheExpiration <= YAPI.GetTickCount():
-            if self.load(YAPI.DefaultCacheValidity) != YAPI.SUCCESS:
+        if self._cacheExpired("isPressed"):
+            if self.load(self._cacheValidity()) != YAPI.SUCCESS:
                 return YAnButton.ISPRESSED_INVALID
         return self._isPressed
 
@@ -305,8 +305,8 @@ class YAnButton(YFunction):
 
         On failure, throws an exception or returns YAnButton.LASTTIMEPRESSED_INVALID.
         """
-        if self._cacheExpiration <= YAPI.GetTickCount():
-            if self.load(YAPI.DefaultCacheValidity) != YAPI.SUCCESS:
+        if self._cacheExpired("lastTimePressed"):
+            if self.load(self._cacheValidity()) != YAPI.SUCCESS:
                 return YAnButton.LASTTIMEPRESSED_INVALID
         return self._lastTimePressed
 
@@ -321,8 +321,8 @@ class YAnButton(YFunction):
 
         On failure, throws an exception or returns YAnButton.LASTTIMERELEASED_INVALID.
         """
-        if self._cacheExpiration <= YAPI.GetTickCount():
-            if self.load(YAPI.DefaultCacheValidity) != YAPI.SUCCESS:
+        if self._cacheExpired("lastTimeReleased"):
+            if self.load(self._cacheValidity()) != YAPI.SUCCESS:
                 return YAnButton.LASTTIMERELEASED_INVALID
         return self._lastTimeReleased
 
@@ -334,8 +334,8 @@ class YAnButton(YFunction):
 
         On failure, throws an exception or returns YAnButton.PULSECOUNTER_INVALID.
         """
-        if self._cacheExpiration <= YAPI.GetTickCount():
-            if self.load(YAPI.DefaultCacheValidity) != YAPI.SUCCESS:
+        if self._cacheExpired("pulseCounter"):
+            if self.load(self._cacheValidity()) != YAPI.SUCCESS:
                 return YAnButton.PULSECOUNTER_INVALID
         return self._pulseCounter
 
@@ -351,8 +351,8 @@ class YAnButton(YFunction):
 
         On failure, throws an exception or returns YAnButton.PULSETIMER_INVALID.
         """
-        if self._cacheExpiration <= YAPI.GetTickCount():
-            if self.load(YAPI.DefaultCacheValidity) != YAPI.SUCCESS:
+        if self._cacheExpired("pulseTimer"):
+            if self.load(self._cacheValidity()) != YAPI.SUCCESS:
                 return YAnButton.PULSETIMER_INVALID
         return self._pulseTimer
 
@@ -51,7 +51,21 @@ import os
 import time
 import array
 import binascii
+import bisect
+import collections
+import re
+import threading
 from ctypes import *
+#(json module not available in 2.5.x)
+try:
+    import json
+except ImportError:
+    json = None
+#(concurrent.futures not available in 2.x)
+try:
+    import concurrent.futures
+except ImportError:
+    concurrent = None
 
 #
 #  PYTHON 2.x VS PYTHON 3.x compatibility check
@@ -115,6 +129,30 @@ else:
     YAddByte = YAddBytePython3x
     YRelTickCount = YRelTickCountPython3x
 
+
+#
+#  Monotonic millisecond counter used for cache and timeout bookkeeping
+#  (time.monotonic_ns not supported before 3.7, time.monotonic not supported in 2.x)
+#
+def YMonotonicTickCountNs():
+    return time.monotonic_ns() // 1000000
+
+
+def YMonotonicTickCountFloat():
+    return int(time.monotonic() * 1000)
+
+
+def YMonotonicTickCountWallClock():
+    return int(time.time() * 1000)
+
+
+if hasattr(time, "monotonic_ns"):
+    YMonotonicTickCount = YMonotonicTickCountNs
+elif hasattr(time, "monotonic"):
+    YMonotonicTickCount = YMonotonicTickCountFloat
+else:
+    YMonotonicTickCount = YMonotonicTickCountWallClock
+
 # Ugly global var for Python 2 compatibility
 yLogFct = None
 yDeviceLogFct = None
@@ -164,10 +202,32 @@ class YAPI:
             self.bvalue = False
             self.members = []
             self.items = []
+            self._index = None
+            self._indexed = 0
 
         def memberscount(self):
             return len(self.members)
 
+        def findmember(self, name):
+            # name->member index, built on first lookup and rebuilt when members were added
+            if self._index is None or self._indexed != len(self.members):
+                index = {}
+                for member in reversed(self.members):
+                    index[member.name] = member
+                self._index = index
+                self._indexed = len(self.members)
+            return self._index.get(name)
+
+        def setmember(self, element):
+            # replace the member with the same name in place, or append it
+            members = self.members
+            for i in range(len(members)):
+                if members[i].name == element.name:
+                    members[i] = element
+                    self._index = None
+                    return
+            members.append(element)
+
         def itemscount(self):
             return len(self.items)
 
@@ -259,10 +319,75 @@ class YAPI:
                 self.i = 0
 
         def _Parse(self, st):
+            if YAPI.TJsonParser._FastDecoder is not None:
+                res = self._FastParse(st)
+                if res is not None:
+                    return res
             idx = self.refidx()
             st = "\"root\" : " + st + " "
             return self._ParseEx(self.Tjstate.JWAITFORNAME, "", st, idx)
 
+        # Tree builder based on the C accelerated stdlib json scanner. It only handles
+        # strict JSON that the state machine below would decode identically: the state
+        # machine keeps any escaped char as is, does not know floats or null and accepts
+        # booleans in any case. Anything else returns None and is left to _ParseEx.
+        _FastDecoder = None
+        _UnsupportedEscape = re.compile(r'\\[^"\\/]')
+
+        class _FastParseFallback(Exception):
+            pass
+
+        @staticmethod
+        def _toRecord(name, value):
+            vtype = type(value)
+            if vtype is YAPI.TJSONRECORD:
+                value.name = name
+                return value
+            if vtype is str:
+                res = YAPI.TJSONRECORD(name, YAPI.TJSONRECORDTYPE.JSON_STRING)
+                res.svalue = value
+                return res
+            if vtype is int:
+                res = YAPI.TJSONRECORD(name, YAPI.TJSONRECORDTYPE.JSON_INTEGER)
+                res.ivalue = value
+                return res
+            if vtype is bool:
+                res = YAPI.TJSONRECORD(name, YAPI.TJSONRECORDTYPE.JSON_BOOLEAN)
+                res.bvalue = value
+                return res
+            if vtype is list:
+                res = YAPI.TJSONRECORD(name, YAPI.TJSONRECORDTYPE.JSON_ARRAY)
+                toRecord = YAPI.TJsonParser._toRecord
+                items = res.items
+                for i in range(len(value)):
+                    items.append(toRecord(str(i), value[i]))
+                return res
+            raise YAPI.TJsonParser._FastParseFallback()
+
+        @staticmethod
+        def _structHook(pairs):
+            res = YAPI.TJSONRECORD("", YAPI.TJSONRECORDTYPE.JSON_STRUCT)
+            toRecord = YAPI.TJsonParser._toRecord
+            members = res.members
+            for name, value in pairs:
+                if '\\' in name or '"' in name or '/' in name:
+                    # escaped names are kept verbatim by the state machine
+                    raise YAPI.TJsonParser._FastParseFallback()
+                members.append(toRecord(name, value))
+            return res
+
+        def _FastParse(self, st):
+            if '\\' in st and self._UnsupportedEscape.search(st) is not None:
+                return None
+            start = 0
+            while start < len(st) and st[start] in ' \r\n':
+                start += 1
+            try:
+                value = YAPI.TJsonParser._FastDecoder.raw_decode(st, start)[0]
+                return self._toRecord("root", value)
+            except (ValueError, YAPI.TJsonParser._FastParseFallback):
+                return None
+
         @staticmethod
         def _ParseError(st, i, errmsgRef):
             ststart = i - 10
@@ -505,9 +630,7 @@ class YAPI:
                 p = self.data
 
             if p.recordtype == YAPI.TJSONRECORDTYPE.JSON_STRUCT:
-                for i in range(0, len(p.members)):
-                    if p.members[i].name == nodename:
-                        return p.members[i]
+                return p.findmember(nodename)
             elif p.recordtype == YAPI.TJSONRECORDTYPE.JSON_ARRAY:
                 index = int(nodename)
                 if index >= len(p.items):
@@ -516,6 +639,10 @@ class YAPI:
 
             return None
 
+    #(the fast JSON tree builder relies on Python 3.x str semantics)
+    if json is not None and sys.version_info >= (3, 0):
+        TJsonParser._FastDecoder = json.JSONDecoder(object_pairs_hook=TJsonParser._structHook)
+
     # Switch to turn off exceptions and use return codes instead, for source-code compatibility
     # with languages without exception support like C
     ExceptionsDisabled = False
@@ -525,7 +652,52 @@ class YAPI:
     # Default cache validity (in [ms]) before reloading data from device. This saves a lots of traffic.
     # Note that a value under 2 ms makes little sense since a USB bus itself has a 2ms round-trip period
 
-    DefaultCacheValidity = datetime.timedelta(milliseconds=5)
+    DefaultCacheValidity = 5
+
+    # YFunction.load() only downloads the function subtree (GET /api/<funcId>.json) unless at
+    # least this many functions of the same device were loaded within the last
+    # PartialLoadWindow, in which case the whole api.json is fetched once and
+    # shared. The window does not depend on the cache validity, which is often shorter than
+    # the round trip to a hub. Set PartialLoadThreshold to 0 to always load api.json
+    PartialLoadThreshold = 3
+    PartialLoadWindow = 1000
+
+    # Cache validity policies set by SetCacheValidity(): per function target (class name,
+    # hardware id or function name) and per (target, attribute), and cache hit/miss counters
+    _CacheValidity = {}
+    _AttrCacheValidity = {}
+    _CacheStats = {}
+    _SavedRequests = 0
+    _SavedRequestsLock = threading.Lock()
+
+    # Bumped whenever a device arrives, leaves or changes, to invalidate the function
+    # name resolutions cached by YFunction._resolve()
+    _ResolveGeneration = 0
+
+    # Push cache (see EnablePushCache): loaded functions fed by value notifications,
+    # by function descriptor, and time of the last completed HandleEvents()
+    _PushCacheEnabled = False
+    _PushCacheFunctions = {}
+    _LastEventsHandled = 0
+    PushCacheTimeout = 1000
+
+    # Background event pump, see StartEventThread()
+    _EventThread = None
+    _EventThreadStop = None
+    _EventExecutor = None
+    _EventExecutorOwned = False
+    # set in the threads running callbacks submitted by the event thread
+    _EventCallbackContext = threading.local()
+
+    # Sleep() blocks on _EventSignal, which is notified by the native callbacks as soon
+    # as an event is queued. While at least one Sleep() is pending, the native waiter
+    # thread keeps the native library handling the device events, in slices of
+    # _NativeWaitSlice milliseconds
+    _EventSignal = threading.Condition()
+    _NativeWaiter = None
+    _NativeWaiterExit = False
+    _NativeWaitSlice = 50
+    _Sleepers = 0
     INVALID_STRING = "!INVALID!"
     INVALID_DOUBLE = -1.79769313486231E+308
     INVALID_INT = -2147483648
@@ -572,8 +744,10 @@ class YAPI:
 
     C_INTSIZE = 4  # we assume an int size is 4 byte
 
-    _PlugEvents = []
-    _DataEvents = []
+    # Event queue overflow policies, see SetEventQueuePolicy()
+    EVENTS_DROP_OLDEST = 0
+    EVENTS_COALESCE = 1
+
     _CalibHandlers = {}
 
     #  private extern static void DllCallTest(ref yDeviceSt data);
@@ -1080,15 +1254,91 @@ class YAPI:
         # noinspection PyProtectedMember
         def invokeData(self):
             if self.ev == self.FUN_VALUE:
-                for i in range(len(YFunction._FunctionCallbacks)):
-                    if YFunction._FunctionCallbacks[i].get_functionDescriptor() == self.fun_descr:
-                        YFunction._FunctionCallbacks[i]._invokeValueCallback(self.value)
+                if self.fun_descr in YAPI._PushCacheFunctions:
+                    for func in YAPI._PushCacheFunctions[self.fun_descr][:]:
+                        func._pushValue(self.value)
+                if self.fun_descr in YFunction._FunctionCallbacksByDescr:
+                    # (copy: a callback may unregister itself)
+                    for func in YFunction._FunctionCallbacksByDescr[self.fun_descr][:]:
+                        func._invokeValueCallback(self.value)
             elif self.ev == self.FUN_TIMEDREPORT:
-                if self.report[0] <= 2:
-                    for i in range(len(YFunction._TimedReportCallbackList)):
-                        if YFunction._TimedReportCallbackList[i].get_functionDescriptor() == self.fun_descr:
-                            sensor = YFunction._TimedReportCallbackList[i]
-                            sensor._invokeTimedReportCallback(sensor._decodeTimedReport(self.timestamp, self.report))
+                if self.report[0] <= 2 and self.fun_descr in YFunction._TimedReportCallbacksByDescr:
+                    for sensor in YFunction._TimedReportCallbacksByDescr[self.fun_descr][:]:
+                        sensor._invokeTimedReportCallback(sensor._decodeTimedReport(self.timestamp, self.report))
+
+    class _EventQueue:
+        # FIFO of pending _Event objects, optionally bounded, with overload counters
+        def __init__(self):
+            self._queue = collections.deque()
+            self._latestValue = {}
+            self.maxSize = 0
+            self.policy = 0  # EVENTS_DROP_OLDEST
+            self.highWater = 0
+            self.dropped = 0
+            self.coalesced = 0
+
+        def __len__(self):
+            return len(self._queue)
+
+        def _forget(self, ev):
+            if ev.ev == ev.FUN_VALUE and self._latestValue.get(ev.fun_descr) is ev:
+                del self._latestValue[ev.fun_descr]
+
+        def append(self, ev):
+            if self.policy == YAPI.EVENTS_COALESCE and ev.ev == ev.FUN_VALUE:
+                # keep a single pending value per function, with the latest value
+                prev = self._latestValue.get(ev.fun_descr)
+                if prev is not None:
+                    prev.value = ev.value
+                    self.coalesced += 1
+                    return
+                self._latestValue[ev.fun_descr] = ev
+            if 0 < self.maxSize <= len(self._queue):
+                self._forget(self._queue.popleft())
+                self.dropped += 1
+            self._queue.append(ev)
+            if len(self._queue) > self.highWater:
+                self.highWater = len(self._queue)
+
+        def popleft(self):
+            ev = self._queue.popleft()
+            self._forget(ev)
+            return ev
+
+        def clear(self):
+            self._queue.clear()
+            self._latestValue.clear()
+
+        def stats(self):
+            return {"depth": len(self._queue), "highWater": self.highWater,
+                    "dropped": self.dropped, "coalesced": self.coalesced}
+
+        def resetStats(self):
+            self.highWater = len(self._queue)
+            self.dropped = 0
+            self.coalesced = 0
+
+    _PlugEvents = _EventQueue()
+    _DataEvents = _EventQueue()
+
+    # Set of ctypes buffers used by the wrappers of the native functions. The sets are
+    # reused through per-thread free lists instead of being allocated on every call:
+    # a wrapper takes a set with _acquireScratch() and gives it back with
+    # _releaseScratch() once it has copied the results. A wrapper reentered from a
+    # native callback simply takes another set.
+    class _Scratch(object):
+        __slots__ = ("errmsg", "serial", "funcId", "baseType", "logicalName", "pubVal", "iohdl")
+
+        def __init__(self):
+            self.errmsg = ctypes.create_string_buffer(YAPI.YOCTO_ERRMSG_LEN)
+            self.serial = ctypes.create_string_buffer(YAPI.YOCTO_SERIAL_LEN)
+            self.funcId = ctypes.create_string_buffer(YAPI.YOCTO_FUNCTION_LEN)
+            self.baseType = ctypes.create_string_buffer(YAPI.YOCTO_FUNCTION_LEN)
+            self.logicalName = ctypes.create_string_buffer(YAPI.YOCTO_LOGICAL_LEN)
+            self.pubVal = ctypes.create_string_buffer(YAPI.YOCTO_PUBVAL_LEN)
+            self.iohdl = ctypes.create_string_buffer(YAPI.YIOHDL_SIZE)
+
+    _ScratchPool = threading.local()
 
     ##--- (generated code: YFunction return codes)
     # Yoctopuce error codes, used by default as function return value
@@ -1114,6 +1364,8 @@ class YAPI:
         pass
 
     YDevice_devCache = []
+    # same devices, by device descriptor
+    _YDevice_devByDescr = {}
 
     # - Types used for internal yapi callbacks
     _yapiLogFunc = ctypes.CFUNCTYPE(None, ctypes.c_char_p, ctypes.c_int)
@@ -1157,10 +1409,18 @@ class YAPI:
         @return a long integer corresponding to the millisecond counter.
         """
         #### for python, since some implementations don't support 64bits integers
-        #### GetTickCount returns a datetime object instead of a u64
+        #### GetTickCount returns a datetime object instead of a u64.
+        #### The library itself uses the integer YMonotonicTickCount() counter.
         #noinspection PyUnresolvedReferences
         return datetime.datetime.today()
 
+    @staticmethod
+    def _toMs(duration):
+        # durations used to be timedelta objects, accept both
+        if isinstance(duration, datetime.timedelta):
+            return duration.days * 86400000 + duration.seconds * 1000 + duration.microseconds // 1000
+        return int(duration)
+
     @staticmethod
     def SetTraceFile(filename):
         fname = ctypes.create_string_buffer(filename.encode("ASCII"))
@@ -1175,8 +1435,8 @@ class YAPI:
         This function implements a passive waiting loop, meaning that it does not
         consume CPU cycles significantly. The processor is left available for
         other threads and processes. During the pause, the library nevertheless
-        reads from time to time information from the Yoctopuce modules by
-        calling yHandleEvents(), in order to stay up-to-date.
+        handles the information pushed by the Yoctopuce modules, and the value
+        callbacks are invoked as soon as the corresponding event is received.
 
         This function may signal an error in case there is a communication problem
         while contacting a module.
@@ -1189,28 +1449,40 @@ class YAPI:
 
         On failure, throws an exception or returns a negative error code.
         """
-        errBuffer = ctypes.create_string_buffer(YAPI.YOCTO_ERRMSG_LEN)
-        if type(ms_duration) == type(int()):
-            ms_duration = datetime.timedelta(milliseconds=ms_duration)
-        timeout = YAPI.GetTickCount() + ms_duration
-        res = YAPI.SUCCESS
-
-        ok = True
-        while ok:
-            res = YAPI.HandleEvents(errmsgRef)
-            if YAPI.YISERR(res):
-                return res
-
-            if YAPI.GetTickCount() < timeout:
-                #noinspection PyUnresolvedReferences
-                res = YAPI._yapiSleep(2, errBuffer)
+        timeout = YMonotonicTickCount() + YAPI._toMs(ms_duration)
+        if YAPI._EventThread is not None:
+            # the event thread already handles and dispatches the events
+            with YAPI._EventSignal:
+                now = YMonotonicTickCount()
+                while now < timeout and YAPI._EventThread is not None:
+                    YAPI._EventSignal.wait((timeout - now) / 1000.0)
+                    now = YMonotonicTickCount()
+            if YAPI._EventThread is not None or now >= timeout:
+                return YAPI.SUCCESS
+
+        res = YAPI.HandleEvents(errmsgRef)
+        if YAPI.YISERR(res):
+            return res
+        if YMonotonicTickCount() >= timeout:
+            return res
+        YAPI._startNativeWaiter()
+        with YAPI._EventSignal:
+            YAPI._Sleepers += 1
+            YAPI._EventSignal.notify_all()
+        try:
+            while True:
+                with YAPI._EventSignal:
+                    now = YMonotonicTickCount()
+                    if now >= timeout:
+                        break
+                    if len(YAPI._DataEvents) == 0:
+                        YAPI._EventSignal.wait((timeout - now) / 1000.0)
+                res = YAPI.HandleEvents(errmsgRef)
                 if YAPI.YISERR(res):
-                    if not errmsgRef is None:
-                        errmsgRef.value = YByte2String(errBuffer.value)
                     return res
-            ok = YAPI.GetTickCount() < timeout
-        if errmsgRef is not None:
-            errmsgRef.value = YByte2String(errBuffer.value)
+        finally:
+            with YAPI._EventSignal:
+                YAPI._Sleepers -= 1
         return res
 
     @staticmethod
@@ -1233,22 +1505,24 @@ class YAPI:
 
     @staticmethod
     def yapiLockFunctionCallBack(errmsgRef=None):
-        errBuffer = ctypes.create_string_buffer(YAPI.YOCTO_ERRMSG_LEN)
+        scratch = YAPI._acquireScratch()
         #noinspection PyUnresolvedReferences
-        res = YAPI._yapiLockFunctionCallBack(errBuffer)
+        res = YAPI._yapiLockFunctionCallBack(scratch.errmsg)
         if errmsgRef is not None:
             #noinspection PyAttributeOutsideInit
-            errmsgRef.value = YByte2String(errBuffer.value)
+            errmsgRef.value = YByte2String(scratch.errmsg.value)
+        YAPI._releaseScratch(scratch)
         return res
 
     @staticmethod
     def yapiUnlockFunctionCallBack(errmsgRef=None):
-        errBuffer = ctypes.create_string_buffer(YAPI.YOCTO_ERRMSG_LEN)
+        scratch = YAPI._acquireScratch()
         #noinspection PyUnresolvedReferences
-        res = YAPI._yapiUnlockFunctionCallBack(errBuffer)
+        res = YAPI._yapiUnlockFunctionCallBack(scratch.errmsg)
         if not errmsgRef is None:
             #noinspection PyAttributeOutsideInit
-            errmsgRef.value = YByte2String(errBuffer.value)
+            errmsgRef.value = YByte2String(scratch.errmsg.value)
+        YAPI._releaseScratch(scratch)
         return res
 
     @staticmethod
@@ -1272,6 +1546,43 @@ class YAPI:
 
     @staticmethod
     def _decimalToDouble(val):
+        if 0 <= val <= 65535:
+            return YAPI._decimalTable[val]
+        # negative values down to -32768 decode like their low 16 bits
+        if -32768 <= val < 0:
+            return YAPI._decimalTable[val & 0xffff]
+        return YAPI._computeDecimalToDouble(val)
+
+    @staticmethod
+    def _decimalsToDoubles(words):
+        # decode a whole sequence of 16-bit decimal floats, returns a list
+        if len(words) > 0 and (min(words) < 0 or max(words) > 65535):
+            return [YAPI._decimalToDouble(w) for w in words]
+        table = YAPI._getDecimalTable()
+        return [table[w] for w in words]
+
+    # All possible 16-bit decimal floats, decoded when first used
+    class _DecimalTable(object):
+        def __getitem__(self, index):
+            return YAPI._buildDecimalTable()[index]
+
+    @staticmethod
+    def _buildDecimalTable():
+        YAPI._decimalTable = [YAPI._computeDecimalToDouble(val) for val in range(65536)]
+        return YAPI._decimalTable
+
+    @staticmethod
+    def _getDecimalTable():
+        # the placeholder builds the whole table on each access, only use the list
+        table = YAPI._decimalTable
+        if isinstance(table, YAPI._DecimalTable):
+            table = YAPI._buildDecimalTable()
+        return table
+
+    _decimalTable = _DecimalTable()
+
+    @staticmethod
+    def _computeDecimalToDouble(val):
         negate = False
         mantis = val & 2047
         if mantis == 0:
@@ -1300,9 +1611,10 @@ class YAPI:
             negate = True
             val = -val
         comp = val / 1999.0
-        decpow = 0
-        while comp > YAPI.decExp[decpow] and decpow < 15:
-            decpow += 1
+        # smallest power of ten not below comp
+        decpow = bisect.bisect_left(YAPI.decExp, comp)
+        if decpow > 15:
+            decpow = 15
         mant = val / YAPI.decExp[decpow]
         if decpow == 15 and mant > 2047.0:
             res = (15 << 11) + 2047  # overflow
@@ -1313,82 +1625,81 @@ class YAPI:
         else:
             return res
 
+    @staticmethod
+    def _doublesToDecimals(values):
+        # encode a whole sequence of floats as 16-bit decimal floats, returns a list
+        return [YAPI._doubleToDecimal(val) for val in values]
+
+    # Tokens of the word encoding: "*", "X" and "Y" special values, a lowercase (or higher)
+    # back-reference to a previous word, or a group of 3 base-32 digits; a shorter group
+    # can only occur at the end of a truncated string
+    _WordTokens = re.compile("[*XY]|[^\\x00-\\x60]|[\\s\\S]{1,3}")
+    # Words already decoded, by token (special values and 3-digit groups)
+    _WordValues = {"*": 0, "X": 0xffff, "Y": 0x7fff}
+    # Numbers of the float encoding: separators, optional sign, digits, and the character
+    # following the number, which is consumed as well
+    _FloatTokens = re.compile("[^-0-9]*(-?)([0-9.]*)([\\s\\S]?)")
+
+    @staticmethod
+    def _intArray(values):
+        # compact storage for decoded values, unless a malformed input produced values
+        # out of the range of a C int
+        try:
+            return array.array('i', values)
+        except OverflowError:
+            return values
+
     @staticmethod
     def _decodeWords(sdat):
-        p = 0
-        udat = []
-        while p < len(sdat):
-            c = sdat[p]
-            p += 1
-            if c == '*':
-                val = 0
-            elif c == 'X':
-                val = 0xffff
-            elif c == 'Y':
-                val = 0x7fff
-            elif c >= 'a':
-                srcpos = int(len(udat) - 1 - (ord(c) - ord('a')))
-                if srcpos < 0:
-                    val = 0
+        known = YAPI._WordValues
+        toks = YAPI._WordTokens.findall(sdat)
+        udat = list(map(known.get, toks))
+        if None in udat:
+            # resolve in order the back-references and the groups not seen yet
+            for i in range(udat.index(None), len(udat)):
+                if udat[i] is not None:
+                    continue
+                tok = toks[i]
+                if len(tok) == 3:
+                    c = tok[2]
+                    if c == 'z':
+                        c = "\\"
+                    val = (ord(tok[0]) - 48) + ((ord(tok[1]) - 48) << 5) + ((ord(c) - 48) << 10)
+                    if len(known) < 65536:
+                        known[tok] = val
+                elif tok >= 'a':
+                    srcpos = i - 1 - (ord(tok) - 97)
+                    if srcpos < 0:
+                        val = 0
+                    else:
+                        val = udat[srcpos]
                 else:
-                    val = udat[srcpos]
-            else:
-                if p + 2 > len(sdat):
-                    return udat
-                val = (ord(c) - ord('0'))
-                c = sdat[p]
-                p += 1
-                val += (ord(c) - ord('0')) << 5
-                c = sdat[p]
-                p += 1
-                if c == 'z':
-                    c = "\\"
-                val += (ord(c) - ord('0')) << 10
-            udat.append(val)
-        return udat
+                    # truncated group
+                    del udat[i:]
+                    break
+                udat[i] = val
+        return YAPI._intArray(udat)
 
     @staticmethod
     def _decodeFloats(sdat):
-        p = 0
         idat = []
-        while p < len(sdat):
-            val = 0
-            sign = 1
-            dec = 0
-            decInc = 0
-            c = sdat[p]
-            p += 1
-            while c != '-' and (c < '0' or c > '9'):
-                if p >= len(sdat):
-                    return idat
-                c = sdat[p]
-                p += 1
-            if c == '-':
-                if p >= len(sdat):
-                    return idat
-                sign = -sign
-                c = sdat[p]
-                p += 1
-            while ('0' <= c <= '9') or c == '.':
-                if c == '.':
-                    decInc = 1
-                elif dec < 3:
-                    val = val * 10 + ord(c) - ord('0')
-                    dec += decInc
-                if p < len(sdat):
-                    c = sdat[p]
-                    p += 1
-                else:
-                    c = 0
-            if dec < 3:
-                if dec == 0:
-                    val *= 1000
-                elif dec == 1:
-                    val *= 100
-                elif dec == 2:
-                    val *= 10
-            idat.append(sign * val)
-        return idat
+        for m in YAPI._FloatTokens.finditer(sdat):
+            (minus, digits, following) = m.groups()
+            if not digits and not following:
+                # nothing left, or a trailing sign
+                break
+            # up to 3 decimals are kept, the value is expressed in thousandths
+            dot = digits.find('.')
+            if dot < 0:
+                val = int(digits) * 1000 if digits else 0
+            else:
+                decimals = digits[dot + 1:].replace('.', '')[:3]
+                val = digits[:dot] + decimals
+                val = int(val) * (10 ** (3 - len(decimals))) if val else 0
+            if minus:
+                val = -val
+            idat.append(val)
+        return YAPI._intArray(idat)
 
     @staticmethod
     def _atoi(val):
@@ -1430,15 +1741,17 @@ class YAPI:
 
         On failure, throws an exception or returns a negative error code.
         """
-        errBuffer = ctypes.create_string_buffer(YAPI.YOCTO_ERRMSG_LEN)
+        scratch = YAPI._acquireScratch()
 
         #noinspection PyUnresolvedReferences
-        res = YAPI._yapiHandleEvents(errBuffer)
+        res = YAPI._yapiHandleEvents(scratch.errmsg)
         if YAPI.YISERR(res):
             if errmsgRef is not None:
                 #noinspection PyAttributeOutsideInit
-                errmsgRef.value = YByte2String(errBuffer.value)
+                errmsgRef.value = YByte2String(scratch.errmsg.value)
+            YAPI._releaseScratch(scratch)
             return res
+        YAPI._releaseScratch(scratch)
 
         while len(YAPI._DataEvents) > 0:
             YAPI.yapiLockFunctionCallBack(errmsgRef)
@@ -1446,9 +1759,10 @@ class YAPI:
                 YAPI.yapiUnlockFunctionCallBack(errmsgRef)
                 break
 
-            ev = YAPI._DataEvents.pop(0)
+            ev = YAPI._DataEvents.popleft()
             YAPI.yapiUnlockFunctionCallBack(errmsgRef)
             ev.invokeData()
+        YAPI._LastEventsHandled = YMonotonicTickCount()
         return YAPI.SUCCESS
 
     @staticmethod
@@ -1494,6 +1808,277 @@ class YAPI:
         """
         YAPI.ExceptionsDisabled = False
 
+    @staticmethod
+    def SetCacheValidity(msValidity, target="", attribute=""):
+        """
+        Changes the validity of the attribute values kept in cache. Without target and
+        attribute, this changes YAPI.DefaultCacheValidity, used by every function without
+        a more specific policy. A policy for an attribute overrides the validity of the
+        function for that attribute only, e.g. to poll currentValue often while reading
+        the unit rarely.
+
+        @param msValidity : the validity in milliseconds, or a negative value to remove
+                the policy for the given target and attribute
+        @param target : a function class name (e.g. "Temperature"), a hardware id
+                (e.g. "METEOMK1-12345.temperature"), the name used to find the function,
+                or an empty string for all functions
+        @param attribute : an attribute name (e.g. "currentValue"), or an empty string
+                for all attributes
+        """
+        msValidity = YAPI._toMs(msValidity)
+        if msValidity < 0:
+            msValidity = None
+        if attribute != "":
+            policies = YAPI._AttrCacheValidity
+            key = (target, attribute)
+        elif target != "":
+            policies = YAPI._CacheValidity
+            key = target
+        else:
+            if msValidity is not None:
+                YAPI.DefaultCacheValidity = msValidity
+            return
+        if msValidity is None:
+            if key in policies:
+                del policies[key]
+        else:
+            policies[key] = msValidity
+
+    @staticmethod
+    def GetCacheValidity(target="", attribute=""):
+        """
+        Returns the cache validity policy set for a target and an attribute.
+
+        @param target : a function class name, a hardware id, a function name or an empty string
+        @param attribute : an attribute name or an empty string
+
+        @return an integer number of milliseconds, or -1 when no policy is set
+        """
+        if attribute != "":
+            msValidity = YAPI._AttrCacheValidity.get((target, attribute))
+        elif target != "":
+            msValidity = YAPI._CacheValidity.get(target)
+        else:
+            msValidity = YAPI.DefaultCacheValidity
+        if msValidity is None:
+            return -1
+        return YAPI._toMs(msValidity)
+
+    @staticmethod
+    def ReadMany(functions, attributes, errmsgRef=None, maxThreads=8, msValidity=None, errorsRef=None):
+        """
+        Reads several attributes of many functions at once. Functions are grouped by
+        device, and the whole REST API of each device is loaded once, the devices being
+        contacted in parallel by at most maxThreads threads. The attributes of each
+        function are then read from that single load, so that the values returned for a
+        device are consistent with each other. The function caches are also loaded with
+        the retrieved values.
+
+        Errors do not interrupt the read and are not raised: the functions that could
+        not be read are left out of the result and reported through errorsRef.
+
+        @param functions : a list of YFunction objects (YSensor, YRelay, ...)
+        @param attributes : a list of attribute names, such as "currentValue", read with
+                the get_xxx() method of each function
+        @param errmsgRef : a string passed by reference to receive a summary of the
+                errors, or an empty string when all functions could be read
+        @param maxThreads : the maximal number of devices contacted at the same time
+        @param msValidity : the validity of the loaded values in the function caches,
+                in milliseconds. By default, the default cache validity is used.
+        @param errorsRef : a YRefParam receiving a dictionary mapping the hardware id
+                (or the name, for functions that could not be resolved) of each function
+                that could not be read to an error message, or an empty dictionary
+
+        @return a dictionary mapping the hardware id of each function read to a
+                dictionary mapping attribute names to values
+        """
+        if msValidity is None:
+            msValidity = YAPI.DefaultCacheValidity
+        msValidity = YAPI._toMs(msValidity)
+        errors = {}
+        devices = []
+        devFunctions = {}
+        for func in functions:
+            errRef = YRefParam()
+            res = func._resolve(errRef)
+            if YAPI.YISERR(res):
+                errors[func._func] = errRef.value
+                continue
+            unknown = [attr for attr in attributes if not hasattr(func, "get_" + attr)]
+            if len(unknown) > 0:
+                errors[func._resolvedSerial + "." + func._resolvedFuncId] = "unknown attribute: " + unknown[0]
+                continue
+            dev = func._resolvedDevice
+            if dev not in devFunctions:
+                devFunctions[dev] = []
+                devices.append(dev)
+            devFunctions[dev].append((func, func._fundescr, func._resolvedDevDescr, func._resolvedSerial,
+                                      func._resolvedFuncId))
+
+        def fetch(device):
+            apiresRef = YRefParam()
+            errRef = YRefParam()
+            res = device.requestAPI(apiresRef, errRef, 0)
+            if YAPI.YISERR(res):
+                return res, errRef.value
+            return res, apiresRef.value
+
+        if len(devices) > 1 and maxThreads > 1 and concurrent is not None:
+            pool = concurrent.futures.ThreadPoolExecutor(max_workers=min(maxThreads, len(devices)))
+            try:
+                replies = list(pool.map(fetch, devices))
+            finally:
+                pool.shutdown(True)
+        else:
+            replies = [fetch(dev) for dev in devices]
+
+        result = {}
+        for dev, reply in zip(devices, replies):
+            (res, apires) = reply
+            for (func, fundescr, devdescr, serial, funcId) in devFunctions[dev]:
+                hwId = serial + "." + funcId
+                if YAPI.YISERR(res):
+                    errors[hwId] = apires
+                    continue
+                node = apires.GetChildNode(None, funcId)
+                if YAPI.YISERR(func._loadNode(node, msValidity, fundescr, devdescr, serial, funcId)):
+                    errors[hwId] = "unexpected JSON structure: missing function " + funcId
+                    continue
+                values = {}
+                func._snapshotRead = True
+                try:
+                    for attr in attributes:
+                        values[attr] = getattr(func, "get_" + attr)()
+                except (YAPI_Exception, AttributeError):
+                    errors[hwId] = str(sys.exc_info()[1])
+                    continue
+                finally:
+                    func._snapshotRead = False
+                result[hwId] = values
+        if errorsRef is not None:
+            errorsRef.value = errors
+        if errmsgRef is not None:
+            errmsgRef.value = ""
+            if len(errors) > 0:
+                key = sorted(errors.keys())[0]
+                errmsgRef.value = "%d function(s) could not be read, %s: %s" % (len(errors), key, errors[key])
+        return result
+
+    @staticmethod
+    def EnablePushCache(msTimeout=1000):
+        """
+        Lets value notifications sent by the devices refresh the cache of the functions.
+        Once a function has been loaded, its advertised value (and the current value of
+        sensors) is then read from memory without contacting the device, as long as
+        HandleEvents() or Sleep() is called regularly to receive the notifications.
+        When notifications have not been processed for longer than msTimeout, or when
+        the device has been unplugged, getters fall back to the usual cache validity.
+
+        @param msTimeout : the longest time in milliseconds between two calls to
+                HandleEvents() for which pushed values are trusted
+        """
+        YAPI.PushCacheTimeout = msTimeout
+        YAPI._PushCacheEnabled = True
+
+    @staticmethod
+    def DisablePushCache():
+        """
+        Stops serving attributes from value notifications, see EnablePushCache().
+        """
+        YAPI._PushCacheEnabled = False
+        for funcs in list(YAPI._PushCacheFunctions.values()):
+            for func in funcs[:]:
+                func._pushCached = False
+        YAPI._PushCacheFunctions.clear()
+
+    @staticmethod
+    def SetEventQueuePolicy(maxSize, policy=EVENTS_DROP_OLDEST):
+        """
+        Bounds the queues holding the events received from the devices until they are
+        dispatched by HandleEvents() and UpdateDeviceList(). When a queue is full, the
+        oldest event is dropped. With YAPI.EVENTS_COALESCE, a new value notification
+        also replaces the one still pending for the same function, so that only the
+        latest value of each function gets delivered to value callbacks.
+
+        @param maxSize : the maximal number of pending events per queue, or 0 for no limit
+        @param policy : YAPI.EVENTS_DROP_OLDEST or YAPI.EVENTS_COALESCE
+        """
+        for queue in (YAPI._DataEvents, YAPI._PlugEvents):
+            queue.maxSize = maxSize
+            queue.policy = policy
+
+    @staticmethod
+    def GetEventQueueStats():
+        """
+        Returns the state of the event queues, for monitoring purposes: for the "data"
+        queue (value notifications and timed reports) and the "plug" queue (device
+        arrival, removal and change), the current number of pending events ("depth"),
+        the highest depth seen ("highWater"), and the number of events dropped because
+        the queue was full ("dropped") or merged with a pending value ("coalesced").
+
+        @return a dictionary of dictionaries, indexed by queue name then counter name
+        """
+        return {"data": YAPI._DataEvents.stats(), "plug": YAPI._PlugEvents.stats()}
+
+    @staticmethod
+    def ResetEventQueueStats():
+        """
+        Resets the high-water marks and drop counters returned by GetEventQueueStats().
+        """
+        YAPI._DataEvents.resetStats()
+        YAPI._PlugEvents.resetStats()
+
+    @staticmethod
+    def _pushCacheAlive(now):
+        return YAPI._PushCacheEnabled and YAPI._LastEventsHandled + YAPI.PushCacheTimeout > now
+
+    @staticmethod
+    def GetCacheStatistics():
+        """
+        Returns the number of attribute reads served from the cache (hits) and of reads
+        that required a request to the device (misses) since the last reset. Function
+        attributes are counted per class name, api.json loads under "api.json".
+
+        @return a dictionary mapping names to (hits, misses) tuples
+        """
+        res = {}
+        for name in YAPI._CacheStats:
+            counters = YAPI._CacheStats[name]
+            res[name] = (counters[0], counters[1])
+        return res
+
+    @staticmethod
+    def GetSavedRequestCount():
+        """
+        Returns the number of api.json requests that were avoided since the last reset,
+        because another thread was already loading the same device: such callers wait
+        for the reply in progress and share it.
+
+        @return an integer number of requests
+        """
+        return YAPI._SavedRequests
+
+    @staticmethod
+    def ResetCacheStatistics():
+        """
+        Resets the cache hit/miss counters returned by GetCacheStatistics() and the
+        count returned by GetSavedRequestCount().
+        """
+        YAPI._CacheStats.clear()
+        with YAPI._SavedRequestsLock:
+            YAPI._SavedRequests = 0
+
+    @staticmethod
+    def _countCacheAccess(name, hit):
+        counters = YAPI._CacheStats.get(name)
+        if counters is None:
+            counters = [0, 0]
+            YAPI._CacheStats[name] = counters
+        if hit:
+            counters[0] += 1
+        else:
+            counters[1] += 1
+
     # - Internal callback registered into YAPI
     #noinspection PyUnusedLocal
     @staticmethod
@@ -1543,6 +2128,7 @@ class YAPI:
 
     @staticmethod
     def native_yDeviceArrivalCallback(d):
+        YAPI._ResolveGeneration += 1
         YDevice.PlugDevice(d)
         infos = YAPI.emptyDeviceSt()
         errmsgRef = YRefParam()
@@ -1554,6 +2140,7 @@ class YAPI:
         ev.setArrival(modul)
         if yArrivalFct is not None:
             YAPI._PlugEvents.append(ev)
+            YAPI._signalEvent()
 
     @staticmethod
     def native_HubDiscoveryCallback(serial_ptr, url_ptr):
@@ -1562,6 +2149,7 @@ class YAPI:
         ev = YAPI._Event()
         ev.setHubDiscovery(serial, url)
         YAPI._PlugEvents.append(ev)
+        YAPI._signalEvent()
 
     @staticmethod
     def native_DeviceLogCallback(d, line):
@@ -1577,22 +2165,24 @@ class YAPI:
 
     @staticmethod
     def yapiLockDeviceCallBack(errmsgRef=None):
-        errmsg_buffer = ctypes.create_string_buffer(YAPI.YOCTO_ERRMSG_LEN)
+        scratch = YAPI._acquireScratch()
         #noinspection PyUnresolvedReferences
-        res = YAPI._yapiLockDeviceCallBack(errmsg_buffer)
+        res = YAPI._yapiLockDeviceCallBack(scratch.errmsg)
         if errmsgRef is not None:
             #noinspection PyAttributeOutsideInit
-            errmsgRef.value = YByte2String(errmsg_buffer.value)
+            errmsgRef.value = YByte2String(scratch.errmsg.value)
+        YAPI._releaseScratch(scratch)
         return res
 
     @staticmethod
     def yapiUnlockDeviceCallBack(errmsgRef=None):
-        errmsg_buffer = ctypes.create_string_buffer(YAPI.YOCTO_ERRMSG_LEN)
+        scratch = YAPI._acquireScratch()
         #noinspection PyUnresolvedReferences
-        res = YAPI._yapiUnlockDeviceCallBack(errmsg_buffer)
+        res = YAPI._yapiUnlockDeviceCallBack(scratch.errmsg)
         if errmsgRef is not None:
             #noinspection PyAttributeOutsideInit
-            errmsgRef.value = YByte2String(errmsg_buffer.value)
+            errmsgRef.value = YByte2String(scratch.errmsg.value)
+        YAPI._releaseScratch(scratch)
         return res
 
     @staticmethod
@@ -1653,6 +2243,7 @@ class YAPI:
     @staticmethod
     def native_yDeviceChangeCallback(d):
         global yChangeFct
+        YAPI._ResolveGeneration += 1
         infos = YAPI.emptyDeviceSt()
         errmsgRef = YRefParam()
         if yChangeFct is None:
@@ -1663,8 +2254,72 @@ class YAPI:
         ev = YAPI._Event()
         ev.setChange(modul)
         YAPI._PlugEvents.append(ev)
+        YAPI._signalEvent()
         return 0
 
+    @staticmethod
+    def _acquireScratch():
+        try:
+            scratch = YAPI._ScratchPool.free.pop()
+        except AttributeError:
+            YAPI._ScratchPool.free = []
+            scratch = YAPI._Scratch()
+        except IndexError:
+            scratch = YAPI._Scratch()
+        # the wrappers read back the error message even when the native call succeeds
+        scratch.errmsg[0] = b"\0"
+        return scratch
+
+    @staticmethod
+    def _releaseScratch(scratch):
+        YAPI._ScratchPool.free.append(scratch)
+
+    @staticmethod
+    def _signalEvent():
+        # wake up the pending Sleep() calls, an event has been queued
+        with YAPI._EventSignal:
+            YAPI._EventSignal.notify_all()
+
+    @staticmethod
+    def _startNativeWaiter():
+        with YAPI._EventSignal:
+            if YAPI._NativeWaiter is not None:
+                return
+            YAPI._NativeWaiterExit = False
+            thread = threading.Thread(target=YAPI._nativeWaiterRun, name="yocto-sleep")
+            thread.daemon = True
+            YAPI._NativeWaiter = thread
+        thread.start()
+
+    @staticmethod
+    def _stopNativeWaiter():
+        with YAPI._EventSignal:
+            thread = YAPI._NativeWaiter
+            if thread is None:
+                return
+            YAPI._NativeWaiterExit = True
+            YAPI._EventSignal.notify_all()
+        if thread is not threading.current_thread():
+            thread.join()
+        YAPI._NativeWaiter = None
+
+    @staticmethod
+    def _nativeWaiterRun():
+        errBuffer = ctypes.create_string_buffer(YAPI.YOCTO_ERRMSG_LEN)
+        while True:
+            with YAPI._EventSignal:
+                while YAPI._Sleepers == 0 and not YAPI._NativeWaiterExit:
+                    YAPI._EventSignal.wait()
+                if YAPI._NativeWaiterExit:
+                    return
+            # the native sleep only returns at the end of the slice, but it handles
+            # incoming events meanwhile, and the native callbacks signal each of them
+            # as soon as it is queued
+            #noinspection PyUnresolvedReferences
+            if YAPI.YISERR(YAPI._yapiSleep(YAPI._NativeWaitSlice, errBuffer)):
+                with YAPI._EventSignal:
+                    YAPI._EventSignal.wait(YAPI._NativeWaitSlice / 1000.0)
+
     @staticmethod
     def RegisterDeviceChangeCallback(callback):
         global yChangeFct
@@ -1672,8 +2327,8 @@ class YAPI:
 
     @staticmethod
     def queuesCleanUp():
-        del YAPI._PlugEvents[:]
-        del YAPI._DataEvents[:]
+        YAPI._PlugEvents.clear()
+        YAPI._DataEvents.clear()
 
     @staticmethod
     def native_yFunctionUpdateCallback(f, data):
@@ -1682,6 +2337,7 @@ class YAPI:
         ev = YAPI._Event()
         ev.setFunVal(f, YByte2String(data))
         YAPI._DataEvents.append(ev)
+        YAPI._signalEvent()
         return 0
 
     @staticmethod
@@ -1692,6 +2348,7 @@ class YAPI:
         ev = YAPI._Event()
         ev.setTimedReport(f, timestamp, report)
         YAPI._DataEvents.append(ev)
+        YAPI._signalEvent()
         return 0
 
     @staticmethod
@@ -1724,10 +2381,107 @@ class YAPI:
                 adj = adj2 + (adj - adj2) * (rawValue - x2) / (x - x2)
         return rawValue + adj
 
+    class _Calibration(object):
+        """
+        Calibration of a sensor or of a data stream, compiled once from the
+        calibration parameters. When the handler is LinearCalibrationHandler and the
+        raw points are strictly increasing, the segment is found by bisection, and
+        the adjustments and segment widths are precomputed, using the same
+        arithmetic as the handler. Otherwise, the handler is called for each value.
+        """
+
+        def __init__(self, handler, calibType, params, rawValues, refValues):
+            self._handler = handler
+            self._calibType = calibType
+            self._params = params
+            self._rawValues = rawValues
+            self._refValues = refValues
+            self._raw = None
+            self._adj = None
+            self._dadj = None
+            self._dx = None
+            self.apply = self._applyHandler
+            if handler is YAPI.LinearCalibrationHandler:
+                self._compileLinear()
+
+        def _compileLinear(self):
+            rawValues = self._rawValues
+            refValues = self._refValues
+            if self._calibType < YAPI.YOCTO_CALIB_TYPE_OFS:
+                npt = min(self._calibType % 10, len(rawValues), len(refValues))
+            else:
+                npt = len(refValues)
+            if len(rawValues) == 0 or len(refValues) == 0 or npt > len(rawValues):
+                # let the handler report malformed parameters
+                return
+            npt = max(npt, 1)
+            raw = list(rawValues[:npt])
+            for i in range(1, npt):
+                if not raw[i] > raw[i - 1]:
+                    return
+            adj = [refValues[i] - raw[i] for i in range(npt)]
+            self._raw = raw
+            self._adj = adj
+            self._dadj = [0.0] + [adj[i] - adj[i - 1] for i in range(1, npt)]
+            self._dx = [0.0] + [raw[i] - raw[i - 1] for i in range(1, npt)]
+            self.apply = self._applyLinear
+
+        def _applyHandler(self, rawValue):
+            return self._handler(rawValue, self._calibType, self._params, self._rawValues, self._refValues)
+
+        def _applyLinear(self, rawValue):
+            raw = self._raw
+            i = bisect.bisect_left(raw, rawValue)
+            if i == 0:
+                return rawValue + self._adj[0]
+            if i == len(raw):
+                return rawValue + self._adj[i - 1]
+            if rawValue < raw[i]:
+                adj2 = self._adj[i - 1]
+                return rawValue + (adj2 + self._dadj[i] * (rawValue - raw[i - 1]) / self._dx[i])
+            return rawValue + self._adj[i]
+
+        def applyMany(self, rawValues):
+            """
+            Calibrates a sequence of raw values.
+
+            @param rawValues : a sequence of raw values
+
+            @return a list of the calibrated values
+            """
+            if self._raw is None:
+                apply = self._applyHandler
+                return [apply(v) for v in rawValues]
+            raw = self._raw
+            adj = self._adj
+            dadj = self._dadj
+            dx = self._dx
+            n = len(raw)
+            bisect_left = bisect.bisect_left
+            res = []
+            for v in rawValues:
+                i = bisect_left(raw, v)
+                if i == 0:
+                    res.append(v + adj[0])
+                elif i == n:
+                    res.append(v + adj[n - 1])
+                elif v < raw[i]:
+                    res.append(v + (adj[i - 1] + dadj[i] * (v - raw[i - 1]) / dx[i]))
+                else:
+                    res.append(v + adj[i])
+            return res
+
     #noinspection PyUnresolvedReferences
     @staticmethod
     def native_yDeviceRemovalCallback(d):
         global yRemovalFct
+        YAPI._ResolveGeneration += 1
+        # values pushed by a device that is gone can no longer be trusted
+        # (snapshot: other threads may register functions meanwhile)
+        for funcs in list(YAPI._PushCacheFunctions.values()):
+            for func in funcs[:]:
+                if func._pushDevDescr == d:
+                    func._pushCached = False
         infos = YAPI.emptyDeviceSt()
         errmsgRef = YRefParam()
         if yRemovalFct is None:
@@ -1739,6 +2493,7 @@ class YAPI:
         ev = YAPI._Event()
         ev.setRemoval(modul)
         YAPI._PlugEvents.append(ev)
+        YAPI._signalEvent()
         return 0
 
     @staticmethod
@@ -1861,6 +2616,8 @@ class YAPI:
         yFreeAPI(), or your program will crash.
         """
         if YAPI._apiInitialized:
+            YAPI.StopEventThread()
+            YAPI._stopNativeWaiter()
             #noinspection PyUnresolvedReferences
             YAPI._yapiFreeAPI()
             YAPI.pymodule_cleanup()
@@ -2033,11 +2790,140 @@ class YAPI:
             return res
         while len(YAPI._PlugEvents) > 0:
             YAPI.yapiLockDeviceCallBack(errmsg)
-            p = YAPI._PlugEvents.pop(0)
+            p = YAPI._PlugEvents.popleft()
             YAPI.yapiUnlockDeviceCallBack(errmsg)
             p.invokePlug()
         return YAPI.SUCCESS
 
+    @staticmethod
+    def StartEventThread(msInterval=10, executor=None, msDeviceListInterval=1000, errmsg=None):
+        """
+        Starts a background thread that maintains the device-to-library communication
+        channel, so that callbacks are delivered without calling HandleEvents(),
+        Sleep() or UpdateDeviceList() from the application. Every msInterval, the thread
+        handles the events received from the devices, and every msDeviceListInterval it
+        also detects plugged and unplugged devices. Value callbacks, timed report
+        callbacks and device arrival/removal/change callbacks are submitted to the
+        executor, so that slow callbacks do not delay the reception of events.
+
+        @param msInterval : the period of the event handling loop, in milliseconds
+        @param executor : an object with a submit(fn) method, such as a
+                concurrent.futures.ThreadPoolExecutor. By default a single worker thread
+                is used, which keeps callbacks in the order the events were received.
+        @param msDeviceListInterval : the period of the device list updates, in milliseconds
+        @param errmsg : a string passed by reference to receive any error message.
+
+        @return YAPI.SUCCESS when the call succeeds.
+
+        On failure, throws an exception or returns a negative error code.
+        """
+        if YAPI._EventThread is not None:
+            return YAPI.SUCCESS
+        if not YAPI._apiInitialized:
+            res = YAPI.InitAPI(0, errmsg)
+            if YAPI.YISERR(res):
+                return res
+        owned = False
+        if executor is None and concurrent is not None:
+            executor = concurrent.futures.ThreadPoolExecutor(max_workers=1)
+            owned = True
+        YAPI._EventExecutor = executor
+        YAPI._EventExecutorOwned = owned
+        YAPI._EventThreadStop = threading.Event()
+        thread = threading.Thread(target=YAPI._eventThreadRun, name="yocto-events",
+                                  args=(YAPI._EventThreadStop, msInterval, msDeviceListInterval, executor))
+        thread.daemon = True
+        YAPI._EventThread = thread
+        thread.start()
+        return YAPI.SUCCESS
+
+    @staticmethod
+    def StopEventThread():
+        """
+        Stops the thread started by StartEventThread(), after the callbacks already
+        submitted to its default executor have completed.
+        """
+        thread = YAPI._EventThread
+        if thread is None:
+            return
+        YAPI._EventThreadStop.set()
+        if thread is not threading.current_thread():
+            thread.join()
+        if YAPI._EventExecutorOwned:
+            # a callback stopping the thread cannot wait for its own executor
+            YAPI._EventExecutor.shutdown(not getattr(YAPI._EventCallbackContext, "active", False))
+        YAPI._EventThread = None
+        YAPI._EventExecutor = None
+        YAPI._EventExecutorOwned = False
+        # pending Sleep() calls must now handle the events themselves
+        YAPI._signalEvent()
+
+    @staticmethod
+    def _eventThreadRun(stopEvent, msInterval, msDeviceListInterval, executor):
+        errmsgRef = YRefParam()
+        errBuffer = ctypes.create_string_buffer(YAPI.YOCTO_ERRMSG_LEN)
+        if executor is None:
+            #(no executor available, callbacks are run by this thread)
+            submit = YAPI._invokeNow
+        else:
+            def submit(fn):
+                future = executor.submit(YAPI._runEventCallback, fn)
+                if hasattr(future, "add_done_callback"):
+                    future.add_done_callback(YAPI._reportEventCallbackFailure)
+        nextDeviceList = 0
+        while not stopEvent.is_set():
+            if YMonotonicTickCount() >= nextDeviceList:
+                YAPI.yapiUpdateDeviceList(0, errmsgRef)
+                nextDeviceList = YMonotonicTickCount() + msDeviceListInterval
+            #noinspection PyUnresolvedReferences
+            if not YAPI.YISERR(YAPI._yapiHandleEvents(errBuffer)):
+                YAPI._LastEventsHandled = YMonotonicTickCount()
+            while len(YAPI._PlugEvents) > 0:
+                YAPI.yapiLockDeviceCallBack(errmsgRef)
+                if not len(YAPI._PlugEvents):
+                    YAPI.yapiUnlockDeviceCallBack(errmsgRef)
+                    break
+                ev = YAPI._PlugEvents.popleft()
+                YAPI.yapiUnlockDeviceCallBack(errmsgRef)
+                submit(ev.invokePlug)
+            while len(YAPI._DataEvents) > 0:
+                YAPI.yapiLockFunctionCallBack(errmsgRef)
+                if not len(YAPI._DataEvents):
+                    YAPI.yapiUnlockFunctionCallBack(errmsgRef)
+                    break
+                ev = YAPI._DataEvents.popleft()
+                YAPI.yapiUnlockFunctionCallBack(errmsgRef)
+                submit(ev.invokeData)
+            if stopEvent.is_set():
+                break
+            #noinspection PyUnresolvedReferences
+            YAPI._yapiSleep(msInterval, errBuffer)
+
+    @staticmethod
+    def _invokeNow(fn):
+        # keep the event thread alive when a callback fails
+        try:
+            fn()
+        except Exception:
+            #( exception handling working in both  in 2.x and 3.x
+            sys.stderr.write("Exception in Yoctopuce callback: %s\n" % str(sys.exc_info()[1]))
+
+    @staticmethod
+    def _runEventCallback(fn):
+        context = YAPI._EventCallbackContext
+        context.active = True
+        try:
+            fn()
+        finally:
+            context.active = False
+
+    @staticmethod
+    def _reportEventCallbackFailure(future):
+        # the executor keeps exceptions in the future, report them like _invokeNow
+        if future.cancelled() or future.exception() is None:
+            return
+        sys.stderr.write("Exception in Yoctopuce callback: %s\n" % str(future.exception()))
+
     @staticmethod
     def TriggerHubDiscovery(errmsg=None):
         """
@@ -2062,66 +2948,64 @@ class YAPI:
 
     @staticmethod
     def yapiGetFunctionInfo(fundesc, devdescRef, serialRef, funcIdRef, funcNameRef, funcValRef, errmsgRef=None):
-        serialBuffer = ctypes.create_string_buffer(YAPI.YOCTO_SERIAL_LEN)
-        funcIdBuffer = ctypes.create_string_buffer(YAPI.YOCTO_FUNCTION_LEN)
-        funcNameBuffer = ctypes.create_string_buffer(YAPI.YOCTO_LOGICAL_LEN)
-        funcValBuffer = ctypes.create_string_buffer(YAPI.YOCTO_PUBVAL_LEN)
-        errBuffer = ctypes.create_string_buffer(YAPI.YOCTO_ERRMSG_LEN)
+        scratch = YAPI._acquireScratch()
+        scratch.serial[0] = scratch.funcId[0] = scratch.logicalName[0] = scratch.pubVal[0] = b"\0"
         p = ctypes.c_int()
         #noinspection PyUnresolvedReferences
-        res = YAPI._yapiGetFunctionInfoEx(fundesc, ctypes.byref(p), serialBuffer, funcIdBuffer, None,
-                                        funcNameBuffer, funcValBuffer, errBuffer)
+        res = YAPI._yapiGetFunctionInfoEx(fundesc, ctypes.byref(p), scratch.serial, scratch.funcId, None,
+                                        scratch.logicalName, scratch.pubVal, scratch.errmsg)
         devdescRef.value = p.value
-        serialRef.value = YByte2String(serialBuffer.value)
-        funcIdRef.value = YByte2String(funcIdBuffer.value)
-        funcNameRef.value = YByte2String(funcNameBuffer.value)
-        funcValRef.value = YByte2String(funcValBuffer.value)
+        serialRef.value = YByte2String(scratch.serial.value)
+        funcIdRef.value = YByte2String(scratch.funcId.value)
+        funcNameRef.value = YByte2String(scratch.logicalName.value)
+        funcValRef.value = YByte2String(scratch.pubVal.value)
         if errmsgRef is not None:
-            errmsgRef.value = YByte2String(errBuffer.value)
+            errmsgRef.value = YByte2String(scratch.errmsg.value)
+        YAPI._releaseScratch(scratch)
         return res
 
     @staticmethod
     def yapiGetFunctionInfoEx(fundesc, devdescRef, serialRef, funcIdRef, baseTypeRef, funcNameRef, funcValRef, errmsgRef=None):
-        serialBuffer = ctypes.create_string_buffer(YAPI.YOCTO_SERIAL_LEN)
-        funcIdBuffer = ctypes.create_string_buffer(YAPI.YOCTO_FUNCTION_LEN)
-        baseTypeBuffer = ctypes.create_string_buffer(YAPI.YOCTO_FUNCTION_LEN)
-        funcNameBuffer = ctypes.create_string_buffer(YAPI.YOCTO_LOGICAL_LEN)
-        funcValBuffer = ctypes.create_string_buffer(YAPI.YOCTO_PUBVAL_LEN)
-        errBuffer = ctypes.create_string_buffer(YAPI.YOCTO_ERRMSG_LEN)
+        scratch = YAPI._acquireScratch()
+        scratch.serial[0] = scratch.funcId[0] = scratch.baseType[0] = b"\0"
+        scratch.logicalName[0] = scratch.pubVal[0] = b"\0"
         p = ctypes.c_int()
         #noinspection PyUnresolvedReferences
-        res = YAPI._yapiGetFunctionInfoEx(fundesc, ctypes.byref(p), serialBuffer, funcIdBuffer, baseTypeBuffer,
-                                        funcNameBuffer, funcValBuffer, errBuffer)
+        res = YAPI._yapiGetFunctionInfoEx(fundesc, ctypes.byref(p), scratch.serial, scratch.funcId, scratch.baseType,
+                                        scratch.logicalName, scratch.pubVal, scratch.errmsg)
         devdescRef.value = p.value
-        serialRef.value = YByte2String(serialBuffer.value)
-        funcIdRef.value = YByte2String(funcIdBuffer.value)
-        baseTypeRef.value = YByte2String(baseTypeBuffer.value)
-        funcNameRef.value = YByte2String(funcNameBuffer.value)
-        funcValRef.value = YByte2String(funcValBuffer.value)
+        serialRef.value = YByte2String(scratch.serial.value)
+        funcIdRef.value = YByte2String(scratch.funcId.value)
+        baseTypeRef.value = YByte2String(scratch.baseType.value)
+        funcNameRef.value = YByte2String(scratch.logicalName.value)
+        funcValRef.value = YByte2String(scratch.pubVal.value)
         if errmsgRef is not None:
-            errmsgRef.value = YByte2String(errBuffer.value)
+            errmsgRef.value = YByte2String(scratch.errmsg.value)
+        YAPI._releaseScratch(scratch)
         return res
 
     @staticmethod
     def yapiGetDeviceByFunction(fundesc, errmsgRef=None):
-        errBuffer = ctypes.create_string_buffer(YAPI.YOCTO_ERRMSG_LEN)
+        scratch = YAPI._acquireScratch()
         devdesc = ctypes.c_int()
         #noinspection PyUnresolvedReferences
-        res = YAPI._yapiGetFunctionInfoEx(fundesc, ctypes.byref(devdesc), None, None, None, None, None, errBuffer)
+        res = YAPI._yapiGetFunctionInfoEx(fundesc, ctypes.byref(devdesc), None, None, None, None, None, scratch.errmsg)
         if errmsgRef is not None:
-            errmsgRef.value = YByte2String(errBuffer.value)
+            errmsgRef.value = YByte2String(scratch.errmsg.value)
+        YAPI._releaseScratch(scratch)
         if res < 0:
             return res
         return devdesc.value
 
     @staticmethod
     def yapiUpdateDeviceList(force, errmsgRef=None):
-        errmsg_buffer = ctypes.create_string_buffer(YAPI.YOCTO_ERRMSG_LEN)
+        scratch = YAPI._acquireScratch()
         #noinspection PyUnresolvedReferences
-        res = YAPI._yapiUpdateDeviceList(force, errmsg_buffer)
+        res = YAPI._yapiUpdateDeviceList(force, scratch.errmsg)
         if YAPI.YISERR(res):
             if errmsgRef is not None:
-                errmsgRef.value = YByte2String(errmsg_buffer.value)
+                errmsgRef.value = YByte2String(scratch.errmsg.value)
+        YAPI._releaseScratch(scratch)
         return res
 
     @staticmethod
@@ -2136,25 +3020,27 @@ class YAPI:
 
     @staticmethod
     def yapiGetFunction(class_str, function_str, errmsgRef=None):
-        errmsg_buffer = ctypes.create_string_buffer(YAPI.YOCTO_ERRMSG_LEN)
+        scratch = YAPI._acquireScratch()
         #noinspection PyUnresolvedReferences
         res = YAPI._yapiGetFunction(ctypes.create_string_buffer(class_str.encode("ASCII")),
-                                    ctypes.create_string_buffer(function_str.encode("ASCII")), errmsg_buffer)
+                                    ctypes.create_string_buffer(function_str.encode("ASCII")), scratch.errmsg)
         if errmsgRef is not None:
-            errmsgRef.value = YByte2String(errmsg_buffer.value)
+            errmsgRef.value = YByte2String(scratch.errmsg.value)
+        YAPI._releaseScratch(scratch)
         return res
 
     @staticmethod
     def apiGetFunctionsByClass(class_str, precFuncDesc, dbuffer, maxsize, neededsizeRef, errmsgRef=None):
-        errmsg_buffer = ctypes.create_string_buffer(YAPI.YOCTO_ERRMSG_LEN)
+        scratch = YAPI._acquireScratch()
         cneededsize = ctypes.c_int()
         #noinspection PyUnresolvedReferences
         res = YAPI._yapiGetFunctionsByClass(ctypes.create_string_buffer(class_str.encode("ASCII")), precFuncDesc,
-                                            dbuffer, maxsize, ctypes.byref(cneededsize), errmsg_buffer)
+                                            dbuffer, maxsize, ctypes.byref(cneededsize), scratch.errmsg)
         #noinspection PyUnresolvedReferences
         neededsizeRef.value = cneededsize.value
         if errmsgRef is not None:
-            errmsgRef.value = YByte2String(errmsg_buffer.value)
+            errmsgRef.value = YByte2String(scratch.errmsg.value)
+        YAPI._releaseScratch(scratch)
         return res
 
     @staticmethod
@@ -2177,8 +3063,10 @@ class YAPI:
     @staticmethod
     def pymodule_cleanup():
         del YAPI.YDevice_devCache[:]
-        del YAPI._PlugEvents[:]
-        del YAPI._DataEvents[:]
+        YAPI._YDevice_devByDescr.clear()
+        YAPI._PlugEvents.clear()
+        YAPI._DataEvents.clear()
+        YAPI._PushCacheFunctions.clear()
         YFunction._CalibHandlers.clear()
 
 
@@ -2439,10 +3327,41 @@ class YDataStream(object):
         self._values = []
         #--- (end of generated code: YDataStream attributes)
         self._calhdl = None
+        self._calcomp = None
+        # values are stored by column, _values only gives a view by row
+        self._columns = []
+        self._values = YDataStream._RowView(self._columns)
+        self._fetchTime = -1
         self._parent = parent
         if dataset is not None:
             self._initFromDataSet(dataset, encoded)
 
+    class _RowView(object):
+        """
+        Read-only sequence of the rows of a data stream, built over its columns.
+        Each row is returned as a new list of floating-point numbers.
+        """
+
+        def __init__(self, columns):
+            self._columns = columns
+
+        def __len__(self):
+            if len(self._columns) == 0:
+                return 0
+            return len(self._columns[0])
+
+        def __getitem__(self, index):
+            if isinstance(index, slice):
+                return [self[i] for i in range(*index.indices(len(self)))]
+            return [col[index] for col in self._columns]
+
+        def __iter__(self):
+            for row in zip(*self._columns):
+                yield list(row)
+
+        def __repr__(self):
+            return repr(list(self))
+
     #--- (generated code: YDataStream implementation)
     def _initFromDataSet(self, dataset, encoded):
         # val
@@ -2527,6 +3446,7 @@ class YDataStream(object):
                         self._calraw.append(YAPI._decimalToDouble(iRaw))
                         self._calref.append(YAPI._decimalToDouble(iRef))
                     i = i + 2
+        self._calcomp = YAPI._Calibration(self._calhdl, self._caltyp, self._calpar, self._calraw, self._calref)
         # // preload column names for backward-compatibility
         self._functionId = dataset.get_functionId()
         if self._isAvg:
@@ -2552,47 +3472,59 @@ class YDataStream(object):
         return 0
 
     def _parseStream(self, sdata):
-        # idx
         udat = []
-        dat = []
         if len(sdata) == 0:
             self._nRows = 0
             return YAPI.SUCCESS
         # // may throw an exception
         udat = YAPI._decodeWords(self._parent._json_get_string(sdata))
-        del self._values[:]
-        idx = 0
+        nudat = len(udat)
         if self._isAvg:
-            while idx + 3 < len(udat):
-                del dat[:]
-                if self._isScal32:
-                    dat.append(self._decodeVal(udat[idx + 2] + (((udat[idx + 3]) << (16)))))
-                    dat.append(self._decodeAvg(udat[idx] + (((((udat[idx + 1]) ^ (0x8000))) << (16))), 1))
-                    dat.append(self._decodeVal(udat[idx + 4] + (((udat[idx + 5]) << (16)))))
-                    idx = idx + 6
-                else:
-                    dat.append(self._decodeVal(udat[idx]))
-                    dat.append(self._decodeAvg(udat[idx + 2] + (((udat[idx + 3]) << (16))), 1))
-                    dat.append(self._decodeVal(udat[idx + 1]))
-                    idx = idx + 4
-                self._values.append(dat[:])
+            if self._isScal32:
+                minCol = self._decodeRawVals([udat[i + 2] + (udat[i + 3] << 16) for i in range(0, nudat - 3, 6)])
+                avgCol = self._decodeRawAvgs([udat[i] + ((udat[i + 1] ^ 0x8000) << 16) for i in range(0, nudat - 3, 6)])
+                maxCol = self._decodeRawVals([udat[i + 4] + (udat[i + 5] << 16) for i in range(0, nudat - 3, 6)])
+            else:
+                minCol = self._decodeRawVals([udat[i] for i in range(0, nudat - 3, 4)])
+                avgCol = self._decodeRawAvgs([udat[i + 2] + (udat[i + 3] << 16) for i in range(0, nudat - 3, 4)])
+                maxCol = self._decodeRawVals([udat[i + 1] for i in range(0, nudat - 3, 4)])
+            if self._caltyp != 0:
+                minCol = self._calcomp.applyMany(minCol)
+                avgCol = self._calcomp.applyMany(avgCol)
+                maxCol = self._calcomp.applyMany(maxCol)
+            self._columns[:] = [array.array('d', minCol), array.array('d', avgCol), array.array('d', maxCol)]
         else:
             if self._isScal and not (self._isScal32):
-                while idx < len(udat):
-                    del dat[:]
-                    dat.append(self._decodeVal(udat[idx]))
-                    self._values.append(dat[:])
-                    idx = idx + 1
+                valCol = self._decodeRawVals(udat)
             else:
-                while idx + 1 < len(udat):
-                    del dat[:]
-                    dat.append(self._decodeAvg(udat[idx] + (((((udat[idx + 1]) ^ (0x8000))) << (16))), 1))
-                    self._values.append(dat[:])
-                    idx = idx + 2
-        
+                valCol = self._decodeRawAvgs([udat[i] + ((udat[i + 1] ^ 0x8000) << 16) for i in range(0, nudat - 1, 2)])
+            if self._caltyp != 0:
+                valCol = self._calcomp.applyMany(valCol)
+            self._columns[:] = [array.array('d', valCol)]
         self._nRows = len(self._values)
         return YAPI.SUCCESS
 
+    def _decodeRawVals(self, words):
+        # same as _decodeVal for a whole column, without calibration
+        if self._isScal32:
+            return [w / 1000.0 for w in words]
+        if self._isScal:
+            offset = self._offset
+            scale = self._scale
+            return [(w - offset) / scale for w in words]
+        return YAPI._decimalsToDoubles(words)
+
+    def _decodeRawAvgs(self, dwords):
+        # same as _decodeAvg(dw, 1) for a whole column, without calibration
+        if self._isScal32:
+            return [dw / 1000.0 for dw in dwords]
+        if self._isScal:
+            offset = self._offset
+            scale = self._scale
+            return [(dw / 100 - offset) / scale for dw in dwords]
+        decexp = self._decexp
+        return [dw / decexp for dw in dwords]
+
     def _get_url(self):
         # url
         url = "logger.json?id=" + self._functionId + "&run=" + str(int(self._runNo)) + "&utc=" + str(int(self._utcStamp))
@@ -2600,7 +3532,34 @@ class YDataStream(object):
 
     def loadStream(self):
         # // may throw an exception
-        return self._parseStream(self._parent._download(self._get_url()))
+        return self._parseStream(self._fetch())
+
+    def _fetch(self):
+        # download the stream content, recording the time it took
+        startTime = YMonotonicTickCount()
+        data = self._parent._download(self._get_url())
+        self._fetchTime = YMonotonicTickCount() - startTime
+        return data
+
+    def _fetchFrom(self, device):
+        # download the stream content from an already resolved device, without using the
+        # parent function, so that it can run in a background thread; returns the data,
+        # or None on failure so that the caller can retry with _fetch() and report errors
+        startTime = YMonotonicTickCount()
+        request = "GET /" + self._get_url() + " HTTP/1.1\r\n\r\n"
+        httpbuffer = YRefParam()
+        errmsgRef = YRefParam()
+        res = device.HTTPRequest(request, httpbuffer, errmsgRef)
+        self._fetchTime = YMonotonicTickCount() - startTime
+        if YAPI.YISERR(res):
+            return None
+        reply = httpbuffer.value
+        if not (reply.startswith(b"OK\r\n") or reply.startswith(b"HTTP/1.1 200 OK\r\n")):
+            return None
+        found = reply.find(b"\r\n\r\n")
+        if found < 0:
+            return None
+        return reply[found + 4:]
 
     def _decodeVal(self, w):
         # val
@@ -2613,7 +3572,7 @@ class YDataStream(object):
             else:
                 val = YAPI._decimalToDouble(w)
         if self._caltyp != 0:
-            val = self._calhdl(val, self._caltyp, self._calpar, self._calraw, self._calref)
+            val = self._calcomp.apply(val)
         return val
 
     def _decodeAvg(self, dw, count):
@@ -2627,7 +3586,7 @@ class YDataStream(object):
             else:
                 val = val / (count * self._decexp)
         if self._caltyp != 0:
-            val = self._calhdl(val, self._caltyp, self._calpar, self._calraw, self._calref)
+            val = self._calcomp.apply(val)
         return val
 
     def isClosed(self):
@@ -2782,6 +3741,16 @@ class YDataStream(object):
         """
         return self._maxVal
 
+    def get_fetchTime(self):
+        """
+        Returns the time spent downloading the content of this stream from
+        the device during the last load, in milliseconds.
+
+        @return an integer number of milliseconds, or -1 if the stream content
+                has not been downloaded yet
+        """
+        return self._fetchTime
+
     def get_duration(self):
         """
         Returns the approximate duration of this stream, in seconds.
@@ -2812,7 +3781,26 @@ class YDataStream(object):
         """
         if (len(self._values) == 0) or not (self._isClosed):
             self.loadStream()
-        return self._values
+        return self._values
+
+    def get_dataColumns(self):
+        """
+        Returns the whole data set contained in the stream, as a list of columns.
+        The meaning of the values present in each column can be obtained
+        using the method get_columnNames().
+
+        This method fetches the whole data stream from the device,
+        if not yet done.
+
+        @return a list containing as many elements as there are columns in the
+                data stream. Each column is an array('d') of floating-point
+                numbers, which numpy.frombuffer() can use without copy.
+
+        On failure, throws an exception or returns an empty array.
+        """
+        if (len(self._values) == 0) or not (self._isClosed):
+            self.loadStream()
+        return self._columns
 
     def get_data(self, row, col):
         """
@@ -2835,9 +3823,9 @@ class YDataStream(object):
             self.loadStream()
         if row >= len(self._values):
             return YDataStream.DATA_INVALID
-        if col >= len(self._values[row]):
+        if col >= len(self._columns):
             return YDataStream.DATA_INVALID
-        return self._values[row][col]
+        return self._columns[col][row]
 
 #--- (end of generated code: YDataStream implementation)
 #--- (generated code: DataStream functions)
@@ -2857,6 +3845,10 @@ class YMeasure(object):
     #--- (generated code: YMeasure definitions)
     #--- (end of generated code: YMeasure definitions)
 
+    # measures are created by the million when loading datasets, so they have
+    # no instance dictionary, and their datetimes are only computed when used
+    __slots__ = ("_start", "_end", "_minVal", "_avgVal", "_maxVal", "_start_datetime", "_end_datetime")
+
     def __init__(self, start, end, minVal, avgVal, maxVal):
         #--- (generated code: YMeasure attributes)
         self._start = 0
@@ -2870,19 +3862,53 @@ class YMeasure(object):
         self._minVal = minVal
         self._avgVal = avgVal
         self._maxVal = maxVal
-        rounded = int(start * 10 + 0.5)
-        self._start_datetime = datetime.datetime.fromtimestamp(rounded / 10.0)
-        rounded = int(end * 10 + 0.5)
-        self._end_datetime = datetime.datetime.fromtimestamp(rounded / 10.0)
+        self._start_datetime = None
+        self._end_datetime = None
+
+    @staticmethod
+    def _toDatetime(utc):
+        rounded = int(utc * 10 + 0.5)
+        return datetime.datetime.fromtimestamp(rounded / 10.0)
+
+    def __getstate__(self):
+        # same state as when measures had an instance dictionary, so that
+        # pickles can be exchanged with older versions of the library
+        state = {"_start": self._start, "_end": self._end, "_minVal": self._minVal,
+                 "_avgVal": self._avgVal, "_maxVal": self._maxVal,
+                 "_start_datetime": self.get_startTimeUTC_asDatetime(),
+                 "_end_datetime": self.get_endTimeUTC_asDatetime()}
+        # attributes added by subclasses, in their own slots or in a dictionary
+        for cls in type(self).__mro__:
+            slots = cls.__dict__.get("__slots__", ())
+            if isinstance(slots, str):
+                slots = (slots,)
+            for name in slots:
+                if name.startswith("__") and not name.endswith("__"):
+                    name = "_" + cls.__name__.lstrip("_") + name
+                if name in ("__dict__", "__weakref__") or name in state or not hasattr(self, name):
+                    continue
+                state[name] = getattr(self, name)
+        state.update(getattr(self, "__dict__", {}))
+        return state
+
+    def __setstate__(self, state):
+        self._start_datetime = None
+        self._end_datetime = None
+        for (key, value) in state.items():
+            setattr(self, key, value)
 
     def get_startTimeUTC_asDatetime(self):
         """
         """
+        if self._start_datetime is None:
+            self._start_datetime = YMeasure._toDatetime(self._start)
         return self._start_datetime
 
     def get_endTimeUTC_asDatetime(self):
         """
         """
+        if self._end_datetime is None:
+            self._end_datetime = YMeasure._toDatetime(self._end)
         return self._end_datetime
 
     #--- (generated code: YMeasure implementation)
@@ -2981,12 +4007,28 @@ class YDataSet(object):
         self._preview = []
         self._measures = []
         #--- (end of generated code: YDataSet attributes)
+        # measures by column (start, end, min, avg, max), YMeasure objects
+        # are only created by get_measures()
+        self._measureColumns = YDataSet._newMeasureColumns()
+        # streams downloaded ahead of loadMore(), see set_prefetchCount()
+        self._prefetchCount = 0
+        self._prefetchPool = None
+        self._prefetched = {}
         self._summary = YMeasure(0, 0, 0, 0, 0)
         if unit is None:
             self._initFromJson(parent)
         else:
             self._initFromParams(parent, functionId, unit, starttime, endTime)
 
+    def __del__(self):
+        # release the prefetch threads of a dataset that was not loaded until the end
+        if getattr(self, "_prefetchPool", None) is not None:
+            self._stopPrefetch()
+
+    @staticmethod
+    def _newMeasureColumns():
+        return [array.array('d'), array.array('d'), array.array('d'), array.array('d'), array.array('d')]
+
     def _initFromParams(self, parent, functionId, unit, startTime, endTime):
         self._parent = parent
         self._functionId = functionId
@@ -3026,14 +4068,17 @@ class YDataSet(object):
                 self._unit = member.svalue
             elif member.name == "calib":
                 self._calib = YAPI._decodeFloats(member.svalue)
-                self._calib[0] = round(self._calib[0] / 1000)
+                self._calib[0] = int(round(self._calib[0] / 1000))
             elif member.name == "cal":
                 if len(self._calib) == 0:
                     self._calib = YAPI._decodeWords(member.svalue)
             elif member.name == "streams":
+                # downloads started for the previous streams are no longer needed
+                self._stopPrefetch()
                 self._streams = []
                 self._preview = []
                 self._measures = []
+                self._measureColumns = YDataSet._newMeasureColumns()
                 streams_node = j.GetChildNode(node, "streams")
                 for streams_json in streams_node.items:
                     stream = self._parent._findDataStream(self, streams_json.svalue)
@@ -3083,14 +4128,7 @@ class YDataSet(object):
 
     def processMore(self, progress, data):
         # stream
-        dataRows = []
         # strdata
-        # tim
-        # itv
-        # nCols
-        # minCol
-        # avgCol
-        # maxCol
         # // may throw an exception
         if progress != self._progress:
             return self._progress
@@ -3102,31 +4140,42 @@ class YDataSet(object):
             return self._parse(strdata)
         stream = self._streams[self._progress]
         stream._parseStream(data)
-        dataRows = stream.get_dataRows()
+        streamColumns = self._streamMeasureColumns(stream)
         self._progress = self._progress + 1
-        if len(dataRows) == 0:
-            return self.get_progress()
+        for (col, values) in zip(self._measureColumns, streamColumns):
+            col.extend(values)
+        return self.get_progress()
+
+    def _streamMeasureColumns(self, stream):
+        # measures of a loaded stream within the dataset time range, by column
+        res = YDataSet._newMeasureColumns()
+        columns = stream.get_dataColumns()
+        if (len(columns) == 0) or (len(columns[0]) == 0):
+            return res
         tim = stream.get_startTimeUTC()
         itv = stream.get_dataSamplesInterval()
         if tim < itv:
             tim = itv
-        nCols = len(dataRows[0])
-        minCol = 0
+        nCols = len(columns)
+        minCol = columns[0]
         if nCols > 2:
-            avgCol = 1
+            avgCol = columns[1]
         else:
-            avgCol = 0
+            avgCol = columns[0]
         if nCols > 2:
-            maxCol = 2
+            maxCol = columns[2]
         else:
-            maxCol = 0
-        
-        for y in dataRows:
+            maxCol = columns[0]
+        startCol, endCol, minValCol, avgValCol, maxValCol = res
+        for minVal, avgVal, maxVal in zip(minCol, avgCol, maxCol):
             if (tim >= self._startTime) and ((self._endTime == 0) or (tim <= self._endTime)):
-                self._measures.append(YMeasure(tim - itv, tim, y[minCol], y[avgCol], y[maxCol]))
+                startCol.append(tim - itv)
+                endCol.append(tim)
+                minValCol.append(minVal)
+                avgValCol.append(avgVal)
+                maxValCol.append(maxVal)
             tim = tim + itv
-        
-        return self.get_progress()
+        return res
 
     def get_privateDataStreams(self):
         return self._streams
@@ -3225,16 +4274,73 @@ class YDataSet(object):
         On failure, throws an exception or returns a negative error code.
         """
         # url
-        # stream
         if self._progress < 0:
             url = "logger.json?id=" + self._functionId
-        else:
-            if self._progress >= len(self._streams):
-                return 100
-            else:
-                stream = self._streams[self._progress]
-                url = stream._get_url()
-        return self.processMore(self._progress, self._parent._download(url))
+            return self.processMore(self._progress, self._parent._download(url))
+        if self._progress >= len(self._streams):
+            self._stopPrefetch()
+            return 100
+        return self.processMore(self._progress, self._fetchStream(self._progress))
+
+    def _fetchStream(self, index):
+        # download a stream, and start downloading the next ones if prefetch is enabled
+        if self._prefetchCount <= 1 or concurrent is None:
+            return self._streams[index]._fetch()
+        # the device is resolved here, the worker threads only send requests to it
+        devRef = YRefParam()
+        if YAPI.YISERR(self._parent._getDevice(devRef)):
+            return self._streams[index]._fetch()
+        if self._prefetchPool is None:
+            self._prefetchPool = concurrent.futures.ThreadPoolExecutor(max_workers=self._prefetchCount)
+        for stream in self._streams[index:index + self._prefetchCount]:
+            if stream not in self._prefetched:
+                self._prefetched[stream] = self._prefetchPool.submit(stream._fetchFrom, devRef.value)
+        future = self._prefetched.pop(self._streams[index])
+        if index + 1 >= len(self._streams):
+            self._stopPrefetch()
+        data = future.result()
+        if data is None:
+            return self._streams[index]._fetch()
+        return data
+
+    def _stopPrefetch(self):
+        for future in self._prefetched.values():
+            future.cancel()
+        self._prefetched.clear()
+        if self._prefetchPool is not None:
+            self._prefetchPool.shutdown(False)
+            self._prefetchPool = None
+
+    def get_prefetchCount(self):
+        """
+        Returns the number of data streams downloaded concurrently by loadMore().
+
+        @return an integer, 0 when streams are downloaded one at a time
+        """
+        return self._prefetchCount
+
+    def set_prefetchCount(self, count):
+        """
+        Changes the number of data streams downloaded concurrently by loadMore().
+        When it is greater than 1, each call to loadMore() also starts downloading
+        the next streams in background threads, so that the round-trip time to a
+        remote hub is paid once for several streams. Measures are still appended
+        in order, one stream per call to loadMore(), and get_progress() is
+        unchanged. The time spent downloading each stream is available with
+        YDataStream.get_fetchTime().
+
+        The prefetch threads are released once the last stream has been loaded,
+        or when the dataset is garbage-collected. To release them earlier, for
+        instance when loading is abandoned, call set_prefetchCount(0).
+
+        @param count : the maximal number of streams downloaded at the same time,
+                0 or 1 to download the streams one at a time
+        @return YAPI.SUCCESS when the call succeeds.
+        """
+        if count != self._prefetchCount:
+            self._stopPrefetch()
+        self._prefetchCount = count
+        return YAPI.SUCCESS
 
     def get_summary(self):
         """
@@ -3290,7 +4396,7 @@ class YDataSet(object):
         """
         # startUtc
         # stream
-        dataRows = []
+        columns = []
         measures = []
         # tim
         # itv
@@ -3306,27 +4412,27 @@ class YDataSet(object):
                 stream = y
         if stream is None:
             return measures
-        dataRows = stream.get_dataRows()
-        if len(dataRows) == 0:
+        columns = stream.get_dataColumns()
+        if (len(columns) == 0) or (len(columns[0]) == 0):
             return measures
         tim = stream.get_startTimeUTC()
         itv = stream.get_dataSamplesInterval()
         if tim < itv:
             tim = itv
-        nCols = len(dataRows[0])
-        minCol = 0
+        nCols = len(columns)
+        minCol = columns[0]
         if nCols > 2:
-            avgCol = 1
+            avgCol = columns[1]
         else:
-            avgCol = 0
+            avgCol = columns[0]
         if nCols > 2:
-            maxCol = 2
+            maxCol = columns[2]
         else:
-            maxCol = 0
+            maxCol = columns[0]
         
-        for y in dataRows:
+        for minVal, avgVal, maxVal in zip(minCol, avgCol, maxCol):
             if (tim >= self._startTime) and ((self._endTime == 0) or (tim <= self._endTime)):
-                measures.append(YMeasure(tim - itv, tim, y[minCol], y[avgCol], y[maxCol]))
+                measures.append(YMeasure(tim - itv, tim, minVal, avgVal, maxVal))
             tim = tim + itv
         
         return measures
@@ -3357,8 +4463,109 @@ class YDataSet(object):
 
         On failure, throws an exception or returns an empty array.
         """
+        # create the YMeasure objects for the rows loaded since the last call
+        startCol, endCol, minValCol, avgValCol, maxValCol = self._measureColumns
+        for i in range(len(self._measures), len(startCol)):
+            self._measures.append(YMeasure(startCol[i], endCol[i], minValCol[i], avgValCol[i], maxValCol[i]))
         return self._measures
 
+    def iter_measures(self, batch_size=None):
+        """
+        Loads the measures of this DataSet stream by stream, and returns them
+        through a generator, without keeping them in memory: the values of each
+        stream are dropped once they have been yielded, and are not added to
+        get_measures() or to_columns(). This makes it possible to go through
+        a time range of any size with a constant memory use. The progress
+        indicator is updated as the streams are loaded.
+
+        Streams are downloaded in the same way as by loadMore(), including the
+        prefetch configured with set_prefetchCount().
+
+        @param batch_size : None to get YMeasure objects one by one, or the
+                maximal number of measures in each batch to get dictionaries of
+                columns, in the same format as to_columns(). Batches never span
+                two streams, so they can be smaller.
+
+        @return a generator of YMeasure objects or of dictionaries of columns
+
+        On failure, throws an exception or stops the iteration.
+        """
+        if batch_size is not None and (isinstance(batch_size, bool) or not isinstance(batch_size, int)
+                                       or batch_size <= 0):
+            self._parent._throw(YAPI.INVALID_ARGUMENT, "batch_size must be a positive integer")
+            return iter([])
+        return self._iterMeasures(batch_size)
+
+    def _iterMeasures(self, batch_size):
+        if self._progress < 0:
+            if YAPI.YISERR(self.loadMore()):
+                return
+        try:
+            while self._progress < len(self._streams):
+                stream = self._streams[self._progress]
+                stream._parseStream(self._fetchStream(self._progress))
+                startCol, endCol, minValCol, avgValCol, maxValCol = self._streamMeasureColumns(stream)
+                # the stream is reloaded from the device if its rows are asked again
+                del stream._columns[:]
+                self._progress = self._progress + 1
+                if batch_size is None:
+                    for i in range(len(startCol)):
+                        yield YMeasure(startCol[i], endCol[i], minValCol[i], avgValCol[i], maxValCol[i])
+                else:
+                    for pos in range(0, len(startCol), batch_size):
+                        yield {"start": startCol[pos:pos + batch_size],
+                               "end": endCol[pos:pos + batch_size],
+                               "min": minValCol[pos:pos + batch_size],
+                               "avg": avgValCol[pos:pos + batch_size],
+                               "max": maxValCol[pos:pos + batch_size]}
+        finally:
+            self._stopPrefetch()
+
+    def to_columns(self):
+        """
+        Returns all measured values currently available for this DataSet,
+        by column rather than as YMeasure objects, which is much more compact
+        for large datasets. The columns are:
+        - "start": the start of the measure time interval
+        - "end": the end of the measure time interval
+        - "min": the minimal value observed during the time interval
+        - "avg": the average value observed during the time interval
+        - "max": the maximal value observed during the time interval
+
+        As for get_measures(), you should call loadMore() first to load
+        data from the device.
+
+        @return a dictionary of five array('d') objects of the same length,
+                which are copies: later calls to loadMore() do not change them.
+        """
+        startCol, endCol, minValCol, avgValCol, maxValCol = self._measureColumns
+        return {"start": array.array('d', startCol),
+                "end": array.array('d', endCol),
+                "min": array.array('d', minValCol),
+                "avg": array.array('d', avgValCol),
+                "max": array.array('d', maxValCol)}
+
+    def to_numpy(self):
+        """
+        Returns all measured values currently available for this DataSet,
+        by column, as NumPy arrays. The columns are the same as for to_columns().
+        This method requires the numpy module.
+
+        @return a dictionary of five numpy.ndarray objects of type float64
+
+        On failure, throws an exception or returns an empty dictionary.
+        """
+        # imported here, so that importing the library does not pay for numpy
+        try:
+            import numpy
+        except ImportError:
+            self._parent._throw(YAPI.NOT_SUPPORTED, "numpy module is not available")
+            return {}
+        res = {}
+        for (name, col) in self.to_columns().items():
+            res[name] = numpy.frombuffer(col, dtype=numpy.float64)
+        return res
+
 #--- (end of generated code: YDataSet implementation)
 
     #--- (generated code: DataSet functions)
@@ -3373,13 +4580,29 @@ class YDataSet(object):
 
 #noinspection PyProtectedMember
 class YDevice:
+
+    # api.json request in progress, shared by the threads waiting for the same reply
+    class _PendingRequest:
+        def __init__(self):
+            self.done = threading.Event()
+            self.res = YAPI.SUCCESS
+            self.json = None
+            self.errmsg = ""
+
     def __init__(self, devdesc):
         self._devdescr = devdesc
-        self._cacheStamp = datetime.datetime(year=1970, month=1, day=1)
+        self._cacheStamp = 0
+        self._cacheTime = 0
         self._cacheJson = None
+        self._funcCacheTime = {}
+        self._funcLoadStamp = {}
+        self._pendingLock = threading.Lock()
+        self._pendingRequest = None
+        self._savedRequests = 0
         self._functions = []
         self._rootdevice = ""
         self._subpath = ""
+        self._rootdevice_c = None
         self._subpathinit = False
 
     def __del__(self):
@@ -3389,26 +4612,26 @@ class YDevice:
 
     @staticmethod
     def getDevice(devdescr):
-        for idx in range(len(YAPI.YDevice_devCache)):
-            if YAPI.YDevice_devCache[idx]._devdescr == devdescr:
-                return YAPI.YDevice_devCache[idx]
+        if devdescr in YAPI._YDevice_devByDescr:
+            return YAPI._YDevice_devByDescr[devdescr]
 
         dev = YDevice(devdescr)
         YAPI.YDevice_devCache.append(dev)
+        YAPI._YDevice_devByDescr[devdescr] = dev
         return dev
 
     @staticmethod
     def PlugDevice(devdescr):
-        for idx in range(len(YAPI.YDevice_devCache)):
-            if YAPI.YDevice_devCache[idx]._devdescr == devdescr:
-                YAPI.YDevice_devCache[idx]._cacheStamp = datetime.datetime(year=1970, month=1, day=1)
-                YAPI.YDevice_devCache[idx]._subpathinit = False
+        if devdescr in YAPI._YDevice_devByDescr:
+            dev = YAPI._YDevice_devByDescr[devdescr]
+            dev._cacheStamp = 0
+            dev._funcCacheTime.clear()
+            dev._subpathinit = False
 
     def _HTTPRequestPrepare(self, request):
-        errbuf = ctypes.create_string_buffer(YAPI.YOCTO_ERRMSG_LEN)
-        root = ctypes.create_string_buffer(YAPI.YOCTO_SERIAL_LEN)
-
         if not self._subpathinit:
+            errbuf = ctypes.create_string_buffer(YAPI.YOCTO_ERRMSG_LEN)
+            root = ctypes.create_string_buffer(YAPI.YOCTO_SERIAL_LEN)
             neededsize = ctypes.c_int()
             #noinspection PyUnresolvedReferences
             res = YAPI._yapiGetDevicePath(self._devdescr, root, None, 0, ctypes.byref(neededsize), errbuf)
@@ -3422,6 +4645,7 @@ class YDevice:
             if YAPI.YISERR(res):
                 return res, YByte2String(errbuf.value)
             self._rootdevice = YByte2String(root.value)
+            self._rootdevice_c = ctypes.create_string_buffer(self._rootdevice.encode("ASCII"))
             self._subpath = YByte2String(b.value)
             self._subpathinit = True
 
@@ -3439,20 +4663,23 @@ class YDevice:
 
     #noinspection PyUnresolvedReferences,PyUnusedLocal
     def HTTPRequestAsync(self, request, callback, context, errmsgRef=None):
-        errbuf = ctypes.create_string_buffer(YAPI.YOCTO_ERRMSG_LEN)
         #invalidate cache
-        self._cacheStamp = YAPI.GetTickCount()
+        self._cacheStamp = YMonotonicTickCount()
+        self._funcCacheTime.clear()
         (res, newrequest) = self._HTTPRequestPrepare(request)
         if YAPI.YISERR(res):
             if not errmsgRef is None:
                 errmsgRef.value = newrequest
             return res
-        res = YAPI._yapiHTTPRequestAsync(ctypes.create_string_buffer(self._rootdevice.encode("ASCII")),
-                                         ctypes.create_string_buffer(newrequest), None, None, errbuf)
+        scratch = YAPI._acquireScratch()
+        res = YAPI._yapiHTTPRequestAsync(self._rootdevice_c, ctypes.create_string_buffer(newrequest), None, None,
+                                         scratch.errmsg)
         if YAPI.YISERR(res):
             if not errmsgRef is None:
-                errmsgRef.value = YByte2String(errbuf.value)
+                errmsgRef.value = YByte2String(scratch.errmsg.value)
+            YAPI._releaseScratch(scratch)
             return res
+        YAPI._releaseScratch(scratch)
         return YAPI.SUCCESS
 
     #noinspection PyUnresolvedReferences,PyUnresolvedReferences
@@ -3462,40 +4689,90 @@ class YDevice:
             if not errmsgRef is None:
                 errmsgRef.value = newrequest
             return res
-        iohdl = ctypes.create_string_buffer(YAPI.YIOHDL_SIZE)
-        errbuf = ctypes.create_string_buffer(YAPI.YOCTO_ERRMSG_LEN)
-        root_c = ctypes.create_string_buffer(self._rootdevice.encode("ASCII"))
+        scratch = YAPI._acquireScratch()
         newrequest_c = ctypes.create_string_buffer(newrequest)
         reply_c = POINTER(ctypes.c_ubyte)()
         neededsize_c = ctypes.c_int(0)
-        res = YAPI._yapiHTTPRequestSyncStartEx(iohdl, root_c, newrequest_c, len(newrequest), ctypes.byref(reply_c),
-                                               ctypes.byref(neededsize_c), errbuf)
+        res = YAPI._yapiHTTPRequestSyncStartEx(scratch.iohdl, self._rootdevice_c, newrequest_c, len(newrequest),
+                                               ctypes.byref(reply_c), ctypes.byref(neededsize_c), scratch.errmsg)
         if YAPI.YISERR(res):
             if not errmsgRef is None:
-                errmsgRef.value = YByte2String(errbuf.value)
+                errmsgRef.value = YByte2String(scratch.errmsg.value)
+            YAPI._releaseScratch(scratch)
             return res
-        reply_size = neededsize_c.value
-        bb = YString2Byte("")
-        #(xrange not supported in 2.5.x)
-        for i in range(reply_size):
-            bb = YAddByte(bb, reply_c[i])
-        bufferRef.value = bb
-        res = YAPI._yapiHTTPRequestSyncDone(iohdl, errbuf)
+        # copy the whole reply in a single call, the native buffer is released by SyncDone
+        bufferRef.value = ctypes.string_at(reply_c, neededsize_c.value)
+        res = YAPI._yapiHTTPRequestSyncDone(scratch.iohdl, scratch.errmsg)
         if YAPI.YISERR(res):
             if not errmsgRef is None:
-                errmsgRef.value = YByte2String(errbuf.value)
+                errmsgRef.value = YByte2String(scratch.errmsg.value)
+            YAPI._releaseScratch(scratch)
             return res
+        YAPI._releaseScratch(scratch)
         return YAPI.SUCCESS
 
-    def requestAPI(self, apiresRef, errmsgRef=None):
-
-        suberrmsg = YRefParam()
+    def requestAPI(self, apiresRef, errmsgRef=None, msValidity=None):
 
-        #Check if we have a valid cache value
-        if self._cacheStamp > YAPI.GetTickCount():
+        #Check if we have a valid cache value, not older than the validity requested by the caller
+        now = YMonotonicTickCount()
+        if self._cacheStamp > now and (msValidity is None or self._cacheTime + msValidity > now):
+            YAPI._countCacheAccess("api.json", True)
             apiresRef.value = self._cacheJson
             return YAPI.SUCCESS
 
+        # Only one api.json request at a time per device: concurrent callers share its reply
+        with self._pendingLock:
+            pending = self._pendingRequest
+            owner = pending is None
+            if owner:
+                # a request completed since the check above may have refreshed the cache
+                now = YMonotonicTickCount()
+                if self._cacheStamp > now and (msValidity is None or self._cacheTime + msValidity > now):
+                    apiresRef.value = self._cacheJson
+                    pending = None
+                else:
+                    pending = YDevice._PendingRequest()
+                    self._pendingRequest = pending
+            else:
+                self._savedRequests += 1
+        if pending is None:
+            YAPI._countCacheAccess("api.json", True)
+            return YAPI.SUCCESS
+        if not owner:
+            # the per-device lock does not protect the global counter
+            with YAPI._SavedRequestsLock:
+                YAPI._SavedRequests += 1
+            pending.done.wait()
+            YAPI._countCacheAccess("api.json", True)
+            if YAPI.YISERR(pending.res):
+                if errmsgRef is not None:
+                    errmsgRef.value = pending.errmsg
+                return pending.res
+            apiresRef.value = pending.json
+            return YAPI.SUCCESS
+
+        YAPI._countCacheAccess("api.json", False)
+        suberrmsgRef = YRefParam()
+        # reported to the waiting threads if _loadAPI raises
+        pending.res = YAPI.IO_ERROR
+        pending.errmsg = "api.json request failed"
+        try:
+            pending.res = self._loadAPI(apiresRef, suberrmsgRef)
+            pending.json = apiresRef.value
+            pending.errmsg = suberrmsgRef.value
+        except Exception:
+            pending.errmsg = "api.json request failed: " + str(sys.exc_info()[1])
+            raise
+        finally:
+            with self._pendingLock:
+                self._pendingRequest = None
+            pending.done.set()
+        if YAPI.YISERR(pending.res) and errmsgRef is not None:
+            errmsgRef.value = pending.errmsg
+        return pending.res
+
+    def _loadAPI(self, apiresRef, errmsgRef):
+        suberrmsg = YRefParam()
         res = self.HTTPRequest("GET /api.json \r\n\r\n", suberrmsg, errmsgRef)
         if YAPI.YISERR(res):
             # make sure a device scan does not solve the issue
@@ -3512,24 +4789,94 @@ class YDevice:
         except YAPI.JsonError:
             #( exception handling working in both  in 2.x and 3.x)
             e = sys.exc_info()[1]
-            if not errmsgRef is None:
-                errmsgRef.value = "unexpected JSON structure: " + e.msg
+            errmsgRef.value = "unexpected JSON structure: " + e.msg
             return YAPI.IO_ERROR
 
         if j.httpcode != 200:
-            errmsg = "Unexpected HTTP return code:%s" % j.httpcode
+            errmsgRef.value = "Unexpected HTTP return code:%s" % j.httpcode
             return YAPI.IO_ERROR
 
         # store result in cache
         self._cacheJson = j
+        self._funcCacheTime.clear()
         apiresRef.value = j
-        self._cacheStamp = YAPI.GetTickCount() + YAPI.DefaultCacheValidity
+        self._cacheTime = YMonotonicTickCount()
+        self._cacheStamp = self._cacheTime + YAPI._toMs(YAPI.DefaultCacheValidity)
+
+        return YAPI.SUCCESS
+
+    def get_savedRequests(self):
+        """
+        Returns the number of api.json requests to this device that were avoided
+        because an identical request was already in progress.
+        """
+        return self._savedRequests
+
+    def requestFunctionAPI(self, funcId, msValidity, nodeRef, errmsgRef=None):
+        now = YMonotonicTickCount()
+        suberrmsg = YRefParam()
+        apiresRef = YRefParam()
+
+        # Check if we have a valid cache value, either from api.json or from a previous partial load
+        cacheValidity = min(msValidity, YAPI._toMs(YAPI.DefaultCacheValidity))
+        if self._cacheStamp > now and self._cacheTime + msValidity > now:
+            YAPI._countCacheAccess("api.json", True)
+            nodeRef.value = self._cacheJson.GetChildNode(None, funcId)
+            return YAPI.SUCCESS
+        if funcId in self._funcCacheTime and self._funcCacheTime[funcId] + cacheValidity > now:
+            YAPI._countCacheAccess("api.json", True)
+            nodeRef.value = self._cacheJson.GetChildNode(None, funcId)
+            return YAPI.SUCCESS
 
+        # Count the functions of this device loaded recently
+        windowStart = now - YAPI.PartialLoadWindow
+        touched = 0
+        # snapshot, other threads may add functions meanwhile
+        with self._pendingLock:
+            self._funcLoadStamp[funcId] = now
+            stamps = list(self._funcLoadStamp.values())
+        for stamp in stamps:
+            if stamp > windowStart:
+                touched += 1
+
+        if touched < YAPI.PartialLoadThreshold:
+            res = self.HTTPRequest("GET /api/" + funcId + ".json \r\n\r\n", suberrmsg, errmsgRef)
+            if YAPI.YISERR(res):
+                # make sure a device scan does not solve the issue
+                res = YAPI.yapiUpdateDeviceList(1, errmsgRef)
+                if YAPI.YISERR(res):
+                    return res
+                res = self.HTTPRequest("GET /api/" + funcId + ".json \r\n\r\n", suberrmsg, errmsgRef)
+                if YAPI.YISERR(res):
+                    return res
+            try:
+                j = YAPI.TJsonParser(YByte2String(suberrmsg.value))
+            except YAPI.JsonError:
+                j = None
+            # devices that cannot serve the subtree fall back to the full api.json below
+            if j is not None and j.httpcode == 200 and \
+                    j.data.recordtype == YAPI.TJSONRECORDTYPE.JSON_STRUCT:
+                node = j.data
+                node.name = funcId
+                # merge the subtree into the device cache
+                if self._cacheJson is None:
+                    self._cacheJson = YAPI.TJsonParser("{}", False)
+                self._cacheJson.data.setmember(node)
+                self._funcCacheTime[funcId] = YMonotonicTickCount()
+                YAPI._countCacheAccess("api.json", False)
+                nodeRef.value = node
+                return YAPI.SUCCESS
+
+        res = self.requestAPI(apiresRef, errmsgRef, msValidity)
+        if YAPI.YISERR(res):
+            return res
+        nodeRef.value = apiresRef.value.GetChildNode(None, funcId)
         return YAPI.SUCCESS
 
     def clearCache(self):
         self._cacheJson = None
-        self._cacheStamp = datetime.datetime(year=1970, month=1, day=1)
+        self._funcCacheTime.clear()
+        self._cacheStamp = 0
 
     #noinspection PyTypeChecker,PyTypeChecker,PyTypeChecker
     def getFunctions(self, functionsRef, errmsgRef=None):
@@ -3596,7 +4943,12 @@ class YFunction(object):
     _cache = {}
     _FunctionCallbacks = []
     _TimedReportCallbackList = []
+    # same callback lists, by function descriptor, for event dispatch
+    _FunctionCallbacksByDescr = {}
+    _TimedReportCallbacksByDescr = {}
     _CalibHandlers = {}
+    # attributes refreshed by value notifications when the push cache is enabled
+    _PushCacheAttributes = ("advertisedValue",)
 
     FUNCTIONDESCRIPTOR_INVALID = -1
     HARDWAREID_INVALID = YAPI.INVALID_STRING
@@ -3621,7 +4973,19 @@ class YFunction(object):
         self._logicalName = YFunction.LOGICALNAME_INVALID
         self._advertisedValue = YFunction.ADVERTISEDVALUE_INVALID
         self._valueCallbackFunction = None
-        self._cacheExpiration = datetime.datetime.fromtimestamp(0)
+        self._cacheExpiration = 0
+        self._cacheLoaded = 0
+        self._pushCached = False
+        # set by YAPI.ReadMany() while reading attributes from its snapshot
+        self._snapshotRead = False
+        # resolution cache, see _resolve()
+        self._resolvedGeneration = -1
+        self._resolvedDevDescr = -1
+        self._resolvedDevice = None
+        self._resolvedSerial = ''
+        self._resolvedFuncId = ''
+        self._resolvedPrefix = ''
+        self._pushDevDescr = -1
         self._serial = ''
         self._funId = ''
         self._hwId = ''
@@ -3642,16 +5006,31 @@ class YFunction(object):
     def _ClearCache():
         YFunction._cache.clear()
 
+    @staticmethod
+    def _addToDescrTable(table, fundescr, func):
+        if fundescr not in table:
+            table[fundescr] = []
+        table[fundescr].append(func)
+
+    @staticmethod
+    def _removeFromDescrTable(table, fundescr, func):
+        if fundescr in table and func in table[fundescr]:
+            table[fundescr].remove(func)
+            if not table[fundescr]:
+                del table[fundescr]
+
     @staticmethod
     def _UpdateValueCallbackList(func, add):
         if add:
             func.isOnline()
             if func not in YFunction._FunctionCallbacks:
                 YFunction._FunctionCallbacks.append(func)
+                YFunction._addToDescrTable(YFunction._FunctionCallbacksByDescr, func._fundescr, func)
         else:
             if func in YFunction._FunctionCallbacks:
                 index = YFunction._FunctionCallbacks.index(func)
                 del YFunction._FunctionCallbacks[index]
+                YFunction._removeFromDescrTable(YFunction._FunctionCallbacksByDescr, func._fundescr, func)
 
     @staticmethod
     def _UpdateTimedReportCallbackList(func, add):
@@ -3659,10 +5038,22 @@ class YFunction(object):
             func.isOnline()
             if func not in YFunction._TimedReportCallbackList:
                 YFunction._TimedReportCallbackList.append(func)
+                YFunction._addToDescrTable(YFunction._TimedReportCallbacksByDescr, func._fundescr, func)
         else:
             if func in YFunction._TimedReportCallbackList:
                 index = YFunction._TimedReportCallbackList.index(func)
                 del YFunction._TimedReportCallbackList[index]
+                YFunction._removeFromDescrTable(YFunction._TimedReportCallbacksByDescr, func._fundescr, func)
+
+    def _setDescriptor(self, fundescr):
+        # keep the dispatch tables in sync when a function gets (re)bound to a descriptor
+        if fundescr == self._fundescr:
+            return
+        for table in (YFunction._FunctionCallbacksByDescr, YFunction._TimedReportCallbacksByDescr):
+            if self._fundescr in table and self in table[self._fundescr]:
+                YFunction._removeFromDescrTable(table, self._fundescr, self)
+                YFunction._addToDescrTable(table, fundescr, self)
+        self._fundescr = fundescr
 
     def _throw(self, errType, errorMessage):
         self._lastErrorType = errType
@@ -3681,26 +5072,44 @@ class YFunction(object):
         if YAPI.YISERR(tmp_fundescr):
             return tmp_fundescr
 
-        self._fundescr = tmp_fundescr
+        self._setDescriptor(tmp_fundescr)
         fundescrRef.value = tmp_fundescr
         return YAPI.SUCCESS
 
         # Return a pointer to our device caching object (may trigger a hub scan)
 
     def _getDevice(self, devRef, errmsgRef=None):
+        res = self._resolve(errmsgRef)
+        if YAPI.YISERR(res):
+            return res
+        devRef.value = self._resolvedDevice
+        return YAPI.SUCCESS
+
+    # Resolve our name to our descriptor, device and function id. The result is kept until
+    # a device arrival, removal or change is notified, see YAPI._ResolveGeneration
+    def _resolve(self, errmsgRef=None):
+        if self._resolvedGeneration == YAPI._ResolveGeneration:
+            return YAPI.SUCCESS
+        generation = YAPI._ResolveGeneration
         fundescrRef = YRefParam()
-        # Resolve function name
+        devdescRef = YRefParam()
+        serialRef = YRefParam()
+        funcIdRef = YRefParam()
+        funcNameRef = YRefParam()
+        funcValRef = YRefParam()
         res = self._getDescriptor(fundescrRef, errmsgRef)
         if YAPI.YISERR(res):
             return res
-
-        # Get device descriptor
-        devdescr = YAPI.yapiGetDeviceByFunction(fundescrRef.value, errmsgRef)
-        if YAPI.YISERR(devdescr):
-            return devdescr
-
-        # Get device object
-        devRef.value = YDevice.getDevice(devdescr)
+        res = YAPI.yapiGetFunctionInfo(fundescrRef.value, devdescRef, serialRef, funcIdRef, funcNameRef, funcValRef,
+                                       errmsgRef)
+        if YAPI.YISERR(res):
+            return res
+        self._resolvedDevDescr = devdescRef.value
+        self._resolvedDevice = YDevice.getDevice(devdescRef.value)
+        self._resolvedSerial = str(serialRef.value)
+        self._resolvedFuncId = str(funcIdRef.value)
+        self._resolvedPrefix = "GET /api/" + self._resolvedFuncId + "/"
+        self._resolvedGeneration = generation
         return YAPI.SUCCESS
 
     # Return the next known function of current class listed in the yellow pages
@@ -3767,26 +5176,33 @@ class YFunction(object):
             ofs += 1
         return uchangeval
 
-    def _buildSetRequest(self, changeattr, changeval, requestRef, errmsgRef=None):
-        fundescRef = YRefParam()
-        funcid = ctypes.create_string_buffer(YAPI.YOCTO_FUNCTION_LEN)
-        errbuff = ctypes.create_string_buffer(YAPI.YOCTO_ERRMSG_LEN)
-        # Resolve the function name
-        res = self._getDescriptor(fundescRef, errmsgRef)
+    def _getRequestFunctionId(self, funcIdRef, errmsgRef=None):
+        res = self._resolve(errmsgRef)
         if YAPI.YISERR(res):
             return res
-        devdesc = ctypes.c_int()
-        #noinspection PyUnresolvedReferences
-        res = YAPI._yapiGetFunctionInfoEx(fundescRef.value, ctypes.byref(devdesc), None, funcid, None, None, None, errbuff)
+        funcIdRef.value = self._resolvedFuncId
+        return YAPI.SUCCESS
+
+    def _buildSetRequest(self, changeattr, changeval, requestRef, errmsgRef=None):
+        res = self._resolve(errmsgRef)
         if YAPI.YISERR(res):
-            if not errmsgRef is None:
-                errmsgRef.value = YByte2String(errbuff.value)
-            self._throw(res, errmsgRef.value)
             return res
-        requestRef.value = "GET /api/" + YByte2String(funcid.value) + "/"
+        request = self._resolvedPrefix
         if changeattr != "":
-            requestRef.value += changeattr + "?" + changeattr + "=" + self._escapeAttr(changeval)
-        requestRef.value += "&. \r\n\r\n"
+            request += changeattr + "?" + changeattr + "=" + self._escapeAttr(changeval)
+        requestRef.value = request + "&. \r\n\r\n"
+        return YAPI.SUCCESS
+
+    def _buildSetManyRequest(self, changes, requestRef, errmsgRef=None):
+        # a single request setting several attributes: GET /api/<funcId>?a=1&b=2&.
+        funcIdRef = YRefParam()
+        res = self._getRequestFunctionId(funcIdRef, errmsgRef)
+        if YAPI.YISERR(res):
+            return res
+        request = "GET /api/" + funcIdRef.value + "?"
+        for (changeattr, changeval) in changes:
+            request += changeattr + "=" + self._escapeAttr(changeval) + "&"
+        requestRef.value = request + ". \r\n\r\n"
         return YAPI.SUCCESS
 
     def _parse(self, j):
@@ -3797,8 +5213,22 @@ class YFunction(object):
         self._parserHelper()
         return 0
 
+    def batch(self):
+        """
+        Returns a new transaction collecting the attribute changes made by the current
+        thread with the set_xxx() methods of this function or of any other function, to
+        send them with as few requests as possible. Use it as a context manager: the
+        changes are committed when the with block ends. See YFunctionBatch.
+
+        @return a YFunctionBatch object
+        """
+        return YFunctionBatch()
+
     # Set an attribute in the function, and parse the resulting new function state
     def _setAttr(self, attrname, newvalue):
+        batch = getattr(YFunctionBatch._current, "batch", None)
+        if batch is not None:
+            return batch._add(self, attrname, newvalue)
         errmsgRef = YRefParam()
         requestRef = YRefParam()
         devRef = YRefParam()
@@ -3818,7 +5248,12 @@ class YFunction(object):
         res = devRef.value.HTTPRequestAsync(requestRef.value, None, None, errmsgRef)
         if YAPI.YISERR(res):
             # make sure a device scan does not solve the issue
+            self._resolvedGeneration = -1
             res = YAPI.yapiUpdateDeviceList(1, errmsgRef)
+            if YAPI.YISERR(res):
+                self._throw(res, errmsgRef.value)
+                return res
+            res = self._getDevice(devRef, errmsgRef)
             if YAPI.YISERR(res):
                 self._throw(res, errmsgRef.value)
                 return res
@@ -3828,8 +5263,12 @@ class YFunction(object):
                 self._throw(res, errmsgRef.value)
                 return res
 
-        if self._cacheExpiration != datetime.datetime.fromtimestamp(0):
-            self._cacheExpiration = YAPI.GetTickCount()
+        if attrname == "logicalName":
+            # functions found by name may now resolve differently
+            YAPI._ResolveGeneration += 1
+        if self._cacheExpiration != 0:
+            self._cacheExpiration = YMonotonicTickCount()
+            self._cacheLoaded = 0
 
         return YAPI.SUCCESS
 
@@ -3890,15 +5329,8 @@ class YFunction(object):
     def _download(self, url):
         request = "GET /" + url + " HTTP/1.1\r\n\r\n"
         result_buffer = self._request(request)
-        found = 0
-        while found <= len(result_buffer) - 4:
-            if YGetByte(result_buffer, found) == 13 \
-                    and YGetByte(result_buffer, found + 1) == 10 \
-                    and YGetByte(result_buffer, found + 2) == 13 \
-                    and YGetByte(result_buffer, found + 3) == 10:
-                break
-            found += 1
-        if found > len(result_buffer) - 4:
+        found = result_buffer.find(b"\r\n\r\n")
+        if found < 0:
             self._throw(YAPI.IO_ERROR, "http request failed")
             return ''
         return result_buffer[found + 4:]
@@ -3945,11 +5377,7 @@ class YFunction(object):
         reply_c = POINTER(ctypes.c_ubyte)()
         res = YAPI._yapiJsonGetPath(path_data, json_data, len(json), ctypes.byref(reply_c), errbuf)
         if res > 0:
-            bb = YString2Byte("")
-            #(xrange not supported in 2.5.x)
-            for i in range(res):
-                bb = YAddByte(bb, reply_c[i])
-            return YByte2String(bb)
+            return YByte2String(ctypes.string_at(reply_c, res))
         return ""
 
     def _decode_json_string(self, json):
@@ -3989,8 +5417,8 @@ class YFunction(object):
 
         On failure, throws an exception or returns YFunction.LOGICALNAME_INVALID.
         """
-        if self._cacheExpiration <= YAPI.GetTickCount():
-            if self.load(YAPI.DefaultCacheValidity) != YAPI.SUCCESS:
+        if self._cacheExpired("logicalName"):
+            if self.load(self._cacheValidity()) != YAPI.SUCCESS:
                 return YFunction.LOGICALNAME_INVALID
         return self._logicalName
 
@@ -4021,8 +5449,8 @@ class YFunction(object):
 
         On failure, throws an exception or returns YFunction.ADVERTISEDVALUE_INVALID.
         """
-        if self._cacheExpiration <= YAPI.GetTickCount():
-            if self.load(YAPI.DefaultCacheValidity) != YAPI.SUCCESS:
+        if self._cacheExpired("advertisedValue"):
+            if self.load(self._cacheValidity()) != YAPI.SUCCESS:
                 return YFunction.ADVERTISEDVALUE_INVALID
         return self._advertisedValue
 
@@ -4311,7 +5739,7 @@ class YFunction(object):
         apiresRef = YRefParam()
 
         #  A valid value in cache means that the device is online
-        if self._cacheExpiration > YAPI.GetTickCount():
+        if self._cacheExpiration > YMonotonicTickCount():
             return True
 
         #Check that the function is available, without throwing exceptions
@@ -4322,9 +5750,36 @@ class YFunction(object):
         if YAPI.YISERR(devRef.value.requestAPI(apiresRef, errmsgRef)):
             return False
 
-        self.load(YAPI.DefaultCacheValidity)
+        self.load(self._cacheValidity())
         return True
 
+    def _cacheValidity(self):
+        # validity to use when loading this function, according to the cache policies
+        policies = YAPI._CacheValidity
+        if policies:
+            for target in (self._hwId, self._func, self._className):
+                if target in policies:
+                    return policies[target]
+        return YAPI.DefaultCacheValidity
+
+    def _cacheExpired(self, attrname):
+        # tells if the cached value of an attribute must be reloaded before use
+        if self._snapshotRead:
+            return False
+        now = YMonotonicTickCount()
+        if self._pushCached and attrname in self._PushCacheAttributes and YAPI._pushCacheAlive(now):
+            YAPI._countCacheAccess(self._className, True)
+            return False
+        expired = self._cacheExpiration <= now
+        policies = YAPI._AttrCacheValidity
+        if policies:
+            for key in ((self._hwId, attrname), (self._func, attrname), (self._className, attrname), ("", attrname)):
+                if key in policies:
+                    expired = self._cacheLoaded + policies[key] <= now
+                    break
+        YAPI._countCacheAccess(self._className, not expired)
+        return expired
+
     def load(self, msValidity):
         """
         Preloads the function cache with a specified validity duration.
@@ -4340,51 +5795,58 @@ class YFunction(object):
 
         On failure, throws an exception or returns a negative error code.
         """
-        devRef = YRefParam()
         errmsgRef = YRefParam()
-        apiresRef = YRefParam()
-        funcIdRef = YRefParam()
-        devdescRef = YRefParam()
-        serialRef = YRefParam()
-        funcNameRef = YRefParam()
-        funcValRef = YRefParam()
+        nodeRef = YRefParam()
 
-        # Resolve our reference to our device, load REST API
-        res = self._getDevice(devRef, errmsgRef)
+        # Resolve our reference to our device and our function Id
+        res = self._resolve(errmsgRef)
         if YAPI.YISERR(res):
             self._throw(res, errmsgRef.value)
             return res
+        msValidity = YAPI._toMs(msValidity)
 
-        res = devRef.value.requestAPI(apiresRef, errmsgRef)
+        # Load REST API, either the whole device or only our function subtree
+        res = self._resolvedDevice.requestFunctionAPI(self._resolvedFuncId, msValidity, nodeRef, errmsgRef)
         if YAPI.YISERR(res):
+            self._resolvedGeneration = -1
             self._throw(res, errmsgRef.value)
             return res
 
-        # Get our function Id
-        fundescr = YAPI.yapiGetFunction(self._className, self._func, errmsgRef)
-        if YAPI.YISERR(fundescr):
-            self._throw(res, errmsgRef.value)
-            return fundescr
-
-        res = YAPI.yapiGetFunctionInfo(fundescr, devdescRef, serialRef, funcIdRef, funcNameRef, funcValRef, errmsgRef)
+        res = self._loadNode(nodeRef.value, msValidity, self._fundescr, self._resolvedDevDescr, self._resolvedSerial,
+                             self._resolvedFuncId)
         if YAPI.YISERR(res):
-            self._throw(res, errmsgRef.value)
-            return res
-        if type(msValidity) == type(int()):
-            msValidity = datetime.timedelta(milliseconds=msValidity)
-        self._cacheExpiration = YAPI.GetTickCount() + msValidity
-        self._serial = str(serialRef.value)
-        self._funId = str(funcIdRef.value)
+            self._throw(res, "unexpected JSON structure: missing function " + self._resolvedFuncId)
+        return res
+
+    def _loadNode(self, node, msValidity, fundescr, devdescr, serial, funcId):
+        # fill the function cache from its node in the device api.json
+        self._cacheLoaded = YMonotonicTickCount()
+        self._cacheExpiration = self._cacheLoaded + msValidity
+        self._serial = serial
+        self._funId = funcId
         self._hwId = self._serial + '.' + self._funId
 
-        node = apiresRef.value.GetChildNode(None, funcIdRef.value)
         if node is None:
-            self._throw(YAPI.IO_ERROR, "unexpected JSON structure: missing function " + str(funcIdRef.value))
             return YAPI.IO_ERROR
 
         self._parse(node)
+
+        # Keep our cache fed by value notifications from now on
+        if YAPI._PushCacheEnabled and not self._pushCached:
+            if fundescr not in YAPI._PushCacheFunctions:
+                YAPI._PushCacheFunctions[fundescr] = []
+            if self not in YAPI._PushCacheFunctions[fundescr]:
+                YAPI._PushCacheFunctions[fundescr].append(self)
+            self._pushDevDescr = devdescr
+            self._pushCached = True
         return YAPI.SUCCESS
 
+    def _pushValue(self, value):
+        # a new advertised value was notified: keep it, other attributes may have changed
+        self._advertisedValue = value
+        self._cacheExpiration = YMonotonicTickCount()
+        self._cacheLoaded = 0
+
     def clearCache(self):
         """
         Invalidates the cache. Invalidates the cache of the function attributes. Forces the
@@ -4406,7 +5868,8 @@ class YFunction(object):
         if YAPI.YISERR(res):
             return
         devRef.value.clearCache()
-        self._cacheExpiration = YAPI.GetTickCount()
+        self._cacheExpiration = YMonotonicTickCount()
+        self._cacheLoaded = 0
 
     def get_module(self):
         """
@@ -4509,6 +5972,163 @@ class YFunction(object):
 #--- (end of generated code: Function functions)
 
 
+## ------------------------------------------------------------------------------------
+##
+## YFunctionBatch
+##
+## ------------------------------------------------------------------------------------
+
+#noinspection PyProtectedMember
+class YFunctionBatch(object):
+    """
+    Collects attribute changes made with the set_xxx() methods of one or more functions,
+    and sends them when the batch is committed, with a single request per function
+    instead of one request per attribute. A batch is created by YFunction.batch() and
+    used as a context manager: the changes made by the current thread within the with
+    block are committed when the block exits normally, and discarded if it exits with
+    an exception.
+
+    Example:
+        with serialPort.batch() as batch:
+            serialPort.set_serialMode("9600,8N1")
+            serialPort.set_protocol("Line")
+            serialPort.set_voltageLevel(YSerialPort.VOLTAGELEVEL_TTL3V)
+        if batch.get_failures(): ...
+    """
+    # batch collecting the changes of each thread
+    _current = threading.local()
+
+    def __init__(self):
+        self._functions = []
+        self._changes = {}
+        self._failures = []
+        self._depth = 0
+        self._outer = None
+
+    def __enter__(self):
+        if self._depth == 0:
+            # nested batches are merged into the outermost one
+            outer = getattr(YFunctionBatch._current, "batch", None)
+            if outer is not None and outer is not self:
+                self._outer = outer
+                return outer.__enter__()
+            YFunctionBatch._current.batch = self
+        self._depth += 1
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        if self._outer is not None:
+            outer = self._outer
+            self._outer = None
+            return outer.__exit__(exc_type, exc_value, traceback)
+        self._depth -= 1
+        if self._depth > 0:
+            return False
+        YFunctionBatch._current.batch = None
+        if exc_type is not None:
+            self.discard()
+            return False
+        self.commit()
+        return False
+
+    def _add(self, func, attrname, newvalue):
+        changes = self._changes.get(func)
+        if changes is None:
+            changes = []
+            self._changes[func] = changes
+            self._functions.append(func)
+        for i in range(len(changes)):
+            if changes[i][0] == attrname:
+                # only the last value set for an attribute is sent
+                del changes[i]
+                break
+        changes.append((attrname, newvalue))
+        return YAPI.SUCCESS
+
+    def discard(self):
+        """
+        Forgets the changes collected so far, without sending them.
+        """
+        self._functions = []
+        self._changes = {}
+
+    def commit(self):
+        """
+        Sends the collected changes, with one request per function. All functions are
+        processed even if some of them fail; the failures can then be retrieved with
+        get_failures().
+
+        @return YAPI.SUCCESS when all changes have been applied.
+
+        On failure, throws an exception for the first failed function, once all other
+        changes have been sent, or returns its negative error code.
+        """
+        functions = self._functions
+        changes = self._changes
+        self.discard()
+        self._failures = []
+        firstFailure = None
+        for func in functions:
+            errmsgRef = YRefParam()
+            res = self._send(func, changes[func], errmsgRef)
+            if YAPI.YISERR(res):
+                for (attrname, newvalue) in changes[func]:
+                    self._failures.append((func, attrname, res, errmsgRef.value))
+                if firstFailure is None:
+                    firstFailure = (func, res, errmsgRef.value)
+        if firstFailure is not None:
+            (func, res, errmsg) = firstFailure
+            func._throw(res, errmsg)
+            return res
+        return YAPI.SUCCESS
+
+    @staticmethod
+    def _send(func, changes, errmsgRef):
+        requestRef = YRefParam()
+        devRef = YRefParam()
+        replyRef = YRefParam()
+        res = func._buildSetManyRequest(changes, requestRef, errmsgRef)
+        if YAPI.YISERR(res):
+            return res
+        res = func._getDevice(devRef, errmsgRef)
+        if YAPI.YISERR(res):
+            return res
+        dev = devRef.value
+        res = dev.HTTPRequest(requestRef.value, replyRef, errmsgRef)
+        if YAPI.YISERR(res):
+            # make sure a device scan does not solve the issue
+            res = YAPI.yapiUpdateDeviceList(1, errmsgRef)
+            if YAPI.YISERR(res):
+                return res
+            res = dev.HTTPRequest(requestRef.value, replyRef, errmsgRef)
+            if YAPI.YISERR(res):
+                return res
+        # the device state has changed: invalidate the caches
+        for (changeattr, changeval) in changes:
+            if changeattr == "logicalName":
+                YAPI._ResolveGeneration += 1
+        dev._cacheStamp = YMonotonicTickCount()
+        dev._funcCacheTime.clear()
+        if func._cacheExpiration != 0:
+            func._cacheExpiration = YMonotonicTickCount()
+            func._cacheLoaded = 0
+        reply = replyRef.value
+        if reply[0:4] != b"OK\r\n" and reply[0:17] != b"HTTP/1.1 200 OK\r\n":
+            errmsgRef.value = "http request failed"
+            return YAPI.IO_ERROR
+        return YAPI.SUCCESS
+
+    def get_failures(self):
+        """
+        Returns the changes that could not be applied by the last commit, as a list of
+        (function, attribute name, error code, error message) tuples. When the request
+        for a function fails, all attributes changed on that function are listed.
+
+        @return a list of tuples, empty when all changes have been applied
+        """
+        return self._failures
+
+
 #--- (generated code: YModule class start)
 #noinspection PyProtectedMember
 class YModule(YFunction):
@@ -4607,8 +6227,8 @@ class YModule(YFunction):
 
         On failure, throws an exception or returns YModule.PRODUCTNAME_INVALID.
         """
-        if self._cacheExpiration == datetime.datetime.fromtimestamp(0):
-            if self.load(YAPI.DefaultCacheValidity) != YAPI.SUCCESS:
+        if self._cacheExpiration == 0:
+            if self.load(self._cacheValidity()) != YAPI.SUCCESS:
                 return YModule.PRODUCTNAME_INVALID
         return self._productName
 
@@ -4620,8 +6240,8 @@ class YModule(YFunction):
 
         On failure, throws an exception or returns YModule.SERIALNUMBER_INVALID.
         """
-        if self._cacheExpiration == datetime.datetime.fromtimestamp(0):
-            if self.load(YAPI.DefaultCacheValidity) != YAPI.SUCCESS:
+        if self._cacheExpiration == 0:
+            if self.load(self._cacheValidity()) != YAPI.SUCCESS:
                 return YModule.SERIALNUMBER_INVALID
         return self._serialNumber
 
@@ -4633,8 +6253,8 @@ class YModule(YFunction):
 
         On failure, throws an exception or returns YModule.PRODUCTID_INVALID.
         """
-        if self._cacheExpiration == datetime.datetime.fromtimestamp(0):
-            if self.load(YAPI.DefaultCacheValidity) != YAPI.SUCCESS:
+        if self._cacheExpiration == 0:
+            if self.load(self._cacheValidity()) != YAPI.SUCCESS:
                 return YModule.PRODUCTID_INVALID
         return self._productId
 
@@ -4646,8 +6266,8 @@ class YModule(YFunction):
 
         On failure, throws an exception or returns YModule.PRODUCTRELEASE_INVALID.
         """
-        if self._cacheExpiration <= YAPI.GetTickCount():
-            if self.load(YAPI.DefaultCacheValidity) != YAPI.SUCCESS:
+        if self._cacheExpired("productRelease"):
+            if self.load(self._cacheValidity()) != YAPI.SUCCESS:
                 return YModule.PRODUCTRELEASE_INVALID
         return self._productRelease
 
@@ -4659,8 +6279,8 @@ class YModule(YFunction):
 
         On failure, throws an exception or returns YModule.FIRMWARERELEASE_INVALID.
         """
-        if self._cacheExpiration <= YAPI.GetTickCount():
-            if self.load(YAPI.DefaultCacheValidity) != YAPI.SUCCESS:
+        if self._cacheExpired("firmwareRelease"):
+            if self.load(self._cacheValidity()) != YAPI.SUCCESS:
                 return YModule.FIRMWARERELEASE_INVALID
         return self._firmwareRelease
 
@@ -4673,8 +6293,8 @@ class YModule(YFunction):
 
         On failure, throws an exception or returns YModule.PERSISTENTSETTINGS_INVALID.
         """
-        if self._cacheExpiration <= YAPI.GetTickCount():
-            if self.load(YAPI.DefaultCacheValidity) != YAPI.SUCCESS:
+        if self._cacheExpired("persistentSettings"):
+            if self.load(self._cacheValidity()) != YAPI.SUCCESS:
                 return YModule.PERSISTENTSETTINGS_INVALID
         return self._persistentSettings
 
@@ -4690,8 +6310,8 @@ class YModule(YFunction):
 
         On failure, throws an exception or returns YModule.LUMINOSITY_INVALID.
         """
-        if self._cacheExpiration <= YAPI.GetTickCount():
-            if self.load(YAPI.DefaultCacheValidity) != YAPI.SUCCESS:
+        if self._cacheExpired("luminosity"):
+            if self.load(self._cacheValidity()) != YAPI.SUCCESS:
                 return YModule.LUMINOSITY_INVALID
         return self._luminosity
 
@@ -4719,8 +6339,8 @@ class YModule(YFunction):
 
         On failure, throws an exception or returns YModule.BEACON_INVALID.
         """
-        if self._cacheExpiration <= YAPI.GetTickCount():
-            if self.load(YAPI.DefaultCacheValidity) != YAPI.SUCCESS:
+        if self._cacheExpired("beacon"):
+            if self.load(self._cacheValidity()) != YAPI.SUCCESS:
                 return YModule.BEACON_INVALID
         return self._beacon
 
@@ -4745,8 +6365,8 @@ class YModule(YFunction):
 
         On failure, throws an exception or returns YModule.UPTIME_INVALID.
         """
-        if self._cacheExpiration <= YAPI.GetTickCount():
-            if self.load(YAPI.DefaultCacheValidity) != YAPI.SUCCESS:
+        if self._cacheExpired("upTime"):
+            if self.load(self._cacheValidity()) != YAPI.SUCCESS:
                 return YModule.UPTIME_INVALID
         return self._upTime
 
@@ -4758,8 +6378,8 @@ class YModule(YFunction):
 
         On failure, throws an exception or returns YModule.USBCURRENT_INVALID.
         """
-        if self._cacheExpiration <= YAPI.GetTickCount():
-            if self.load(YAPI.DefaultCacheValidity) != YAPI.SUCCESS:
+        if self._cacheExpired("usbCurrent"):
+            if self.load(self._cacheValidity()) != YAPI.SUCCESS:
                 return YModule.USBCURRENT_INVALID
         return self._usbCurrent
 
@@ -4773,8 +6393,8 @@ class YModule(YFunction):
 
         On failure, throws an exception or returns YModule.REBOOTCOUNTDOWN_INVALID.
         """
-        if self._cacheExpiration <= YAPI.GetTickCount():
-            if self.load(YAPI.DefaultCacheValidity) != YAPI.SUCCESS:
+        if self._cacheExpired("rebootCountdown"):
+            if self.load(self._cacheValidity()) != YAPI.SUCCESS:
                 return YModule.REBOOTCOUNTDOWN_INVALID
         return self._rebootCountdown
 
@@ -4791,8 +6411,8 @@ class YModule(YFunction):
 
         On failure, throws an exception or returns YModule.USERVAR_INVALID.
         """
-        if self._cacheExpiration <= YAPI.GetTickCount():
-            if self.load(YAPI.DefaultCacheValidity) != YAPI.SUCCESS:
+        if self._cacheExpired("userVar"):
+            if self.load(self._cacheValidity()) != YAPI.SUCCESS:
                 return YModule.USERVAR_INVALID
         return self._userVar
 
@@ -5735,7 +7355,7 @@ class YModule(YFunction):
         self._serialNumber = YByte2String(infosRef.serial)
         self._productName = YByte2String(infosRef.productname)
         self._productId = int(infosRef.deviceid)
-        self._cacheExpiration = YAPI.GetTickCount()
+        self._cacheExpiration = YMonotonicTickCount()
 
     # Return the properties of the nth function of our device
     def _getFunction(self, idx, serialRef, funcIdRef, baseType, funcNameRef, funcValRef, errmsgRef):
@@ -6003,6 +7623,7 @@ class YSensor(YFunction):
     RESOLUTION_INVALID = YAPI.INVALID_DOUBLE
     SENSORSTATE_INVALID = YAPI.INVALID_INT
     #--- (end of generated code: YSensor definitions)
+    _PushCacheAttributes = ("advertisedValue", "currentValue")
 
     def __init__(self, func):
         super(YSensor, self).__init__(func)
@@ -6033,6 +7654,7 @@ class YSensor(YFunction):
         self._calref = []
         self._calhdl = None
         #--- (end of generated code: YSensor attributes)
+        self._calcomp = None
 
     #--- (generated code: YSensor implementation)
     def _parseAttr(self, member):
@@ -6076,8 +7698,8 @@ class YSensor(YFunction):
 
         On failure, throws an exception or returns YSensor.UNIT_INVALID.
         """
-        if self._cacheExpiration <= YAPI.GetTickCount():
-            if self.load(YAPI.DefaultCacheValidity) != YAPI.SUCCESS:
+        if self._cacheExpired("unit"):
+            if self.load(self._cacheValidity()) != YAPI.SUCCESS:
                 return YSensor.UNIT_INVALID
         return self._unit
 
@@ -6091,8 +7713,8 @@ class YSensor(YFunction):
         On failure, throws an exception or returns YSensor.CURRENTVALUE_INVALID.
         """
         # res
-        if self._cacheExpiration <= YAPI.GetTickCount():
-            if self.load(YAPI.DefaultCacheValidity) != YAPI.SUCCESS:
+        if self._cacheExpired("currentValue"):
+            if self.load(self._cacheValidity()) != YAPI.SUCCESS:
                 return YSensor.CURRENTVALUE_INVALID
         res = self._applyCalibration(self._currentRawValue)
         if res == YSensor.CURRENTVALUE_INVALID:
@@ -6123,8 +7745,8 @@ class YSensor(YFunction):
         On failure, throws an exception or returns YSensor.LOWESTVALUE_INVALID.
         """
         # res
-        if self._cacheExpiration <= YAPI.GetTickCount():
-            if self.load(YAPI.DefaultCacheValidity) != YAPI.SUCCESS:
+        if self._cacheExpired("lowestValue"):
+            if self.load(self._cacheValidity()) != YAPI.SUCCESS:
                 return YSensor.LOWESTVALUE_INVALID
         res = self._lowestValue * self._iresol
         return round(res) / self._iresol
@@ -6152,8 +7774,8 @@ class YSensor(YFunction):
         On failure, throws an exception or returns YSensor.HIGHESTVALUE_INVALID.
         """
         # res
-        if self._cacheExpiration <= YAPI.GetTickCount():
-            if self.load(YAPI.DefaultCacheValidity) != YAPI.SUCCESS:
+        if self._cacheExpired("highestValue"):
+            if self.load(self._cacheValidity()) != YAPI.SUCCESS:
                 return YSensor.HIGHESTVALUE_INVALID
         res = self._highestValue * self._iresol
         return round(res) / self._iresol
@@ -6168,8 +7790,8 @@ class YSensor(YFunction):
 
         On failure, throws an exception or returns YSensor.CURRENTRAWVALUE_INVALID.
         """
-        if self._cacheExpiration <= YAPI.GetTickCount():
-            if self.load(YAPI.DefaultCacheValidity) != YAPI.SUCCESS:
+        if self._cacheExpired("currentRawValue"):
+            if self.load(self._cacheValidity()) != YAPI.SUCCESS:
                 return YSensor.CURRENTRAWVALUE_INVALID
         return self._currentRawValue
 
@@ -6183,8 +7805,8 @@ class YSensor(YFunction):
 
         On failure, throws an exception or returns YSensor.LOGFREQUENCY_INVALID.
         """
-        if self._cacheExpiration <= YAPI.GetTickCount():
-            if self.load(YAPI.DefaultCacheValidity) != YAPI.SUCCESS:
+        if self._cacheExpired("logFrequency"):
+            if self.load(self._cacheValidity()) != YAPI.SUCCESS:
                 return YSensor.LOGFREQUENCY_INVALID
         return self._logFrequency
 
@@ -6215,8 +7837,8 @@ class YSensor(YFunction):
 
         On failure, throws an exception or returns YSensor.REPORTFREQUENCY_INVALID.
         """
-        if self._cacheExpiration <= YAPI.GetTickCount():
-            if self.load(YAPI.DefaultCacheValidity) != YAPI.SUCCESS:
+        if self._cacheExpired("reportFrequency"):
+            if self.load(self._cacheValidity()) != YAPI.SUCCESS:
                 return YSensor.REPORTFREQUENCY_INVALID
         return self._reportFrequency
 
@@ -6238,8 +7860,8 @@ class YSensor(YFunction):
         return self._setAttr("reportFrequency", rest_val)
 
     def get_calibrationParam(self):
-        if self._cacheExpiration <= YAPI.GetTickCount():
-            if self.load(YAPI.DefaultCacheValidity) != YAPI.SUCCESS:
+        if self._cacheExpired("calibrationParam"):
+            if self.load(self._cacheValidity()) != YAPI.SUCCESS:
                 return YSensor.CALIBRATIONPARAM_INVALID
         return self._calibrationParam
 
@@ -6270,8 +7892,8 @@ class YSensor(YFunction):
 
         On failure, throws an exception or returns YSensor.RESOLUTION_INVALID.
         """
-        if self._cacheExpiration <= YAPI.GetTickCount():
-            if self.load(YAPI.DefaultCacheValidity) != YAPI.SUCCESS:
+        if self._cacheExpired("resolution"):
+            if self.load(self._cacheValidity()) != YAPI.SUCCESS:
                 return YSensor.RESOLUTION_INVALID
         return self._resolution
 
@@ -6286,8 +7908,8 @@ class YSensor(YFunction):
 
         On failure, throws an exception or returns YSensor.SENSORSTATE_INVALID.
         """
-        if self._cacheExpiration <= YAPI.GetTickCount():
-            if self.load(YAPI.DefaultCacheValidity) != YAPI.SUCCESS:
+        if self._cacheExpired("sensorState"):
+            if self.load(self._cacheValidity()) != YAPI.SUCCESS:
                 return YSensor.SENSORSTATE_INVALID
         return self._sensorState
 
@@ -6324,6 +7946,11 @@ class YSensor(YFunction):
         return obj
 
     def _parserHelper(self):
+        res = self._parseCalibrationParam()
+        self._calcomp = YAPI._Calibration(self._calhdl, self._caltyp, self._calpar, self._calraw, self._calref)
+        return res
+
+    def _parseCalibrationParam(self):
         # position
         # maxpos
         iCalib = []
@@ -6647,14 +8274,27 @@ class YSensor(YFunction):
             else:
                 #
                 res = "" + str(int(10 + npt))
+                rawDecimals = YAPI._doublesToDecimals(rawValues[:npt])
+                refDecimals = YAPI._doublesToDecimals(refValues[:npt])
                 idx = 0
                 while idx < npt:
-                    iRaw = YAPI._doubleToDecimal(rawValues[idx])
-                    iRef = YAPI._doubleToDecimal(refValues[idx])
+                    iRaw = rawDecimals[idx]
+                    iRef = refDecimals[idx]
                     res = "" + res + "," + str(int(iRaw)) + "," + str(int(iRef))
                     idx = idx + 1
         return res
 
+    def _pushValue(self, value):
+        super(YSensor, self)._pushValue(value)
+        # the advertised value of a sensor is its calibrated current value
+        try:
+            self._currentValue = float(value)
+        except ValueError:
+            # not a measure, read the current value from the device again
+            self._pushCached = False
+            return
+        self._currentRawValue = YSensor.CURRENTRAWVALUE_INVALID
+
     def _applyCalibration(self, rawValue):
         if rawValue == YSensor.CURRENTVALUE_INVALID:
             return YSensor.CURRENTVALUE_INVALID
@@ -6664,7 +8304,7 @@ class YSensor(YFunction):
             return YSensor.CURRENTVALUE_INVALID
         if not (self._calhdl is not None):
             return YSensor.CURRENTVALUE_INVALID
-        return self._calhdl(rawValue, self._caltyp, self._calpar, self._calraw, self._calref)
+        return self._calcomp.apply(rawValue)
 
     def _decodeTimedReport(self, timestamp, report):
         # i
@@ -6703,7 +8343,7 @@ class YSensor(YFunction):
                 avgVal = avgRaw / 1000.0
                 if self._caltyp != 0:
                     if self._calhdl is not None:
-                        avgVal = self._calhdl(avgVal, self._caltyp, self._calpar, self._calraw, self._calref)
+                        avgVal = self._calcomp.apply(avgVal)
                 minVal = avgVal
                 maxVal = avgVal
             else:
@@ -6746,9 +8386,9 @@ class YSensor(YFunction):
                 maxVal = maxRaw / 1000.0
                 if self._caltyp != 0:
                     if self._calhdl is not None:
-                        avgVal = self._calhdl(avgVal, self._caltyp, self._calpar, self._calraw, self._calref)
-                        minVal = self._calhdl(minVal, self._caltyp, self._calpar, self._calraw, self._calref)
-                        maxVal = self._calhdl(maxVal, self._caltyp, self._calpar, self._calraw, self._calref)
+                        avgVal = self._calcomp.apply(avgVal)
+                        minVal = self._calcomp.apply(minVal)
+                        maxVal = self._calcomp.apply(maxVal)
         else:
             #
             if report[0] == 0:
@@ -6794,7 +8434,7 @@ class YSensor(YFunction):
             val = YAPI._decimalToDouble(w)
         if self._caltyp != 0:
             if self._calhdl is not None:
-                val = self._calhdl(val, self._caltyp, self._calpar, self._calraw, self._calref)
+                val = self._calcomp.apply(val)
         return val
 
     def _decodeAvg(self, dw):
@@ -6806,7 +8446,7 @@ class YSensor(YFunction):
             val = val / self._decexp
         if self._caltyp != 0:
             if self._calhdl is not None:
-                val = self._calhdl(val, self._caltyp, self._calpar, self._calraw, self._calref)
+                val = self._calcomp.apply(val)
         return val
 
     def nextSensor(self):
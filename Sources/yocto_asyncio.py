@@ -0,0 +1,398 @@
+#*********************************************************************
+#*
+#* $Id$
+#*
+#* asyncio front end for the Yoctopuce high-level API (Python 3.5+)
+#*
+#* This module uses the async/await syntax: it cannot be imported with
+#* Python 2, where installing the library reports a SyntaxError while
+#* byte-compiling this file, which is harmless as long as it is not used.
+#*
+#* - - - - - - - - - License information: - - - - - - - - -
+#*
+#*  Copyright (C) 2011 and beyond by Yoctopuce Sarl, Switzerland.
+#*
+#*  Yoctopuce Sarl (hereafter Licensor) grants to you a perpetual
+#*  non-exclusive license to use, modify, copy and integrate this
+#*  file into your software for the sole purpose of interfacing
+#*  with Yoctopuce products.
+#*
+#*  You may reproduce and distribute copies of this file in
+#*  source or object form, as long as the sole purpose of this
+#*  code is to interface with Yoctopuce products. You must retain
+#*  this notice in the distributed source file.
+#*
+#*  You should refer to Yoctopuce General Terms and Conditions
+#*  for additional information regarding your rights and
+#*  obligations.
+#*
+#*  THE SOFTWARE AND DOCUMENTATION ARE PROVIDED 'AS IS' WITHOUT
+#*  WARRANTY OF ANY KIND, EITHER EXPRESS OR IMPLIED, INCLUDING
+#*  WITHOUT LIMITATION, ANY WARRANTY OF MERCHANTABILITY, FITNESS
+#*  FOR A PARTICULAR PURPOSE, TITLE AND NON-INFRINGEMENT. IN NO
+#*  EVENT SHALL LICENSOR BE LIABLE FOR ANY INCIDENTAL, SPECIAL,
+#*  INDIRECT OR CONSEQUENTIAL DAMAGES, LOST PROFITS OR LOST DATA,
+#*  COST OF PROCUREMENT OF SUBSTITUTE GOODS, TECHNOLOGY OR
+#*  SERVICES, ANY CLAIMS BY THIRD PARTIES (INCLUDING BUT NOT
+#*  LIMITED TO ANY DEFENSE THEREOF), ANY CLAIMS FOR INDEMNITY OR
+#*  CONTRIBUTION, OR OTHER SIMILAR COSTS, WHETHER ASSERTED ON THE
+#*  BASIS OF CONTRACT, TORT (INCLUDING NEGLIGENCE), BREACH OF
+#*  WARRANTY, OR OTHERWISE.
+#*
+#*********************************************************************/
+
+
+__docformat__ = 'restructuredtext en'
+import asyncio
+import collections
+import concurrent.futures
+import functools
+from yocto_api import *
+
+
+class YAsyncAPI(object):
+    """
+    asyncio front end for the Yoctopuce library. All the calls to the library, which
+    are blocking, are run on a dedicated single-thread executor, so that the event
+    loop never stalls on a device request, and the calls made through this object
+    are serialized. The library may still be entered by its own threads, such as
+    the one started by YAPI.StartEventThread() or the one handling native events
+    during YAPI.Sleep(). Functions are wrapped into YAsyncFunction objects, whose
+    methods (load, get_*, set_*, _download, _upload, ...) are coroutines.
+
+    The library itself is reached through the api object given to the constructor,
+    YAPI by default, and functions are retrieved with the finder. Any object
+    providing the same static methods (RegisterHub, UpdateDeviceList, HandleEvents,
+    FreeAPI) and any finder returning objects with the same methods as the function
+    classes can be used instead, for instance a stand-in hub used to test an
+    application without devices.
+
+    Example:
+        yapi = YAsyncAPI()
+        await yapi.RegisterHub("127.0.0.1")
+        relay = await yapi.find(YRelay, "relay1")
+        await relay.set_state(YRelay.STATE_B)
+        async for func, value in relay.values():
+            print(value)
+    """
+
+    def __init__(self, api=YAPI, executor=None, loop=None, finder=None):
+        """
+        @param api : the object used to reach the library, YAPI by default
+        @param executor : the executor used to run the library calls. By default,
+                a single worker thread owned by this object is used.
+        @param loop : the event loop used, by default the one running when the
+                first coroutine is called
+        @param finder : a function called as finder(cls, name) by find() to
+                retrieve a function object. By default, the FindXxx() method
+                of the class is used.
+        """
+        self._api = api
+        if finder is None:
+            finder = YAsyncAPI._findFunction
+        self._finder = finder
+        self._loop = loop
+        self._executorOwned = executor is None
+        if executor is None:
+            executor = concurrent.futures.ThreadPoolExecutor(max_workers=1)
+        self._executor = executor
+        self._proxies = {}
+        self._pumpTask = None
+
+    def _getLoop(self):
+        if self._loop is None:
+            self._loop = asyncio.get_event_loop()
+        return self._loop
+
+    async def run(self, fn, *args, **kwargs):
+        """
+        Runs a blocking call on the library executor.
+
+        @param fn : the function to call
+        @param args, kwargs : the arguments of the call
+
+        @return the value returned by the function, or raises its exception
+        """
+        if kwargs:
+            fn = functools.partial(fn, *args, **kwargs)
+            args = ()
+        return await self._getLoop().run_in_executor(self._executor, fn, *args)
+
+    def wrap(self, func):
+        """
+        Returns the asynchronous wrapper of a function object. The same wrapper is
+        returned for a given function object.
+
+        @param func : a YFunction object (YSensor, YRelay, ...)
+
+        @return a YAsyncFunction object
+        """
+        proxy = self._proxies.get(func)
+        if proxy is None:
+            proxy = YAsyncFunction(self, func)
+            self._proxies[func] = proxy
+        return proxy
+
+    @staticmethod
+    def _findFunction(cls, func):
+        return getattr(cls, "Find" + cls.__name__[1:])(func)
+
+    async def find(self, cls, func):
+        """
+        Retrieves a function for a given identifier, using the finder given to the
+        constructor (the FindXxx() method of the given class by default), and wraps it.
+
+        @param cls : a function class, such as YRelay or YTemperature
+        @param func : a string that uniquely characterizes the function
+
+        @return a YAsyncFunction object
+        """
+        return self.wrap(await self.run(self._finder, cls, func))
+
+    async def RegisterHub(self, url, errmsg=None):
+        """
+        Asynchronous version of YAPI.RegisterHub().
+        """
+        return await self.run(self._api.RegisterHub, url, errmsg)
+
+    async def UpdateDeviceList(self, errmsg=None):
+        """
+        Asynchronous version of YAPI.UpdateDeviceList().
+        """
+        return await self.run(self._api.UpdateDeviceList, errmsg)
+
+    async def HandleEvents(self, errmsg=None):
+        """
+        Asynchronous version of YAPI.HandleEvents(). The value callbacks are
+        invoked on the library executor.
+        """
+        return await self.run(self._api.HandleEvents, errmsg)
+
+    async def Sleep(self, ms_duration, errmsg=None):
+        """
+        Asynchronous version of YAPI.Sleep(): pauses the calling coroutine for the
+        specified duration, while handling the events received from the devices,
+        unless the event pump is running. Other coroutines keep running meanwhile.
+
+        @param ms_duration : an integer corresponding to the duration of the pause,
+                in milliseconds.
+        @param errmsg : a string passed by reference to receive any error message.
+
+        @return YAPI.SUCCESS when the call succeeds.
+
+        On failure, throws an exception or returns a negative error code.
+        """
+        loop = self._getLoop()
+        deadline = loop.time() + YAPI._toMs(ms_duration) / 1000.0
+        res = YAPI.SUCCESS
+        while True:
+            if self._pumpTask is None:
+                res = await self.HandleEvents(errmsg)
+                if YAPI.YISERR(res):
+                    return res
+            delay = deadline - loop.time()
+            if delay <= 0:
+                return res
+            if self._pumpTask is None:
+                delay = min(delay, 0.01)
+            await asyncio.sleep(delay)
+
+    def startPump(self, msInterval=10, msDeviceListInterval=1000):
+        """
+        Starts a task that handles the events received from the devices every
+        msInterval, and detects plugged and unplugged devices every
+        msDeviceListInterval, so that the callbacks and the iterators returned by
+        YAsyncFunction.values() are fed without calling Sleep().
+
+        @param msInterval : the period of the event handling, in milliseconds
+        @param msDeviceListInterval : the period of the device list updates, in milliseconds
+
+        @return the asyncio task running the pump
+        """
+        if self._pumpTask is None:
+            self._pumpTask = self._getLoop().create_task(self._pump(msInterval, msDeviceListInterval))
+        return self._pumpTask
+
+    async def stopPump(self):
+        """
+        Stops the task started by startPump().
+        """
+        task = self._pumpTask
+        if task is None:
+            return
+        self._pumpTask = None
+        task.cancel()
+        try:
+            await task
+        except asyncio.CancelledError:
+            pass
+
+    async def _pump(self, msInterval, msDeviceListInterval):
+        loop = self._getLoop()
+        nextDeviceList = 0
+        while True:
+            if loop.time() >= nextDeviceList:
+                await self.UpdateDeviceList()
+                nextDeviceList = loop.time() + msDeviceListInterval / 1000.0
+            await self.HandleEvents()
+            await asyncio.sleep(msInterval / 1000.0)
+
+    async def FreeAPI(self):
+        """
+        Stops the event pump, frees the library and shuts down the executor
+        created by this object.
+        """
+        await self.stopPump()
+        await self.run(self._api.FreeAPI)
+        if self._executorOwned:
+            self._executor.shutdown(True)
+
+
+class YAsyncFunction(object):
+    """
+    Asynchronous wrapper of a YFunction object, returned by YAsyncAPI.wrap().
+    Every method of the wrapped function is available as a coroutine running on
+    the library executor, for instance await sensor.get_currentValue(),
+    await relay.set_state(...), await func.load(100) or await module._download(url).
+    Other attributes are read from the wrapped function directly.
+    """
+
+    def __init__(self, api, func):
+        self._yapi = api
+        self._func = func
+        self._valueQueues = []
+        self._timedReportQueues = []
+
+    def get_function(self):
+        """
+        Returns the wrapped YFunction object, for synchronous use.
+        """
+        return self._func
+
+    def __getattr__(self, name):
+        attr = getattr(self._func, name)
+        if not callable(attr):
+            return attr
+        api = self._yapi
+
+        async def call(*args, **kwargs):
+            return await api.run(attr, *args, **kwargs)
+
+        call.__name__ = name
+        call.__doc__ = attr.__doc__
+        return call
+
+    def __repr__(self):
+        return "YAsyncFunction(%r)" % (self._func,)
+
+    def values(self, maxsize=0):
+        """
+        Returns an asynchronous iterator over the values advertised by the function,
+        as (function, value) tuples, where function is the wrapped YFunction object.
+        This replaces the value callback of the function for as long as an iterator
+        is open. Values are only received while events are handled, see
+        YAsyncAPI.Sleep() and YAsyncAPI.startPump().
+
+        @param maxsize : the maximum number of pending values; when it is reached,
+                the oldest pending value is dropped. 0 means no limit.
+
+        @return a YAsyncCallbackIterator object
+        """
+        return YAsyncCallbackIterator(self, self._valueQueues, "registerValueCallback", maxsize)
+
+    def timedReports(self, maxsize=0):
+        """
+        Returns an asynchronous iterator over the timed reports of a sensor, as
+        (function, measure) tuples, where measure is a YMeasure object. This replaces
+        the timed report callback of the sensor for as long as an iterator is open.
+
+        @param maxsize : the maximum number of pending reports; when it is reached,
+                the oldest pending report is dropped. 0 means no limit.
+
+        @return a YAsyncCallbackIterator object
+        """
+        return YAsyncCallbackIterator(self, self._timedReportQueues, "registerTimedReportCallback", maxsize)
+
+    def _dispatch(self, queues, func, value):
+        # called from the thread handling the events
+        loop = self._yapi._getLoop()
+        for it in list(queues):
+            loop.call_soon_threadsafe(it._put, (func, value))
+
+
+class YAsyncCallbackIterator(object):
+    """
+    Asynchronous iterator over the callbacks of a function, returned by
+    YAsyncFunction.values() and YAsyncFunction.timedReports(). The callback is
+    registered by the first iteration, and unregistered by aclose() once no
+    other iterator of the same kind is open on the function.
+    """
+
+    def __init__(self, proxy, queues, registerMethod, maxsize):
+        self._proxy = proxy
+        self._queues = queues
+        self._registerMethod = registerMethod
+        self._maxsize = maxsize
+        self._pending = collections.deque()
+        # created by _open(), within the running loop
+        self._ready = None
+        self._opened = False
+        self._closed = False
+
+    def _put(self, item):
+        if self._closed:
+            return
+        if 0 < self._maxsize <= len(self._pending):
+            self._pending.popleft()
+        self._pending.append(item)
+        self._ready.set()
+
+    async def _open(self):
+        self._ready = asyncio.Event()
+        self._opened = True
+        self._queues.append(self)
+        if len(self._queues) == 1:
+            proxy = self._proxy
+            queues = self._queues
+
+            def callback(func, value):
+                proxy._dispatch(queues, func, value)
+
+            await proxy._yapi.run(getattr(proxy._func, self._registerMethod), callback)
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self):
+        if self._closed:
+            raise StopAsyncIteration
+        if not self._opened:
+            await self._open()
+        while not self._pending:
+            if self._closed:
+                raise StopAsyncIteration
+            self._ready.clear()
+            await self._ready.wait()
+        return self._pending.popleft()
+
+    async def aclose(self):
+        """
+        Stops the iteration and unregisters the callback if no other iterator
+        uses it.
+        """
+        if self._closed:
+            return
+        self._closed = True
+        if self._ready is not None:
+            self._ready.set()
+        if self._opened:
+            self._queues.remove(self)
+            if len(self._queues) == 0:
+                proxy = self._proxy
+                await proxy._yapi.run(getattr(proxy._func, self._registerMethod), None)
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        await self.aclose()
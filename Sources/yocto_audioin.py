@@ -103,8 +103,8 @@ class YAudioIn(YFunction):
 
         On failure, throws an exception or returns YAudioIn.VOLUME_INVALID.
         """
-        if self._cacheExpiration <= YAPI.GetTickCount():
-            if self.load(YAPI.DefaultCacheValidity) != YAPI.SUCCESS:
+        if self._cacheExpired("volume"):
+            if self.load(self._cacheValidity()) != YAPI.SUCCESS:
                 return YAudioIn.VOLUME_INVALID
         return self._volume
 
@@ -129,8 +129,8 @@ class YAudioIn(YFunction):
 
         On failure, throws an exception or returns YAudioIn.MUTE_INVALID.
         """
-        if self._cacheExpiration <= YAPI.GetTickCount():
-            if self.load(YAPI.DefaultCacheValidity) != YAPI.SUCCESS:
+        if self._cacheExpired("mute"):
+            if self.load(self._cacheValidity()) != YAPI.SUCCESS:
                 return YAudioIn.MUTE_INVALID
         return self._mute
 
@@ -159,8 +159,8 @@ class YAudioIn(YFunction):
 
         On failure, throws an exception or returns YAudioIn.VOLUMERANGE_INVALID.
         """
-        if self._cacheExpiration <= YAPI.GetTickCount():
-            if self.load(YAPI.DefaultCacheValidity) != YAPI.SUCCESS:
+        if self._cacheExpired("volumeRange"):
+            if self.load(self._cacheValidity()) != YAPI.SUCCESS:
                 return YAudioIn.VOLUMERANGE_INVALID
         return self._volumeRange
 
@@ -172,8 +172,8 @@ class YAudioIn(YFunction):
 
         On failure, throws an exception or returns YAudioIn.SIGNAL_INVALID.
         """
-        if self._cacheExpiration <= YAPI.GetTickCount():
-            if self.load(YAPI.DefaultCacheValidity) != YAPI.SUCCESS:
+        if self._cacheExpired("signal"):
+            if self.load(self._cacheValidity()) != YAPI.SUCCESS:
                 return YAudioIn.SIGNAL_INVALID
         return self._signal
 
@@ -185,8 +185,8 @@ class YAudioIn(YFunction):
 
         On failure, throws an exception or returns YAudioIn.NOSIGNALFOR_INVALID.
         """
-        if self._cacheExpiration <= YAPI.GetTickCount():
-            if self.load(YAPI.DefaultCacheValidity) != YAPI.SUCCESS:
+        if self._cacheExpired("noSignalFor"):
+            if self.load(self._cacheValidity()) != YAPI.SUCCESS:
                 return YAudioIn.NOSIGNALFOR_INVALID
         return self._noSignalFor
 
@@ -103,8 +103,8 @@ class YAudioOut(YFunction):
 
         On failure, throws an exception or returns YAudioOut.VOLUME_INVALID.
         """
-        if self._cacheExpiration <= YAPI.GetTickCount():
-            if self.load(YAPI.DefaultCacheValidity) != YAPI.SUCCESS:
+        if self._cacheExpired("volume"):
+            if self.load(self._cacheValidity()) != YAPI.SUCCESS:
                 return YAudioOut.VOLUME_INVALID
         return self._volume
 
@@ -129,8 +129,8 @@ class YAudioOut(YFunction):
 
         On failure, throws an exception or returns YAudioOut.MUTE_INVALID.
         """
-        if self._cacheExpiration <= YAPI.GetTickCount():
-            if self.load(YAPI.DefaultCacheValidity) != YAPI.SUCCESS:
+        if self._cacheExpired("mute"):
+            if self.load(self._cacheValidity()) != YAPI.SUCCESS:
                 return YAudioOut.MUTE_INVALID
         return self._mute
 
@@ -159,8 +159,8 @@ class YAudioOut(YFunction):
 
         On failure, throws an exception or returns YAudioOut.VOLUMERANGE_INVALID.
         """
-        if self._cacheExpiration <= YAPI.GetTickCount():
-            if self.load(YAPI.DefaultCacheValidity) != YAPI.SUCCESS:
+        if self._cacheExpired("volumeRange"):
+            if self.load(self._cacheValidity()) != YAPI.SUCCESS:
                 return YAudioOut.VOLUMERANGE_INVALID
         return self._volumeRange
 
@@ -172,8 +172,8 @@ class YAudioOut(YFunction):
 
         On failure, throws an exception or returns YAudioOut.SIGNAL_INVALID.
         """
-        if self._cacheExpiration <= YAPI.GetTickCount():
-            if self.load(YAPI.DefaultCacheValidity) != YAPI.SUCCESS:
+        if self._cacheExpired("signal"):
+            if self.load(self._cacheValidity()) != YAPI.SUCCESS:
                 return YAudioOut.SIGNAL_INVALID
         return self._signal
 
@@ -185,8 +185,8 @@ class YAudioOut(YFunction):
 
         On failure, throws an exception or returns YAudioOut.NOSIGNALFOR_INVALID.
         """
-        if self._cacheExpiration <= YAPI.GetTickCount():
-            if self.load(YAPI.DefaultCacheValidity) != YAPI.SUCCESS:
+        if self._cacheExpired("noSignalFor"):
+            if self.load(self._cacheValidity()) != YAPI.SUCCESS:
                 return YAudioOut.NOSIGNALFOR_INVALID
         return self._noSignalFor
 
@@ -136,8 +136,8 @@ class YBluetoothLink(YFunction):
 
         On failure, throws an exception or returns YBluetoothLink.OWNADDRESS_INVALID.
         """
-        if self._cacheExpiration <= YAPI.GetTickCount():
-            if self.load(YAPI.DefaultCacheValidity) != YAPI.SUCCESS:
+        if self._cacheExpired("ownAddress"):
+            if self.load(self._cacheValidity()) != YAPI.SUCCESS:
                 return YBluetoothLink.OWNADDRESS_INVALID
         return self._ownAddress
 
@@ -153,8 +153,8 @@ class YBluetoothLink(YFunction):
 
         On failure, throws an exception or returns YBluetoothLink.PAIRINGPIN_INVALID.
         """
-        if self._cacheExpiration <= YAPI.GetTickCount():
-            if self.load(YAPI.DefaultCacheValidity) != YAPI.SUCCESS:
+        if self._cacheExpired("pairingPin"):
+            if self.load(self._cacheValidity()) != YAPI.SUCCESS:
                 return YBluetoothLink.PAIRINGPIN_INVALID
         return self._pairingPin
 
@@ -181,8 +181,8 @@ class YBluetoothLink(YFunction):
 
         On failure, throws an exception or returns YBluetoothLink.REMOTEADDRESS_INVALID.
         """
-        if self._cacheExpiration <= YAPI.GetTickCount():
-            if self.load(YAPI.DefaultCacheValidity) != YAPI.SUCCESS:
+        if self._cacheExpired("remoteAddress"):
+            if self.load(self._cacheValidity()) != YAPI.SUCCESS:
                 return YBluetoothLink.REMOTEADDRESS_INVALID
         return self._remoteAddress
 
@@ -207,8 +207,8 @@ class YBluetoothLink(YFunction):
 
         On failure, throws an exception or returns YBluetoothLink.REMOTENAME_INVALID.
         """
-        if self._cacheExpiration <= YAPI.GetTickCount():
-            if self.load(YAPI.DefaultCacheValidity) != YAPI.SUCCESS:
+        if self._cacheExpired("remoteName"):
+            if self.load(self._cacheValidity()) != YAPI.SUCCESS:
                 return YBluetoothLink.REMOTENAME_INVALID
         return self._remoteName
 
@@ -221,8 +221,8 @@ class YBluetoothLink(YFunction):
 
         On failure, throws an exception or returns YBluetoothLink.MUTE_INVALID.
         """
-        if self._cacheExpiration <= YAPI.GetTickCount():
-            if self.load(YAPI.DefaultCacheValidity) != YAPI.SUCCESS:
+        if self._cacheExpired("mute"):
+            if self.load(self._cacheValidity()) != YAPI.SUCCESS:
                 return YBluetoothLink.MUTE_INVALID
         return self._mute
 
@@ -249,8 +249,8 @@ class YBluetoothLink(YFunction):
 
         On failure, throws an exception or returns YBluetoothLink.PREAMPLIFIER_INVALID.
         """
-        if self._cacheExpiration <= YAPI.GetTickCount():
-            if self.load(YAPI.DefaultCacheValidity) != YAPI.SUCCESS:
+        if self._cacheExpired("preAmplifier"):
+            if self.load(self._cacheValidity()) != YAPI.SUCCESS:
                 return YBluetoothLink.PREAMPLIFIER_INVALID
         return self._preAmplifier
 
@@ -275,8 +275,8 @@ class YBluetoothLink(YFunction):
 
         On failure, throws an exception or returns YBluetoothLink.VOLUME_INVALID.
         """
-        if self._cacheExpiration <= YAPI.GetTickCount():
-            if self.load(YAPI.DefaultCacheValidity) != YAPI.SUCCESS:
+        if self._cacheExpired("volume"):
+            if self.load(self._cacheValidity()) != YAPI.SUCCESS:
                 return YBluetoothLink.VOLUME_INVALID
         return self._volume
 
@@ -303,8 +303,8 @@ class YBluetoothLink(YFunction):
 
         On failure, throws an exception or returns YBluetoothLink.LINKSTATE_INVALID.
         """
-        if self._cacheExpiration <= YAPI.GetTickCount():
-            if self.load(YAPI.DefaultCacheValidity) != YAPI.SUCCESS:
+        if self._cacheExpired("linkState"):
+            if self.load(self._cacheValidity()) != YAPI.SUCCESS:
                 return YBluetoothLink.LINKSTATE_INVALID
         return self._linkState
 
@@ -317,14 +317,14 @@ class YBluetoothLink(YFunction):
 
         On failure, throws an exception or returns YBluetoothLink.LINKQUALITY_INVALID.
         """
-        if self._cacheExpiration <= YAPI.GetTickCount():
-            if self.load(YAPI.DefaultCacheValidity) != YAPI.SUCCESS:
+        if self._cacheExpired("linkQuality"):
+            if self.load(self._cacheValidity()) != YAPI.SUCCESS:
                 return YBluetoothLink.LINKQUALITY_INVALID
         return self._linkQuality
 
     def get_command(self):
-        if self._cacheExpiration <= YAPI.GetTickCount():
-            if self.load(YAPI.DefaultCacheValidity) != YAPI.SUCCESS:
+        if self._cacheExpired("command"):
+            if self.load(self._cacheValidity()) != YAPI.SUCCESS:
                 return YBluetoothLink.COMMAND_INVALID
         return self._command
 
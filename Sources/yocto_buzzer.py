@@ -121,8 +121,8 @@ class YBuzzer(YFunction):
 
         On failure, throws an exception or returns YBuzzer.FREQUENCY_INVALID.
         """
-        if self._cacheExpiration <= YAPI.GetTickCount():
-            if self.load(YAPI.DefaultCacheValidity) != YAPI.SUCCESS:
+        if self._cacheExpired("frequency"):
+            if self.load(self._cacheValidity()) != YAPI.SUCCESS:
                 return YBuzzer.FREQUENCY_INVALID
         return self._frequency
 
@@ -134,8 +134,8 @@ class YBuzzer(YFunction):
 
         On failure, throws an exception or returns YBuzzer.VOLUME_INVALID.
         """
-        if self._cacheExpiration <= YAPI.GetTickCount():
-            if self.load(YAPI.DefaultCacheValidity) != YAPI.SUCCESS:
+        if self._cacheExpired("volume"):
+            if self.load(self._cacheValidity()) != YAPI.SUCCESS:
                 return YBuzzer.VOLUME_INVALID
         return self._volume
 
@@ -160,8 +160,8 @@ class YBuzzer(YFunction):
 
         On failure, throws an exception or returns YBuzzer.PLAYSEQSIZE_INVALID.
         """
-        if self._cacheExpiration <= YAPI.GetTickCount():
-            if self.load(YAPI.DefaultCacheValidity) != YAPI.SUCCESS:
+        if self._cacheExpired("playSeqSize"):
+            if self.load(self._cacheValidity()) != YAPI.SUCCESS:
                 return YBuzzer.PLAYSEQSIZE_INVALID
         return self._playSeqSize
 
@@ -173,8 +173,8 @@ class YBuzzer(YFunction):
 
         On failure, throws an exception or returns YBuzzer.PLAYSEQMAXSIZE_INVALID.
         """
-        if self._cacheExpiration == datetime.datetime.fromtimestamp(0):
-            if self.load(YAPI.DefaultCacheValidity) != YAPI.SUCCESS:
+        if self._cacheExpiration == 0:
+            if self.load(self._cacheValidity()) != YAPI.SUCCESS:
                 return YBuzzer.PLAYSEQMAXSIZE_INVALID
         return self._playSeqMaxSize
 
@@ -189,14 +189,14 @@ class YBuzzer(YFunction):
 
         On failure, throws an exception or returns YBuzzer.PLAYSEQSIGNATURE_INVALID.
         """
-        if self._cacheExpiration <= YAPI.GetTickCount():
-            if self.load(YAPI.DefaultCacheValidity) != YAPI.SUCCESS:
+        if self._cacheExpired("playSeqSignature"):
+            if self.load(self._cacheValidity()) != YAPI.SUCCESS:
                 return YBuzzer.PLAYSEQSIGNATURE_INVALID
         return self._playSeqSignature
 
     def get_command(self):
-        if self._cacheExpiration <= YAPI.GetTickCount():
-            if self.load(YAPI.DefaultCacheValidity) != YAPI.SUCCESS:
+        if self._cacheExpired("command"):
+            if self.load(self._cacheValidity()) != YAPI.SUCCESS:
                 return YBuzzer.COMMAND_INVALID
         return self._command
 
@@ -237,7 +237,7 @@ class YBuzzer(YFunction):
         return obj
 
     def sendCommand(self, command):
-        # //may throw an exception
+        # //may throw an exception
                 return self.set_command(command)
 
     def addFreqMoveToPlaySeq(self, freq, msDelay):
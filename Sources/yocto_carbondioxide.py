@@ -90,8 +90,8 @@ class YCarbonDioxide(YSensor):
 
         On failure, throws an exception or returns YCarbonDioxide.ABCPERIOD_INVALID.
         """
-        if self._cacheExpiration <= YAPI.GetTickCount():
-            if self.load(YAPI.DefaultCacheValidity) != YAPI.SUCCESS:
+        if self._cacheExpired("abcPeriod"):
+            if self.load(self._cacheValidity()) != YAPI.SUCCESS:
                 return YCarbonDioxide.ABCPERIOD_INVALID
         return self._abcPeriod
 
@@ -113,8 +113,8 @@ class YCarbonDioxide(YSensor):
         return self._setAttr("abcPeriod", rest_val)
 
     def get_command(self):
-        if self._cacheExpiration <= YAPI.GetTickCount():
-            if self.load(YAPI.DefaultCacheValidity) != YAPI.SUCCESS:
+        if self._cacheExpired("command"):
+            if self.load(self._cacheValidity()) != YAPI.SUCCESS:
                 return YCarbonDioxide.COMMAND_INVALID
         return self._command
 
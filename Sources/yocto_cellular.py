@@ -192,8 +192,8 @@ class YCellular(YFunction):
 
         On failure, throws an exception or returns YCellular.LINKQUALITY_INVALID.
         """
-        if self._cacheExpiration <= YAPI.GetTickCount():
-            if self.load(YAPI.DefaultCacheValidity) != YAPI.SUCCESS:
+        if self._cacheExpired("linkQuality"):
+            if self.load(self._cacheValidity()) != YAPI.SUCCESS:
                 return YCellular.LINKQUALITY_INVALID
         return self._linkQuality
 
@@ -205,8 +205,8 @@ class YCellular(YFunction):
 
         On failure, throws an exception or returns YCellular.CELLOPERATOR_INVALID.
         """
-        if self._cacheExpiration <= YAPI.GetTickCount():
-            if self.load(YAPI.DefaultCacheValidity) != YAPI.SUCCESS:
+        if self._cacheExpired("cellOperator"):
+            if self.load(self._cacheValidity()) != YAPI.SUCCESS:
                 return YCellular.CELLOPERATOR_INVALID
         return self._cellOperator
 
@@ -219,8 +219,8 @@ class YCellular(YFunction):
 
         On failure, throws an exception or returns YCellular.CELLIDENTIFIER_INVALID.
         """
-        if self._cacheExpiration <= YAPI.GetTickCount():
-            if self.load(YAPI.DefaultCacheValidity) != YAPI.SUCCESS:
+        if self._cacheExpired("cellIdentifier"):
+            if self.load(self._cacheValidity()) != YAPI.SUCCESS:
                 return YCellular.CELLIDENTIFIER_INVALID
         return self._cellIdentifier
 
@@ -236,8 +236,8 @@ class YCellular(YFunction):
 
         On failure, throws an exception or returns YCellular.IMSI_INVALID.
         """
-        if self._cacheExpiration <= YAPI.GetTickCount():
-            if self.load(YAPI.DefaultCacheValidity) != YAPI.SUCCESS:
+        if self._cacheExpired("imsi"):
+            if self.load(self._cacheValidity()) != YAPI.SUCCESS:
                 return YCellular.IMSI_INVALID
         return self._imsi
 
@@ -249,8 +249,8 @@ class YCellular(YFunction):
 
         On failure, throws an exception or returns YCellular.MESSAGE_INVALID.
         """
-        if self._cacheExpiration <= YAPI.GetTickCount():
-            if self.load(YAPI.DefaultCacheValidity) != YAPI.SUCCESS:
+        if self._cacheExpired("message"):
+            if self.load(self._cacheValidity()) != YAPI.SUCCESS:
                 return YCellular.MESSAGE_INVALID
         return self._message
 
@@ -266,8 +266,8 @@ class YCellular(YFunction):
 
         On failure, throws an exception or returns YCellular.PIN_INVALID.
         """
-        if self._cacheExpiration <= YAPI.GetTickCount():
-            if self.load(YAPI.DefaultCacheValidity) != YAPI.SUCCESS:
+        if self._cacheExpired("pin"):
+            if self.load(self._cacheValidity()) != YAPI.SUCCESS:
                 return YCellular.PIN_INVALID
         return self._pin
 
@@ -306,8 +306,8 @@ class YCellular(YFunction):
 
         On failure, throws an exception or returns YCellular.LOCKEDOPERATOR_INVALID.
         """
-        if self._cacheExpiration <= YAPI.GetTickCount():
-            if self.load(YAPI.DefaultCacheValidity) != YAPI.SUCCESS:
+        if self._cacheExpired("lockedOperator"):
+            if self.load(self._cacheValidity()) != YAPI.SUCCESS:
                 return YCellular.LOCKEDOPERATOR_INVALID
         return self._lockedOperator
 
@@ -336,8 +336,8 @@ class YCellular(YFunction):
 
         On failure, throws an exception or returns YCellular.ENABLEDATA_INVALID.
         """
-        if self._cacheExpiration <= YAPI.GetTickCount():
-            if self.load(YAPI.DefaultCacheValidity) != YAPI.SUCCESS:
+        if self._cacheExpired("enableData"):
+            if self.load(self._cacheValidity()) != YAPI.SUCCESS:
                 return YCellular.ENABLEDATA_INVALID
         return self._enableData
 
@@ -369,8 +369,8 @@ class YCellular(YFunction):
 
         On failure, throws an exception or returns YCellular.APN_INVALID.
         """
-        if self._cacheExpiration <= YAPI.GetTickCount():
-            if self.load(YAPI.DefaultCacheValidity) != YAPI.SUCCESS:
+        if self._cacheExpired("apn"):
+            if self.load(self._cacheValidity()) != YAPI.SUCCESS:
                 return YCellular.APN_INVALID
         return self._apn
 
@@ -399,8 +399,8 @@ class YCellular(YFunction):
 
         On failure, throws an exception or returns YCellular.APNSECRET_INVALID.
         """
-        if self._cacheExpiration <= YAPI.GetTickCount():
-            if self.load(YAPI.DefaultCacheValidity) != YAPI.SUCCESS:
+        if self._cacheExpired("apnSecret"):
+            if self.load(self._cacheValidity()) != YAPI.SUCCESS:
                 return YCellular.APNSECRET_INVALID
         return self._apnSecret
 
@@ -409,8 +409,8 @@ class YCellular(YFunction):
         return self._setAttr("apnSecret", rest_val)
 
     def get_command(self):
-        if self._cacheExpiration <= YAPI.GetTickCount():
-            if self.load(YAPI.DefaultCacheValidity) != YAPI.SUCCESS:
+        if self._cacheExpired("command"):
+            if self.load(self._cacheValidity()) != YAPI.SUCCESS:
                 return YCellular.COMMAND_INVALID
         return self._command
 
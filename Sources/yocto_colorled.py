@@ -144,8 +144,8 @@ class YColorLed(YFunction):
 
         On failure, throws an exception or returns YColorLed.RGBCOLOR_INVALID.
         """
-        if self._cacheExpiration <= YAPI.GetTickCount():
-            if self.load(YAPI.DefaultCacheValidity) != YAPI.SUCCESS:
+        if self._cacheExpired("rgbColor"):
+            if self.load(self._cacheValidity()) != YAPI.SUCCESS:
                 return YColorLed.RGBCOLOR_INVALID
         return self._rgbColor
 
@@ -170,8 +170,8 @@ class YColorLed(YFunction):
 
         On failure, throws an exception or returns YColorLed.HSLCOLOR_INVALID.
         """
-        if self._cacheExpiration <= YAPI.GetTickCount():
-            if self.load(YAPI.DefaultCacheValidity) != YAPI.SUCCESS:
+        if self._cacheExpired("hslColor"):
+            if self.load(self._cacheValidity()) != YAPI.SUCCESS:
                 return YColorLed.HSLCOLOR_INVALID
         return self._hslColor
 
@@ -189,8 +189,8 @@ class YColorLed(YFunction):
         return self._setAttr("hslColor", rest_val)
 
     def get_rgbMove(self):
-        if self._cacheExpiration <= YAPI.GetTickCount():
-            if self.load(YAPI.DefaultCacheValidity) != YAPI.SUCCESS:
+        if self._cacheExpired("rgbMove"):
+            if self.load(self._cacheValidity()) != YAPI.SUCCESS:
                 return YColorLed.RGBMOVE_INVALID
         return self._rgbMove
 
@@ -213,8 +213,8 @@ class YColorLed(YFunction):
         return self._setAttr("rgbMove", rest_val)
 
     def get_hslMove(self):
-        if self._cacheExpiration <= YAPI.GetTickCount():
-            if self.load(YAPI.DefaultCacheValidity) != YAPI.SUCCESS:
+        if self._cacheExpired("hslMove"):
+            if self.load(self._cacheValidity()) != YAPI.SUCCESS:
                 return YColorLed.HSLMOVE_INVALID
         return self._hslMove
 
@@ -244,8 +244,8 @@ class YColorLed(YFunction):
 
         On failure, throws an exception or returns YColorLed.RGBCOLORATPOWERON_INVALID.
         """
-        if self._cacheExpiration <= YAPI.GetTickCount():
-            if self.load(YAPI.DefaultCacheValidity) != YAPI.SUCCESS:
+        if self._cacheExpired("rgbColorAtPowerOn"):
+            if self.load(self._cacheValidity()) != YAPI.SUCCESS:
                 return YColorLed.RGBCOLORATPOWERON_INVALID
         return self._rgbColorAtPowerOn
 
@@ -271,8 +271,8 @@ class YColorLed(YFunction):
 
         On failure, throws an exception or returns YColorLed.BLINKSEQSIZE_INVALID.
         """
-        if self._cacheExpiration <= YAPI.GetTickCount():
-            if self.load(YAPI.DefaultCacheValidity) != YAPI.SUCCESS:
+        if self._cacheExpired("blinkSeqSize"):
+            if self.load(self._cacheValidity()) != YAPI.SUCCESS:
                 return YColorLed.BLINKSEQSIZE_INVALID
         return self._blinkSeqSize
 
@@ -284,8 +284,8 @@ class YColorLed(YFunction):
 
         On failure, throws an exception or returns YColorLed.BLINKSEQMAXSIZE_INVALID.
         """
-        if self._cacheExpiration == datetime.datetime.fromtimestamp(0):
-            if self.load(YAPI.DefaultCacheValidity) != YAPI.SUCCESS:
+        if self._cacheExpiration == 0:
+            if self.load(self._cacheValidity()) != YAPI.SUCCESS:
                 return YColorLed.BLINKSEQMAXSIZE_INVALID
         return self._blinkSeqMaxSize
 
@@ -300,14 +300,14 @@ class YColorLed(YFunction):
 
         On failure, throws an exception or returns YColorLed.BLINKSEQSIGNATURE_INVALID.
         """
-        if self._cacheExpiration <= YAPI.GetTickCount():
-            if self.load(YAPI.DefaultCacheValidity) != YAPI.SUCCESS:
+        if self._cacheExpired("blinkSeqSignature"):
+            if self.load(self._cacheValidity()) != YAPI.SUCCESS:
                 return YColorLed.BLINKSEQSIGNATURE_INVALID
         return self._blinkSeqSignature
 
     def get_command(self):
-        if self._cacheExpiration <= YAPI.GetTickCount():
-            if self.load(YAPI.DefaultCacheValidity) != YAPI.SUCCESS:
+        if self._cacheExpired("command"):
+            if self.load(self._cacheValidity()) != YAPI.SUCCESS:
                 return YColorLed.COMMAND_INVALID
         return self._command
 
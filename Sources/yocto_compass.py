@@ -90,8 +90,8 @@ class YCompass(YSensor):
         super(YCompass, self)._parseAttr(member)
 
     def get_axis(self):
-        if self._cacheExpiration <= YAPI.GetTickCount():
-            if self.load(YAPI.DefaultCacheValidity) != YAPI.SUCCESS:
+        if self._cacheExpired("axis"):
+            if self.load(self._cacheValidity()) != YAPI.SUCCESS:
                 return YCompass.AXIS_INVALID
         return self._axis
 
@@ -103,8 +103,8 @@ class YCompass(YSensor):
 
         On failure, throws an exception or returns YCompass.MAGNETICHEADING_INVALID.
         """
-        if self._cacheExpiration <= YAPI.GetTickCount():
-            if self.load(YAPI.DefaultCacheValidity) != YAPI.SUCCESS:
+        if self._cacheExpired("magneticHeading"):
+            if self.load(self._cacheValidity()) != YAPI.SUCCESS:
                 return YCompass.MAGNETICHEADING_INVALID
         return self._magneticHeading
 
@@ -115,14 +115,14 @@ class YCurrentLoopOutput(YFunction):
 
         On failure, throws an exception or returns YCurrentLoopOutput.CURRENT_INVALID.
         """
-        if self._cacheExpiration <= YAPI.GetTickCount():
-            if self.load(YAPI.DefaultCacheValidity) != YAPI.SUCCESS:
+        if self._cacheExpired("current"):
+            if self.load(self._cacheValidity()) != YAPI.SUCCESS:
                 return YCurrentLoopOutput.CURRENT_INVALID
         return self._current
 
     def get_currentTransition(self):
-        if self._cacheExpiration <= YAPI.GetTickCount():
-            if self.load(YAPI.DefaultCacheValidity) != YAPI.SUCCESS:
+        if self._cacheExpired("currentTransition"):
+            if self.load(self._cacheValidity()) != YAPI.SUCCESS:
                 return YCurrentLoopOutput.CURRENTTRANSITION_INVALID
         return self._currentTransition
 
@@ -152,8 +152,8 @@ class YCurrentLoopOutput(YFunction):
 
         On failure, throws an exception or returns YCurrentLoopOutput.CURRENTATSTARTUP_INVALID.
         """
-        if self._cacheExpiration <= YAPI.GetTickCount():
-            if self.load(YAPI.DefaultCacheValidity) != YAPI.SUCCESS:
+        if self._cacheExpired("currentAtStartUp"):
+            if self.load(self._cacheValidity()) != YAPI.SUCCESS:
                 return YCurrentLoopOutput.CURRENTATSTARTUP_INVALID
         return self._currentAtStartUp
 
@@ -168,8 +168,8 @@ class YCurrentLoopOutput(YFunction):
 
         On failure, throws an exception or returns YCurrentLoopOutput.LOOPPOWER_INVALID.
         """
-        if self._cacheExpiration <= YAPI.GetTickCount():
-            if self.load(YAPI.DefaultCacheValidity) != YAPI.SUCCESS:
+        if self._cacheExpired("loopPower"):
+            if self.load(self._cacheValidity()) != YAPI.SUCCESS:
                 return YCurrentLoopOutput.LOOPPOWER_INVALID
         return self._loopPower
 
@@ -222,7 +222,7 @@ class YCurrentLoopOutput(YFunction):
         if mA_target > 21.0:
             mA_target = 21.0
         newval = "" + str(int(round(mA_target*1000))) + ":" + str(int(ms_duration))
-        # // may throw an exception
+        # // may throw an exception
         return self.set_currentTransition(newval)
 
     def nextCurrentLoopOutput(self):
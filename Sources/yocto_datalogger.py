@@ -38,6 +38,7 @@
 #*********************************************************************/
 
 __docformat__ = 'restructuredtext en'
+import array
 from yocto_api import *
 
 
@@ -119,8 +120,8 @@ class YDataLogger(YFunction):
 
         On failure, throws an exception or returns YDataLogger.CURRENTRUNINDEX_INVALID.
         """
-        if self._cacheExpiration <= YAPI.GetTickCount():
-            if self.load(YAPI.DefaultCacheValidity) != YAPI.SUCCESS:
+        if self._cacheExpired("currentRunIndex"):
+            if self.load(self._cacheValidity()) != YAPI.SUCCESS:
                 return YDataLogger.CURRENTRUNINDEX_INVALID
         return self._currentRunIndex
 
@@ -132,8 +133,8 @@ class YDataLogger(YFunction):
 
         On failure, throws an exception or returns YDataLogger.TIMEUTC_INVALID.
         """
-        if self._cacheExpiration <= YAPI.GetTickCount():
-            if self.load(YAPI.DefaultCacheValidity) != YAPI.SUCCESS:
+        if self._cacheExpired("timeUTC"):
+            if self.load(self._cacheValidity()) != YAPI.SUCCESS:
                 return YDataLogger.TIMEUTC_INVALID
         return self._timeUTC
 
@@ -159,8 +160,8 @@ class YDataLogger(YFunction):
 
         On failure, throws an exception or returns YDataLogger.RECORDING_INVALID.
         """
-        if self._cacheExpiration <= YAPI.GetTickCount():
-            if self.load(YAPI.DefaultCacheValidity) != YAPI.SUCCESS:
+        if self._cacheExpired("recording"):
+            if self.load(self._cacheValidity()) != YAPI.SUCCESS:
                 return YDataLogger.RECORDING_INVALID
         return self._recording
 
@@ -188,8 +189,8 @@ class YDataLogger(YFunction):
 
         On failure, throws an exception or returns YDataLogger.AUTOSTART_INVALID.
         """
-        if self._cacheExpiration <= YAPI.GetTickCount():
-            if self.load(YAPI.DefaultCacheValidity) != YAPI.SUCCESS:
+        if self._cacheExpired("autoStart"):
+            if self.load(self._cacheValidity()) != YAPI.SUCCESS:
                 return YDataLogger.AUTOSTART_INVALID
         return self._autoStart
 
@@ -217,8 +218,8 @@ class YDataLogger(YFunction):
 
         On failure, throws an exception or returns YDataLogger.BEACONDRIVEN_INVALID.
         """
-        if self._cacheExpiration <= YAPI.GetTickCount():
-            if self.load(YAPI.DefaultCacheValidity) != YAPI.SUCCESS:
+        if self._cacheExpired("beaconDriven"):
+            if self.load(self._cacheValidity()) != YAPI.SUCCESS:
                 return YDataLogger.BEACONDRIVEN_INVALID
         return self._beaconDriven
 
@@ -239,8 +240,8 @@ class YDataLogger(YFunction):
         return self._setAttr("beaconDriven", rest_val)
 
     def get_clearHistory(self):
-        if self._cacheExpiration <= YAPI.GetTickCount():
-            if self.load(YAPI.DefaultCacheValidity) != YAPI.SUCCESS:
+        if self._cacheExpired("clearHistory"):
+            if self.load(self._cacheValidity()) != YAPI.SUCCESS:
                 return YDataLogger.CLEARHISTORY_INVALID
         return self._clearHistory
 
@@ -518,7 +519,8 @@ class YOldDataStream(YDataStream):
         self._nRows = 0
         self._nCols = 0
         del self._columnNames[:]
-        self._values = [[]]
+        # values are stored by column, _values is a view by row over _columns
+        del self._columns[:]
         root = jsonRef.value.GetRootNode()
         for i in range(len(root.members)):
             el = root.members[i]
@@ -599,16 +601,18 @@ class YOldDataStream(YDataStream):
                     for j in range(count):
                         tmp = int(el.items[j].ivalue)
                         udat.append(tmp)
-                self._values = [[0] * self._nCols] * self._nRows
+                columns = [[] for j in range(self._nCols)]
                 for uval in udat:
                     if coltype[x] < 2:
                         value = (uval + colofs[x]) * colscl[x]
                     else:
                         #noinspection PyProtectedMember
                         value = YAPI._decimalToDouble(uval - 32767)
-                    self._values[y][x] = value
+                    columns[x].append(value)
                     x += 1
                     if x == self._nCols:
                         x = 0
                         y += 1
+                # a trailing partial row is dropped
+                self._columns[:] = [array.array('d', col[:y]) for col in columns]
         return YAPI.SUCCESS
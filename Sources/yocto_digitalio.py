@@ -117,8 +117,8 @@ class YDigitalIO(YFunction):
 
         On failure, throws an exception or returns YDigitalIO.PORTSTATE_INVALID.
         """
-        if self._cacheExpiration <= YAPI.GetTickCount():
-            if self.load(YAPI.DefaultCacheValidity) != YAPI.SUCCESS:
+        if self._cacheExpired("portState"):
+            if self.load(self._cacheValidity()) != YAPI.SUCCESS:
                 return YDigitalIO.PORTSTATE_INVALID
         return self._portState
 
@@ -145,8 +145,8 @@ class YDigitalIO(YFunction):
 
         On failure, throws an exception or returns YDigitalIO.PORTDIRECTION_INVALID.
         """
-        if self._cacheExpiration <= YAPI.GetTickCount():
-            if self.load(YAPI.DefaultCacheValidity) != YAPI.SUCCESS:
+        if self._cacheExpired("portDirection"):
+            if self.load(self._cacheValidity()) != YAPI.SUCCESS:
                 return YDigitalIO.PORTDIRECTION_INVALID
         return self._portDirection
 
@@ -175,8 +175,8 @@ class YDigitalIO(YFunction):
 
         On failure, throws an exception or returns YDigitalIO.PORTOPENDRAIN_INVALID.
         """
-        if self._cacheExpiration <= YAPI.GetTickCount():
-            if self.load(YAPI.DefaultCacheValidity) != YAPI.SUCCESS:
+        if self._cacheExpired("portOpenDrain"):
+            if self.load(self._cacheValidity()) != YAPI.SUCCESS:
                 return YDigitalIO.PORTOPENDRAIN_INVALID
         return self._portOpenDrain
 
@@ -204,8 +204,8 @@ class YDigitalIO(YFunction):
 
         On failure, throws an exception or returns YDigitalIO.PORTPOLARITY_INVALID.
         """
-        if self._cacheExpiration <= YAPI.GetTickCount():
-            if self.load(YAPI.DefaultCacheValidity) != YAPI.SUCCESS:
+        if self._cacheExpired("portPolarity"):
+            if self.load(self._cacheValidity()) != YAPI.SUCCESS:
                 return YDigitalIO.PORTPOLARITY_INVALID
         return self._portPolarity
 
@@ -232,8 +232,8 @@ class YDigitalIO(YFunction):
 
         On failure, throws an exception or returns YDigitalIO.PORTSIZE_INVALID.
         """
-        if self._cacheExpiration <= YAPI.GetTickCount():
-            if self.load(YAPI.DefaultCacheValidity) != YAPI.SUCCESS:
+        if self._cacheExpired("portSize"):
+            if self.load(self._cacheValidity()) != YAPI.SUCCESS:
                 return YDigitalIO.PORTSIZE_INVALID
         return self._portSize
 
@@ -246,8 +246,8 @@ class YDigitalIO(YFunction):
 
         On failure, throws an exception or returns YDigitalIO.OUTPUTVOLTAGE_INVALID.
         """
-        if self._cacheExpiration <= YAPI.GetTickCount():
-            if self.load(YAPI.DefaultCacheValidity) != YAPI.SUCCESS:
+        if self._cacheExpired("outputVoltage"):
+            if self.load(self._cacheValidity()) != YAPI.SUCCESS:
                 return YDigitalIO.OUTPUTVOLTAGE_INVALID
         return self._outputVoltage
 
@@ -267,8 +267,8 @@ class YDigitalIO(YFunction):
         return self._setAttr("outputVoltage", rest_val)
 
     def get_command(self):
-        if self._cacheExpiration <= YAPI.GetTickCount():
-            if self.load(YAPI.DefaultCacheValidity) != YAPI.SUCCESS:
+        if self._cacheExpired("command"):
+            if self.load(self._cacheValidity()) != YAPI.SUCCESS:
                 return YDigitalIO.COMMAND_INVALID
         return self._command
 
@@ -639,8 +639,8 @@ class YDisplay(YFunction):
 
         On failure, throws an exception or returns YDisplay.ENABLED_INVALID.
         """
-        if self._cacheExpiration <= YAPI.GetTickCount():
-            if self.load(YAPI.DefaultCacheValidity) != YAPI.SUCCESS:
+        if self._cacheExpired("enabled"):
+            if self.load(self._cacheValidity()) != YAPI.SUCCESS:
                 return YDisplay.ENABLED_INVALID
         return self._enabled
 
@@ -666,8 +666,8 @@ class YDisplay(YFunction):
 
         On failure, throws an exception or returns YDisplay.STARTUPSEQ_INVALID.
         """
-        if self._cacheExpiration <= YAPI.GetTickCount():
-            if self.load(YAPI.DefaultCacheValidity) != YAPI.SUCCESS:
+        if self._cacheExpired("startupSeq"):
+            if self.load(self._cacheValidity()) != YAPI.SUCCESS:
                 return YDisplay.STARTUPSEQ_INVALID
         return self._startupSeq
 
@@ -694,8 +694,8 @@ class YDisplay(YFunction):
 
         On failure, throws an exception or returns YDisplay.BRIGHTNESS_INVALID.
         """
-        if self._cacheExpiration <= YAPI.GetTickCount():
-            if self.load(YAPI.DefaultCacheValidity) != YAPI.SUCCESS:
+        if self._cacheExpired("brightness"):
+            if self.load(self._cacheValidity()) != YAPI.SUCCESS:
                 return YDisplay.BRIGHTNESS_INVALID
         return self._brightness
 
@@ -724,8 +724,8 @@ class YDisplay(YFunction):
 
         On failure, throws an exception or returns YDisplay.ORIENTATION_INVALID.
         """
-        if self._cacheExpiration <= YAPI.GetTickCount():
-            if self.load(YAPI.DefaultCacheValidity) != YAPI.SUCCESS:
+        if self._cacheExpired("orientation"):
+            if self.load(self._cacheValidity()) != YAPI.SUCCESS:
                 return YDisplay.ORIENTATION_INVALID
         return self._orientation
 
@@ -752,8 +752,8 @@ class YDisplay(YFunction):
 
         On failure, throws an exception or returns YDisplay.DISPLAYWIDTH_INVALID.
         """
-        if self._cacheExpiration <= YAPI.GetTickCount():
-            if self.load(YAPI.DefaultCacheValidity) != YAPI.SUCCESS:
+        if self._cacheExpired("displayWidth"):
+            if self.load(self._cacheValidity()) != YAPI.SUCCESS:
                 return YDisplay.DISPLAYWIDTH_INVALID
         return self._displayWidth
 
@@ -765,8 +765,8 @@ class YDisplay(YFunction):
 
         On failure, throws an exception or returns YDisplay.DISPLAYHEIGHT_INVALID.
         """
-        if self._cacheExpiration <= YAPI.GetTickCount():
-            if self.load(YAPI.DefaultCacheValidity) != YAPI.SUCCESS:
+        if self._cacheExpired("displayHeight"):
+            if self.load(self._cacheValidity()) != YAPI.SUCCESS:
                 return YDisplay.DISPLAYHEIGHT_INVALID
         return self._displayHeight
 
@@ -779,8 +779,8 @@ class YDisplay(YFunction):
 
         On failure, throws an exception or returns YDisplay.DISPLAYTYPE_INVALID.
         """
-        if self._cacheExpiration == datetime.datetime.fromtimestamp(0):
-            if self.load(YAPI.DefaultCacheValidity) != YAPI.SUCCESS:
+        if self._cacheExpiration == 0:
+            if self.load(self._cacheValidity()) != YAPI.SUCCESS:
                 return YDisplay.DISPLAYTYPE_INVALID
         return self._displayType
 
@@ -792,8 +792,8 @@ class YDisplay(YFunction):
 
         On failure, throws an exception or returns YDisplay.LAYERWIDTH_INVALID.
         """
-        if self._cacheExpiration == datetime.datetime.fromtimestamp(0):
-            if self.load(YAPI.DefaultCacheValidity) != YAPI.SUCCESS:
+        if self._cacheExpiration == 0:
+            if self.load(self._cacheValidity()) != YAPI.SUCCESS:
                 return YDisplay.LAYERWIDTH_INVALID
         return self._layerWidth
 
@@ -805,8 +805,8 @@ class YDisplay(YFunction):
 
         On failure, throws an exception or returns YDisplay.LAYERHEIGHT_INVALID.
         """
-        if self._cacheExpiration == datetime.datetime.fromtimestamp(0):
-            if self.load(YAPI.DefaultCacheValidity) != YAPI.SUCCESS:
+        if self._cacheExpiration == 0:
+            if self.load(self._cacheValidity()) != YAPI.SUCCESS:
                 return YDisplay.LAYERHEIGHT_INVALID
         return self._layerHeight
 
@@ -818,14 +818,14 @@ class YDisplay(YFunction):
 
         On failure, throws an exception or returns YDisplay.LAYERCOUNT_INVALID.
         """
-        if self._cacheExpiration == datetime.datetime.fromtimestamp(0):
-            if self.load(YAPI.DefaultCacheValidity) != YAPI.SUCCESS:
+        if self._cacheExpiration == 0:
+            if self.load(self._cacheValidity()) != YAPI.SUCCESS:
                 return YDisplay.LAYERCOUNT_INVALID
         return self._layerCount
 
     def get_command(self):
-        if self._cacheExpiration <= YAPI.GetTickCount():
-            if self.load(YAPI.DefaultCacheValidity) != YAPI.SUCCESS:
+        if self._cacheExpired("command"):
+            if self.load(self._cacheValidity()) != YAPI.SUCCESS:
                 return YDisplay.COMMAND_INVALID
         return self._command
 
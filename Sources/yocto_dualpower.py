@@ -104,8 +104,8 @@ class YDualPower(YFunction):
 
         On failure, throws an exception or returns YDualPower.POWERSTATE_INVALID.
         """
-        if self._cacheExpiration <= YAPI.GetTickCount():
-            if self.load(YAPI.DefaultCacheValidity) != YAPI.SUCCESS:
+        if self._cacheExpired("powerState"):
+            if self.load(self._cacheValidity()) != YAPI.SUCCESS:
                 return YDualPower.POWERSTATE_INVALID
         return self._powerState
 
@@ -119,8 +119,8 @@ class YDualPower(YFunction):
 
         On failure, throws an exception or returns YDualPower.POWERCONTROL_INVALID.
         """
-        if self._cacheExpiration <= YAPI.GetTickCount():
-            if self.load(YAPI.DefaultCacheValidity) != YAPI.SUCCESS:
+        if self._cacheExpired("powerControl"):
+            if self.load(self._cacheValidity()) != YAPI.SUCCESS:
                 return YDualPower.POWERCONTROL_INVALID
         return self._powerControl
 
@@ -147,8 +147,8 @@ class YDualPower(YFunction):
 
         On failure, throws an exception or returns YDualPower.EXTVOLTAGE_INVALID.
         """
-        if self._cacheExpiration <= YAPI.GetTickCount():
-            if self.load(YAPI.DefaultCacheValidity) != YAPI.SUCCESS:
+        if self._cacheExpired("extVoltage"):
+            if self.load(self._cacheValidity()) != YAPI.SUCCESS:
                 return YDualPower.EXTVOLTAGE_INVALID
         return self._extVoltage
 
@@ -127,8 +127,8 @@ class YFiles(YFunction):
 
         On failure, throws an exception or returns YFiles.FILESCOUNT_INVALID.
         """
-        if self._cacheExpiration <= YAPI.GetTickCount():
-            if self.load(YAPI.DefaultCacheValidity) != YAPI.SUCCESS:
+        if self._cacheExpired("filesCount"):
+            if self.load(self._cacheValidity()) != YAPI.SUCCESS:
                 return YFiles.FILESCOUNT_INVALID
         return self._filesCount
 
@@ -140,8 +140,8 @@ class YFiles(YFunction):
 
         On failure, throws an exception or returns YFiles.FREESPACE_INVALID.
         """
-        if self._cacheExpiration <= YAPI.GetTickCount():
-            if self.load(YAPI.DefaultCacheValidity) != YAPI.SUCCESS:
+        if self._cacheExpired("freeSpace"):
+            if self.load(self._cacheValidity()) != YAPI.SUCCESS:
                 return YFiles.FREESPACE_INVALID
         return self._freeSpace
 
@@ -129,8 +129,8 @@ class YGenericSensor(YSensor):
 
         On failure, throws an exception or returns YGenericSensor.SIGNALVALUE_INVALID.
         """
-        if self._cacheExpiration <= YAPI.GetTickCount():
-            if self.load(YAPI.DefaultCacheValidity) != YAPI.SUCCESS:
+        if self._cacheExpired("signalValue"):
+            if self.load(self._cacheValidity()) != YAPI.SUCCESS:
                 return YGenericSensor.SIGNALVALUE_INVALID
         return round(self._signalValue * 1000) / 1000
 
@@ -142,8 +142,8 @@ class YGenericSensor(YSensor):
 
         On failure, throws an exception or returns YGenericSensor.SIGNALUNIT_INVALID.
         """
-        if self._cacheExpiration == datetime.datetime.fromtimestamp(0):
-            if self.load(YAPI.DefaultCacheValidity) != YAPI.SUCCESS:
+        if self._cacheExpiration == 0:
+            if self.load(self._cacheValidity()) != YAPI.SUCCESS:
                 return YGenericSensor.SIGNALUNIT_INVALID
         return self._signalUnit
 
@@ -155,8 +155,8 @@ class YGenericSensor(YSensor):
 
         On failure, throws an exception or returns YGenericSensor.SIGNALRANGE_INVALID.
         """
-        if self._cacheExpiration <= YAPI.GetTickCount():
-            if self.load(YAPI.DefaultCacheValidity) != YAPI.SUCCESS:
+        if self._cacheExpired("signalRange"):
+            if self.load(self._cacheValidity()) != YAPI.SUCCESS:
                 return YGenericSensor.SIGNALRANGE_INVALID
         return self._signalRange
 
@@ -181,8 +181,8 @@ class YGenericSensor(YSensor):
 
         On failure, throws an exception or returns YGenericSensor.VALUERANGE_INVALID.
         """
-        if self._cacheExpiration <= YAPI.GetTickCount():
-            if self.load(YAPI.DefaultCacheValidity) != YAPI.SUCCESS:
+        if self._cacheExpired("valueRange"):
+            if self.load(self._cacheValidity()) != YAPI.SUCCESS:
                 return YGenericSensor.VALUERANGE_INVALID
         return self._valueRange
 
@@ -225,8 +225,8 @@ class YGenericSensor(YSensor):
 
         On failure, throws an exception or returns YGenericSensor.SIGNALBIAS_INVALID.
         """
-        if self._cacheExpiration <= YAPI.GetTickCount():
-            if self.load(YAPI.DefaultCacheValidity) != YAPI.SUCCESS:
+        if self._cacheExpired("signalBias"):
+            if self.load(self._cacheValidity()) != YAPI.SUCCESS:
                 return YGenericSensor.SIGNALBIAS_INVALID
         return self._signalBias
 
@@ -245,8 +245,8 @@ class YGenericSensor(YSensor):
 
         On failure, throws an exception or returns YGenericSensor.SIGNALSAMPLING_INVALID.
         """
-        if self._cacheExpiration <= YAPI.GetTickCount():
-            if self.load(YAPI.DefaultCacheValidity) != YAPI.SUCCESS:
+        if self._cacheExpired("signalSampling"):
+            if self.load(self._cacheValidity()) != YAPI.SUCCESS:
                 return YGenericSensor.SIGNALSAMPLING_INVALID
         return self._signalSampling
 
@@ -151,8 +151,8 @@ class YGps(YFunction):
 
         On failure, throws an exception or returns YGps.ISFIXED_INVALID.
         """
-        if self._cacheExpiration <= YAPI.GetTickCount():
-            if self.load(YAPI.DefaultCacheValidity) != YAPI.SUCCESS:
+        if self._cacheExpired("isFixed"):
+            if self.load(self._cacheValidity()) != YAPI.SUCCESS:
                 return YGps.ISFIXED_INVALID
         return self._isFixed
 
@@ -164,8 +164,8 @@ class YGps(YFunction):
 
         On failure, throws an exception or returns YGps.SATCOUNT_INVALID.
         """
-        if self._cacheExpiration <= YAPI.GetTickCount():
-            if self.load(YAPI.DefaultCacheValidity) != YAPI.SUCCESS:
+        if self._cacheExpired("satCount"):
+            if self.load(self._cacheValidity()) != YAPI.SUCCESS:
                 return YGps.SATCOUNT_INVALID
         return self._satCount
 
@@ -178,8 +178,8 @@ class YGps(YFunction):
 
         On failure, throws an exception or returns YGps.COORDSYSTEM_INVALID.
         """
-        if self._cacheExpiration <= YAPI.GetTickCount():
-            if self.load(YAPI.DefaultCacheValidity) != YAPI.SUCCESS:
+        if self._cacheExpired("coordSystem"):
+            if self.load(self._cacheValidity()) != YAPI.SUCCESS:
                 return YGps.COORDSYSTEM_INVALID
         return self._coordSystem
 
@@ -205,8 +205,8 @@ class YGps(YFunction):
 
         On failure, throws an exception or returns YGps.LATITUDE_INVALID.
         """
-        if self._cacheExpiration <= YAPI.GetTickCount():
-            if self.load(YAPI.DefaultCacheValidity) != YAPI.SUCCESS:
+        if self._cacheExpired("latitude"):
+            if self.load(self._cacheValidity()) != YAPI.SUCCESS:
                 return YGps.LATITUDE_INVALID
         return self._latitude
 
@@ -218,8 +218,8 @@ class YGps(YFunction):
 
         On failure, throws an exception or returns YGps.LONGITUDE_INVALID.
         """
-        if self._cacheExpiration <= YAPI.GetTickCount():
-            if self.load(YAPI.DefaultCacheValidity) != YAPI.SUCCESS:
+        if self._cacheExpired("longitude"):
+            if self.load(self._cacheValidity()) != YAPI.SUCCESS:
                 return YGps.LONGITUDE_INVALID
         return self._longitude
 
@@ -233,8 +233,8 @@ class YGps(YFunction):
 
         On failure, throws an exception or returns YGps.DILUTION_INVALID.
         """
-        if self._cacheExpiration <= YAPI.GetTickCount():
-            if self.load(YAPI.DefaultCacheValidity) != YAPI.SUCCESS:
+        if self._cacheExpired("dilution"):
+            if self.load(self._cacheValidity()) != YAPI.SUCCESS:
                 return YGps.DILUTION_INVALID
         return self._dilution
 
@@ -247,8 +247,8 @@ class YGps(YFunction):
 
         On failure, throws an exception or returns YGps.ALTITUDE_INVALID.
         """
-        if self._cacheExpiration <= YAPI.GetTickCount():
-            if self.load(YAPI.DefaultCacheValidity) != YAPI.SUCCESS:
+        if self._cacheExpired("altitude"):
+            if self.load(self._cacheValidity()) != YAPI.SUCCESS:
                 return YGps.ALTITUDE_INVALID
         return self._altitude
 
@@ -260,8 +260,8 @@ class YGps(YFunction):
 
         On failure, throws an exception or returns YGps.GROUNDSPEED_INVALID.
         """
-        if self._cacheExpiration <= YAPI.GetTickCount():
-            if self.load(YAPI.DefaultCacheValidity) != YAPI.SUCCESS:
+        if self._cacheExpired("groundSpeed"):
+            if self.load(self._cacheValidity()) != YAPI.SUCCESS:
                 return YGps.GROUNDSPEED_INVALID
         return self._groundSpeed
 
@@ -275,8 +275,8 @@ class YGps(YFunction):
 
         On failure, throws an exception or returns YGps.DIRECTION_INVALID.
         """
-        if self._cacheExpiration <= YAPI.GetTickCount():
-            if self.load(YAPI.DefaultCacheValidity) != YAPI.SUCCESS:
+        if self._cacheExpired("direction"):
+            if self.load(self._cacheValidity()) != YAPI.SUCCESS:
                 return YGps.DIRECTION_INVALID
         return self._direction
 
@@ -290,8 +290,8 @@ class YGps(YFunction):
 
         On failure, throws an exception or returns YGps.UNIXTIME_INVALID.
         """
-        if self._cacheExpiration <= YAPI.GetTickCount():
-            if self.load(YAPI.DefaultCacheValidity) != YAPI.SUCCESS:
+        if self._cacheExpired("unixTime"):
+            if self.load(self._cacheValidity()) != YAPI.SUCCESS:
                 return YGps.UNIXTIME_INVALID
         return self._unixTime
 
@@ -303,8 +303,8 @@ class YGps(YFunction):
 
         On failure, throws an exception or returns YGps.DATETIME_INVALID.
         """
-        if self._cacheExpiration <= YAPI.GetTickCount():
-            if self.load(YAPI.DefaultCacheValidity) != YAPI.SUCCESS:
+        if self._cacheExpired("dateTime"):
+            if self.load(self._cacheValidity()) != YAPI.SUCCESS:
                 return YGps.DATETIME_INVALID
         return self._dateTime
 
@@ -316,8 +316,8 @@ class YGps(YFunction):
 
         On failure, throws an exception or returns YGps.UTCOFFSET_INVALID.
         """
-        if self._cacheExpiration <= YAPI.GetTickCount():
-            if self.load(YAPI.DefaultCacheValidity) != YAPI.SUCCESS:
+        if self._cacheExpired("utcOffset"):
+            if self.load(self._cacheValidity()) != YAPI.SUCCESS:
                 return YGps.UTCOFFSET_INVALID
         return self._utcOffset
 
@@ -337,8 +337,8 @@ class YGps(YFunction):
         return self._setAttr("utcOffset", rest_val)
 
     def get_command(self):
-        if self._cacheExpiration <= YAPI.GetTickCount():
-            if self.load(YAPI.DefaultCacheValidity) != YAPI.SUCCESS:
+        if self._cacheExpired("command"):
+            if self.load(self._cacheValidity()) != YAPI.SUCCESS:
                 return YGps.COMMAND_INVALID
         return self._command
 
@@ -234,8 +234,8 @@ class YGyro(YSensor):
 
         On failure, throws an exception or returns YGyro.XVALUE_INVALID.
         """
-        if self._cacheExpiration <= YAPI.GetTickCount():
-            if self.load(YAPI.DefaultCacheValidity) != YAPI.SUCCESS:
+        if self._cacheExpired("xValue"):
+            if self.load(self._cacheValidity()) != YAPI.SUCCESS:
                 return YGyro.XVALUE_INVALID
         return self._xValue
 
@@ -248,8 +248,8 @@ class YGyro(YSensor):
 
         On failure, throws an exception or returns YGyro.YVALUE_INVALID.
         """
-        if self._cacheExpiration <= YAPI.GetTickCount():
-            if self.load(YAPI.DefaultCacheValidity) != YAPI.SUCCESS:
+        if self._cacheExpired("yValue"):
+            if self.load(self._cacheValidity()) != YAPI.SUCCESS:
                 return YGyro.YVALUE_INVALID
         return self._yValue
 
@@ -262,8 +262,8 @@ class YGyro(YSensor):
 
         On failure, throws an exception or returns YGyro.ZVALUE_INVALID.
         """
-        if self._cacheExpiration <= YAPI.GetTickCount():
-            if self.load(YAPI.DefaultCacheValidity) != YAPI.SUCCESS:
+        if self._cacheExpired("zValue"):
+            if self.load(self._cacheValidity()) != YAPI.SUCCESS:
                 return YGyro.ZVALUE_INVALID
         return self._zValue
 
@@ -302,7 +302,7 @@ class YGyro(YSensor):
     def _loadQuaternion(self):
         # now_stamp
         # age_ms
-        now_stamp = (YRelTickCount(YAPI.GetTickCount()) & (0x7FFFFFFF))
+        now_stamp = (YMonotonicTickCount() & (0x7FFFFFFF))
         age_ms = (((now_stamp - self._qt_stamp)) & (0x7FFFFFFF))
         if (age_ms >= 10) or (self._qt_stamp == 0):
             if self.load(10) != YAPI.SUCCESS:
@@ -553,7 +553,7 @@ class YGyro(YSensor):
             self._z = qtValue
         if qtIndex < 4:
             return 0
-        self._qt_stamp = (YRelTickCount(YAPI.GetTickCount()) & (0x7FFFFFFF))
+        self._qt_stamp = (YMonotonicTickCount() & (0x7FFFFFFF))
         if self._quatCallback is not None:
             self._quatCallback(self, self._w, self._x, self._y, self._z)
         if self._anglesCallback is not None:
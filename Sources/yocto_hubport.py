@@ -102,8 +102,8 @@ class YHubPort(YFunction):
 
         On failure, throws an exception or returns YHubPort.ENABLED_INVALID.
         """
-        if self._cacheExpiration <= YAPI.GetTickCount():
-            if self.load(YAPI.DefaultCacheValidity) != YAPI.SUCCESS:
+        if self._cacheExpired("enabled"):
+            if self.load(self._cacheValidity()) != YAPI.SUCCESS:
                 return YHubPort.ENABLED_INVALID
         return self._enabled
 
@@ -131,8 +131,8 @@ class YHubPort(YFunction):
 
         On failure, throws an exception or returns YHubPort.PORTSTATE_INVALID.
         """
-        if self._cacheExpiration <= YAPI.GetTickCount():
-            if self.load(YAPI.DefaultCacheValidity) != YAPI.SUCCESS:
+        if self._cacheExpired("portState"):
+            if self.load(self._cacheValidity()) != YAPI.SUCCESS:
                 return YHubPort.PORTSTATE_INVALID
         return self._portState
 
@@ -146,8 +146,8 @@ class YHubPort(YFunction):
 
         On failure, throws an exception or returns YHubPort.BAUDRATE_INVALID.
         """
-        if self._cacheExpiration <= YAPI.GetTickCount():
-            if self.load(YAPI.DefaultCacheValidity) != YAPI.SUCCESS:
+        if self._cacheExpired("baudRate"):
+            if self.load(self._cacheValidity()) != YAPI.SUCCESS:
                 return YHubPort.BAUDRATE_INVALID
         return self._baudRate
 
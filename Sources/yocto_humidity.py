@@ -107,8 +107,8 @@ class YHumidity(YSensor):
 
         On failure, throws an exception or returns YHumidity.RELHUM_INVALID.
         """
-        if self._cacheExpiration <= YAPI.GetTickCount():
-            if self.load(YAPI.DefaultCacheValidity) != YAPI.SUCCESS:
+        if self._cacheExpired("relHum"):
+            if self.load(self._cacheValidity()) != YAPI.SUCCESS:
                 return YHumidity.RELHUM_INVALID
         return self._relHum
 
@@ -120,8 +120,8 @@ class YHumidity(YSensor):
 
         On failure, throws an exception or returns YHumidity.ABSHUM_INVALID.
         """
-        if self._cacheExpiration <= YAPI.GetTickCount():
-            if self.load(YAPI.DefaultCacheValidity) != YAPI.SUCCESS:
+        if self._cacheExpired("absHum"):
+            if self.load(self._cacheValidity()) != YAPI.SUCCESS:
                 return YHumidity.ABSHUM_INVALID
         return self._absHum
 
@@ -101,8 +101,8 @@ class YLed(YFunction):
 
         On failure, throws an exception or returns YLed.POWER_INVALID.
         """
-        if self._cacheExpiration <= YAPI.GetTickCount():
-            if self.load(YAPI.DefaultCacheValidity) != YAPI.SUCCESS:
+        if self._cacheExpired("power"):
+            if self.load(self._cacheValidity()) != YAPI.SUCCESS:
                 return YLed.POWER_INVALID
         return self._power
 
@@ -127,8 +127,8 @@ class YLed(YFunction):
 
         On failure, throws an exception or returns YLed.LUMINOSITY_INVALID.
         """
-        if self._cacheExpiration <= YAPI.GetTickCount():
-            if self.load(YAPI.DefaultCacheValidity) != YAPI.SUCCESS:
+        if self._cacheExpired("luminosity"):
+            if self.load(self._cacheValidity()) != YAPI.SUCCESS:
                 return YLed.LUMINOSITY_INVALID
         return self._luminosity
 
@@ -154,8 +154,8 @@ class YLed(YFunction):
 
         On failure, throws an exception or returns YLed.BLINKING_INVALID.
         """
-        if self._cacheExpiration <= YAPI.GetTickCount():
-            if self.load(YAPI.DefaultCacheValidity) != YAPI.SUCCESS:
+        if self._cacheExpired("blinking"):
+            if self.load(self._cacheValidity()) != YAPI.SUCCESS:
                 return YLed.BLINKING_INVALID
         return self._blinking
 
@@ -115,8 +115,8 @@ class YLightSensor(YSensor):
 
         On failure, throws an exception or returns YLightSensor.MEASURETYPE_INVALID.
         """
-        if self._cacheExpiration <= YAPI.GetTickCount():
-            if self.load(YAPI.DefaultCacheValidity) != YAPI.SUCCESS:
+        if self._cacheExpired("measureType"):
+            if self.load(self._cacheValidity()) != YAPI.SUCCESS:
                 return YLightSensor.MEASURETYPE_INVALID
         return self._measureType
 
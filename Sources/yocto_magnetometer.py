@@ -100,8 +100,8 @@ class YMagnetometer(YSensor):
 
         On failure, throws an exception or returns YMagnetometer.XVALUE_INVALID.
         """
-        if self._cacheExpiration <= YAPI.GetTickCount():
-            if self.load(YAPI.DefaultCacheValidity) != YAPI.SUCCESS:
+        if self._cacheExpired("xValue"):
+            if self.load(self._cacheValidity()) != YAPI.SUCCESS:
                 return YMagnetometer.XVALUE_INVALID
         return self._xValue
 
@@ -114,8 +114,8 @@ class YMagnetometer(YSensor):
 
         On failure, throws an exception or returns YMagnetometer.YVALUE_INVALID.
         """
-        if self._cacheExpiration <= YAPI.GetTickCount():
-            if self.load(YAPI.DefaultCacheValidity) != YAPI.SUCCESS:
+        if self._cacheExpired("yValue"):
+            if self.load(self._cacheValidity()) != YAPI.SUCCESS:
                 return YMagnetometer.YVALUE_INVALID
         return self._yValue
 
@@ -128,8 +128,8 @@ class YMagnetometer(YSensor):
 
         On failure, throws an exception or returns YMagnetometer.ZVALUE_INVALID.
         """
-        if self._cacheExpiration <= YAPI.GetTickCount():
-            if self.load(YAPI.DefaultCacheValidity) != YAPI.SUCCESS:
+        if self._cacheExpired("zValue"):
+            if self.load(self._cacheValidity()) != YAPI.SUCCESS:
                 return YMagnetometer.ZVALUE_INVALID
         return self._zValue
 
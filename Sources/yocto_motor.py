@@ -146,8 +146,8 @@ class YMotor(YFunction):
 
         On failure, throws an exception or returns YMotor.MOTORSTATUS_INVALID.
         """
-        if self._cacheExpiration <= YAPI.GetTickCount():
-            if self.load(YAPI.DefaultCacheValidity) != YAPI.SUCCESS:
+        if self._cacheExpired("motorStatus"):
+            if self.load(self._cacheValidity()) != YAPI.SUCCESS:
                 return YMotor.MOTORSTATUS_INVALID
         return self._motorStatus
 
@@ -181,8 +181,8 @@ class YMotor(YFunction):
 
         On failure, throws an exception or returns YMotor.DRIVINGFORCE_INVALID.
         """
-        if self._cacheExpiration <= YAPI.GetTickCount():
-            if self.load(YAPI.DefaultCacheValidity) != YAPI.SUCCESS:
+        if self._cacheExpired("drivingForce"):
+            if self.load(self._cacheValidity()) != YAPI.SUCCESS:
                 return YMotor.DRIVINGFORCE_INVALID
         return self._drivingForce
 
@@ -211,8 +211,8 @@ class YMotor(YFunction):
 
         On failure, throws an exception or returns YMotor.BRAKINGFORCE_INVALID.
         """
-        if self._cacheExpiration <= YAPI.GetTickCount():
-            if self.load(YAPI.DefaultCacheValidity) != YAPI.SUCCESS:
+        if self._cacheExpired("brakingForce"):
+            if self.load(self._cacheValidity()) != YAPI.SUCCESS:
                 return YMotor.BRAKINGFORCE_INVALID
         return self._brakingForce
 
@@ -247,8 +247,8 @@ class YMotor(YFunction):
 
         On failure, throws an exception or returns YMotor.CUTOFFVOLTAGE_INVALID.
         """
-        if self._cacheExpiration <= YAPI.GetTickCount():
-            if self.load(YAPI.DefaultCacheValidity) != YAPI.SUCCESS:
+        if self._cacheExpired("cutOffVoltage"):
+            if self.load(self._cacheValidity()) != YAPI.SUCCESS:
                 return YMotor.CUTOFFVOLTAGE_INVALID
         return self._cutOffVoltage
 
@@ -262,8 +262,8 @@ class YMotor(YFunction):
 
         On failure, throws an exception or returns YMotor.OVERCURRENTLIMIT_INVALID.
         """
-        if self._cacheExpiration <= YAPI.GetTickCount():
-            if self.load(YAPI.DefaultCacheValidity) != YAPI.SUCCESS:
+        if self._cacheExpired("overCurrentLimit"):
+            if self.load(self._cacheValidity()) != YAPI.SUCCESS:
                 return YMotor.OVERCURRENTLIMIT_INVALID
         return self._overCurrentLimit
 
@@ -309,8 +309,8 @@ class YMotor(YFunction):
 
         On failure, throws an exception or returns YMotor.FREQUENCY_INVALID.
         """
-        if self._cacheExpiration <= YAPI.GetTickCount():
-            if self.load(YAPI.DefaultCacheValidity) != YAPI.SUCCESS:
+        if self._cacheExpired("frequency"):
+            if self.load(self._cacheValidity()) != YAPI.SUCCESS:
                 return YMotor.FREQUENCY_INVALID
         return self._frequency
 
@@ -325,8 +325,8 @@ class YMotor(YFunction):
 
         On failure, throws an exception or returns YMotor.STARTERTIME_INVALID.
         """
-        if self._cacheExpiration <= YAPI.GetTickCount():
-            if self.load(YAPI.DefaultCacheValidity) != YAPI.SUCCESS:
+        if self._cacheExpired("starterTime"):
+            if self.load(self._cacheValidity()) != YAPI.SUCCESS:
                 return YMotor.STARTERTIME_INVALID
         return self._starterTime
 
@@ -359,8 +359,8 @@ class YMotor(YFunction):
 
         On failure, throws an exception or returns YMotor.FAILSAFETIMEOUT_INVALID.
         """
-        if self._cacheExpiration <= YAPI.GetTickCount():
-            if self.load(YAPI.DefaultCacheValidity) != YAPI.SUCCESS:
+        if self._cacheExpired("failSafeTimeout"):
+            if self.load(self._cacheValidity()) != YAPI.SUCCESS:
                 return YMotor.FAILSAFETIMEOUT_INVALID
         return self._failSafeTimeout
 
@@ -383,8 +383,8 @@ class YMotor(YFunction):
         return self._setAttr("failSafeTimeout", rest_val)
 
     def get_command(self):
-        if self._cacheExpiration <= YAPI.GetTickCount():
-            if self.load(YAPI.DefaultCacheValidity) != YAPI.SUCCESS:
+        if self._cacheExpired("command"):
+            if self.load(self._cacheValidity()) != YAPI.SUCCESS:
                 return YMotor.COMMAND_INVALID
         return self._command
 
@@ -431,7 +431,7 @@ class YMotor(YFunction):
         is running properly. Otherwise, the motor is automatically stopped after the specified
         timeout. Calling a motor <i>set</i> function implicitely rearms the failsafe timer.
         """
-        # // may throw an exception
+        # // may throw an exception
         return self.set_command("K")
 
     def resetStatus(self):
@@ -439,7 +439,7 @@ class YMotor(YFunction):
         Reset the controller state to IDLE. This function must be invoked explicitely
         after any error condition is signaled.
         """
-        # // may throw an exception
+        # // may throw an exception
         return self.set_motorStatus(YMotor.MOTORSTATUS_IDLE)
 
     def drivingForceMove(self, targetPower, delay):
@@ -221,8 +221,8 @@ class YNetwork(YFunction):
 
         On failure, throws an exception or returns YNetwork.READINESS_INVALID.
         """
-        if self._cacheExpiration <= YAPI.GetTickCount():
-            if self.load(YAPI.DefaultCacheValidity) != YAPI.SUCCESS:
+        if self._cacheExpired("readiness"):
+            if self.load(self._cacheValidity()) != YAPI.SUCCESS:
                 return YNetwork.READINESS_INVALID
         return self._readiness
 
@@ -235,8 +235,8 @@ class YNetwork(YFunction):
 
         On failure, throws an exception or returns YNetwork.MACADDRESS_INVALID.
         """
-        if self._cacheExpiration == datetime.datetime.fromtimestamp(0):
-            if self.load(YAPI.DefaultCacheValidity) != YAPI.SUCCESS:
+        if self._cacheExpiration == 0:
+            if self.load(self._cacheValidity()) != YAPI.SUCCESS:
                 return YNetwork.MACADDRESS_INVALID
         return self._macAddress
 
@@ -249,8 +249,8 @@ class YNetwork(YFunction):
 
         On failure, throws an exception or returns YNetwork.IPADDRESS_INVALID.
         """
-        if self._cacheExpiration <= YAPI.GetTickCount():
-            if self.load(YAPI.DefaultCacheValidity) != YAPI.SUCCESS:
+        if self._cacheExpired("ipAddress"):
+            if self.load(self._cacheValidity()) != YAPI.SUCCESS:
                 return YNetwork.IPADDRESS_INVALID
         return self._ipAddress
 
@@ -262,8 +262,8 @@ class YNetwork(YFunction):
 
         On failure, throws an exception or returns YNetwork.SUBNETMASK_INVALID.
         """
-        if self._cacheExpiration <= YAPI.GetTickCount():
-            if self.load(YAPI.DefaultCacheValidity) != YAPI.SUCCESS:
+        if self._cacheExpired("subnetMask"):
+            if self.load(self._cacheValidity()) != YAPI.SUCCESS:
                 return YNetwork.SUBNETMASK_INVALID
         return self._subnetMask
 
@@ -275,14 +275,14 @@ class YNetwork(YFunction):
 
         On failure, throws an exception or returns YNetwork.ROUTER_INVALID.
         """
-        if self._cacheExpiration <= YAPI.GetTickCount():
-            if self.load(YAPI.DefaultCacheValidity) != YAPI.SUCCESS:
+        if self._cacheExpired("router"):
+            if self.load(self._cacheValidity()) != YAPI.SUCCESS:
                 return YNetwork.ROUTER_INVALID
         return self._router
 
     def get_ipConfig(self):
-        if self._cacheExpiration <= YAPI.GetTickCount():
-            if self.load(YAPI.DefaultCacheValidity) != YAPI.SUCCESS:
+        if self._cacheExpired("ipConfig"):
+            if self.load(self._cacheValidity()) != YAPI.SUCCESS:
                 return YNetwork.IPCONFIG_INVALID
         return self._ipConfig
 
@@ -298,8 +298,8 @@ class YNetwork(YFunction):
 
         On failure, throws an exception or returns YNetwork.PRIMARYDNS_INVALID.
         """
-        if self._cacheExpiration <= YAPI.GetTickCount():
-            if self.load(YAPI.DefaultCacheValidity) != YAPI.SUCCESS:
+        if self._cacheExpired("primaryDNS"):
+            if self.load(self._cacheValidity()) != YAPI.SUCCESS:
                 return YNetwork.PRIMARYDNS_INVALID
         return self._primaryDNS
 
@@ -326,8 +326,8 @@ class YNetwork(YFunction):
 
         On failure, throws an exception or returns YNetwork.SECONDARYDNS_INVALID.
         """
-        if self._cacheExpiration <= YAPI.GetTickCount():
-            if self.load(YAPI.DefaultCacheValidity) != YAPI.SUCCESS:
+        if self._cacheExpired("secondaryDNS"):
+            if self.load(self._cacheValidity()) != YAPI.SUCCESS:
                 return YNetwork.SECONDARYDNS_INVALID
         return self._secondaryDNS
 
@@ -354,8 +354,8 @@ class YNetwork(YFunction):
 
         On failure, throws an exception or returns YNetwork.NTPSERVER_INVALID.
         """
-        if self._cacheExpiration <= YAPI.GetTickCount():
-            if self.load(YAPI.DefaultCacheValidity) != YAPI.SUCCESS:
+        if self._cacheExpired("ntpServer"):
+            if self.load(self._cacheValidity()) != YAPI.SUCCESS:
                 return YNetwork.NTPSERVER_INVALID
         return self._ntpServer
 
@@ -383,8 +383,8 @@ class YNetwork(YFunction):
 
         On failure, throws an exception or returns YNetwork.USERPASSWORD_INVALID.
         """
-        if self._cacheExpiration <= YAPI.GetTickCount():
-            if self.load(YAPI.DefaultCacheValidity) != YAPI.SUCCESS:
+        if self._cacheExpired("userPassword"):
+            if self.load(self._cacheValidity()) != YAPI.SUCCESS:
                 return YNetwork.USERPASSWORD_INVALID
         return self._userPassword
 
@@ -415,8 +415,8 @@ class YNetwork(YFunction):
 
         On failure, throws an exception or returns YNetwork.ADMINPASSWORD_INVALID.
         """
-        if self._cacheExpiration <= YAPI.GetTickCount():
-            if self.load(YAPI.DefaultCacheValidity) != YAPI.SUCCESS:
+        if self._cacheExpired("adminPassword"):
+            if self.load(self._cacheValidity()) != YAPI.SUCCESS:
                 return YNetwork.ADMINPASSWORD_INVALID
         return self._adminPassword
 
@@ -445,8 +445,8 @@ class YNetwork(YFunction):
 
         On failure, throws an exception or returns YNetwork.HTTPPORT_INVALID.
         """
-        if self._cacheExpiration <= YAPI.GetTickCount():
-            if self.load(YAPI.DefaultCacheValidity) != YAPI.SUCCESS:
+        if self._cacheExpired("httpPort"):
+            if self.load(self._cacheValidity()) != YAPI.SUCCESS:
                 return YNetwork.HTTPPORT_INVALID
         return self._httpPort
 
@@ -473,8 +473,8 @@ class YNetwork(YFunction):
 
         On failure, throws an exception or returns YNetwork.DEFAULTPAGE_INVALID.
         """
-        if self._cacheExpiration <= YAPI.GetTickCount():
-            if self.load(YAPI.DefaultCacheValidity) != YAPI.SUCCESS:
+        if self._cacheExpired("defaultPage"):
+            if self.load(self._cacheValidity()) != YAPI.SUCCESS:
                 return YNetwork.DEFAULTPAGE_INVALID
         return self._defaultPage
 
@@ -504,8 +504,8 @@ class YNetwork(YFunction):
 
         On failure, throws an exception or returns YNetwork.DISCOVERABLE_INVALID.
         """
-        if self._cacheExpiration <= YAPI.GetTickCount():
-            if self.load(YAPI.DefaultCacheValidity) != YAPI.SUCCESS:
+        if self._cacheExpired("discoverable"):
+            if self.load(self._cacheValidity()) != YAPI.SUCCESS:
                 return YNetwork.DISCOVERABLE_INVALID
         return self._discoverable
 
@@ -537,8 +537,8 @@ class YNetwork(YFunction):
 
         On failure, throws an exception or returns YNetwork.WWWWATCHDOGDELAY_INVALID.
         """
-        if self._cacheExpiration <= YAPI.GetTickCount():
-            if self.load(YAPI.DefaultCacheValidity) != YAPI.SUCCESS:
+        if self._cacheExpired("wwwWatchdogDelay"):
+            if self.load(self._cacheValidity()) != YAPI.SUCCESS:
                 return YNetwork.WWWWATCHDOGDELAY_INVALID
         return self._wwwWatchdogDelay
 
@@ -568,8 +568,8 @@ class YNetwork(YFunction):
 
         On failure, throws an exception or returns YNetwork.CALLBACKURL_INVALID.
         """
-        if self._cacheExpiration <= YAPI.GetTickCount():
-            if self.load(YAPI.DefaultCacheValidity) != YAPI.SUCCESS:
+        if self._cacheExpired("callbackUrl"):
+            if self.load(self._cacheValidity()) != YAPI.SUCCESS:
                 return YNetwork.CALLBACKURL_INVALID
         return self._callbackUrl
 
@@ -597,8 +597,8 @@ class YNetwork(YFunction):
 
         On failure, throws an exception or returns YNetwork.CALLBACKMETHOD_INVALID.
         """
-        if self._cacheExpiration <= YAPI.GetTickCount():
-            if self.load(YAPI.DefaultCacheValidity) != YAPI.SUCCESS:
+        if self._cacheExpired("callbackMethod"):
+            if self.load(self._cacheValidity()) != YAPI.SUCCESS:
                 return YNetwork.CALLBACKMETHOD_INVALID
         return self._callbackMethod
 
@@ -630,8 +630,8 @@ class YNetwork(YFunction):
 
         On failure, throws an exception or returns YNetwork.CALLBACKENCODING_INVALID.
         """
-        if self._cacheExpiration <= YAPI.GetTickCount():
-            if self.load(YAPI.DefaultCacheValidity) != YAPI.SUCCESS:
+        if self._cacheExpired("callbackEncoding"):
+            if self.load(self._cacheValidity()) != YAPI.SUCCESS:
                 return YNetwork.CALLBACKENCODING_INVALID
         return self._callbackEncoding
 
@@ -663,8 +663,8 @@ class YNetwork(YFunction):
 
         On failure, throws an exception or returns YNetwork.CALLBACKCREDENTIALS_INVALID.
         """
-        if self._cacheExpiration <= YAPI.GetTickCount():
-            if self.load(YAPI.DefaultCacheValidity) != YAPI.SUCCESS:
+        if self._cacheExpired("callbackCredentials"):
+            if self.load(self._cacheValidity()) != YAPI.SUCCESS:
                 return YNetwork.CALLBACKCREDENTIALS_INVALID
         return self._callbackCredentials
 
@@ -714,8 +714,8 @@ class YNetwork(YFunction):
 
         On failure, throws an exception or returns YNetwork.CALLBACKMINDELAY_INVALID.
         """
-        if self._cacheExpiration <= YAPI.GetTickCount():
-            if self.load(YAPI.DefaultCacheValidity) != YAPI.SUCCESS:
+        if self._cacheExpired("callbackMinDelay"):
+            if self.load(self._cacheValidity()) != YAPI.SUCCESS:
                 return YNetwork.CALLBACKMINDELAY_INVALID
         return self._callbackMinDelay
 
@@ -741,8 +741,8 @@ class YNetwork(YFunction):
 
         On failure, throws an exception or returns YNetwork.CALLBACKMAXDELAY_INVALID.
         """
-        if self._cacheExpiration <= YAPI.GetTickCount():
-            if self.load(YAPI.DefaultCacheValidity) != YAPI.SUCCESS:
+        if self._cacheExpired("callbackMaxDelay"):
+            if self.load(self._cacheValidity()) != YAPI.SUCCESS:
                 return YNetwork.CALLBACKMAXDELAY_INVALID
         return self._callbackMaxDelay
 
@@ -771,8 +771,8 @@ class YNetwork(YFunction):
 
         On failure, throws an exception or returns YNetwork.POECURRENT_INVALID.
         """
-        if self._cacheExpiration <= YAPI.GetTickCount():
-            if self.load(YAPI.DefaultCacheValidity) != YAPI.SUCCESS:
+        if self._cacheExpired("poeCurrent"):
+            if self.load(self._cacheValidity()) != YAPI.SUCCESS:
                 return YNetwork.POECURRENT_INVALID
         return self._poeCurrent
 
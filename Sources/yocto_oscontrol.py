@@ -85,8 +85,8 @@ class YOsControl(YFunction):
 
         On failure, throws an exception or returns YOsControl.SHUTDOWNCOUNTDOWN_INVALID.
         """
-        if self._cacheExpiration <= YAPI.GetTickCount():
-            if self.load(YAPI.DefaultCacheValidity) != YAPI.SUCCESS:
+        if self._cacheExpired("shutdownCountdown"):
+            if self.load(self._cacheValidity()) != YAPI.SUCCESS:
                 return YOsControl.SHUTDOWNCOUNTDOWN_INVALID
         return self._shutdownCountdown
 
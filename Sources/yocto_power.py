@@ -96,8 +96,8 @@ class YPower(YSensor):
 
         On failure, throws an exception or returns YPower.COSPHI_INVALID.
         """
-        if self._cacheExpiration <= YAPI.GetTickCount():
-            if self.load(YAPI.DefaultCacheValidity) != YAPI.SUCCESS:
+        if self._cacheExpired("cosPhi"):
+            if self.load(self._cacheValidity()) != YAPI.SUCCESS:
                 return YPower.COSPHI_INVALID
         return self._cosPhi
 
@@ -115,8 +115,8 @@ class YPower(YSensor):
 
         On failure, throws an exception or returns YPower.METER_INVALID.
         """
-        if self._cacheExpiration <= YAPI.GetTickCount():
-            if self.load(YAPI.DefaultCacheValidity) != YAPI.SUCCESS:
+        if self._cacheExpired("meter"):
+            if self.load(self._cacheValidity()) != YAPI.SUCCESS:
                 return YPower.METER_INVALID
         return self._meter
 
@@ -128,8 +128,8 @@ class YPower(YSensor):
 
         On failure, throws an exception or returns YPower.METERTIMER_INVALID.
         """
-        if self._cacheExpiration <= YAPI.GetTickCount():
-            if self.load(YAPI.DefaultCacheValidity) != YAPI.SUCCESS:
+        if self._cacheExpired("meterTimer"):
+            if self.load(self._cacheValidity()) != YAPI.SUCCESS:
                 return YPower.METERTIMER_INVALID
         return self._meterTimer
 
@@ -88,8 +88,8 @@ class YPowerOutput(YFunction):
 
         On failure, throws an exception or returns YPowerOutput.VOLTAGE_INVALID.
         """
-        if self._cacheExpiration <= YAPI.GetTickCount():
-            if self.load(YAPI.DefaultCacheValidity) != YAPI.SUCCESS:
+        if self._cacheExpired("voltage"):
+            if self.load(self._cacheValidity()) != YAPI.SUCCESS:
                 return YPowerOutput.VOLTAGE_INVALID
         return self._voltage
 
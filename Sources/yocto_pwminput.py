@@ -119,8 +119,8 @@ class YPwmInput(YSensor):
 
         On failure, throws an exception or returns YPwmInput.DUTYCYCLE_INVALID.
         """
-        if self._cacheExpiration <= YAPI.GetTickCount():
-            if self.load(YAPI.DefaultCacheValidity) != YAPI.SUCCESS:
+        if self._cacheExpired("dutyCycle"):
+            if self.load(self._cacheValidity()) != YAPI.SUCCESS:
                 return YPwmInput.DUTYCYCLE_INVALID
         return self._dutyCycle
 
@@ -133,8 +133,8 @@ class YPwmInput(YSensor):
 
         On failure, throws an exception or returns YPwmInput.PULSEDURATION_INVALID.
         """
-        if self._cacheExpiration <= YAPI.GetTickCount():
-            if self.load(YAPI.DefaultCacheValidity) != YAPI.SUCCESS:
+        if self._cacheExpired("pulseDuration"):
+            if self.load(self._cacheValidity()) != YAPI.SUCCESS:
                 return YPwmInput.PULSEDURATION_INVALID
         return self._pulseDuration
 
@@ -146,8 +146,8 @@ class YPwmInput(YSensor):
 
         On failure, throws an exception or returns YPwmInput.FREQUENCY_INVALID.
         """
-        if self._cacheExpiration <= YAPI.GetTickCount():
-            if self.load(YAPI.DefaultCacheValidity) != YAPI.SUCCESS:
+        if self._cacheExpired("frequency"):
+            if self.load(self._cacheValidity()) != YAPI.SUCCESS:
                 return YPwmInput.FREQUENCY_INVALID
         return self._frequency
 
@@ -159,8 +159,8 @@ class YPwmInput(YSensor):
 
         On failure, throws an exception or returns YPwmInput.PERIOD_INVALID.
         """
-        if self._cacheExpiration <= YAPI.GetTickCount():
-            if self.load(YAPI.DefaultCacheValidity) != YAPI.SUCCESS:
+        if self._cacheExpired("period"):
+            if self.load(self._cacheValidity()) != YAPI.SUCCESS:
                 return YPwmInput.PERIOD_INVALID
         return self._period
 
@@ -174,8 +174,8 @@ class YPwmInput(YSensor):
 
         On failure, throws an exception or returns YPwmInput.PULSECOUNTER_INVALID.
         """
-        if self._cacheExpiration <= YAPI.GetTickCount():
-            if self.load(YAPI.DefaultCacheValidity) != YAPI.SUCCESS:
+        if self._cacheExpired("pulseCounter"):
+            if self.load(self._cacheValidity()) != YAPI.SUCCESS:
                 return YPwmInput.PULSECOUNTER_INVALID
         return self._pulseCounter
 
@@ -191,8 +191,8 @@ class YPwmInput(YSensor):
 
         On failure, throws an exception or returns YPwmInput.PULSETIMER_INVALID.
         """
-        if self._cacheExpiration <= YAPI.GetTickCount():
-            if self.load(YAPI.DefaultCacheValidity) != YAPI.SUCCESS:
+        if self._cacheExpired("pulseTimer"):
+            if self.load(self._cacheValidity()) != YAPI.SUCCESS:
                 return YPwmInput.PULSETIMER_INVALID
         return self._pulseTimer
 
@@ -208,8 +208,8 @@ class YPwmInput(YSensor):
 
         On failure, throws an exception or returns YPwmInput.PWMREPORTMODE_INVALID.
         """
-        if self._cacheExpiration <= YAPI.GetTickCount():
-            if self.load(YAPI.DefaultCacheValidity) != YAPI.SUCCESS:
+        if self._cacheExpired("pwmReportMode"):
+            if self.load(self._cacheValidity()) != YAPI.SUCCESS:
                 return YPwmInput.PWMREPORTMODE_INVALID
         return self._pwmReportMode
 
@@ -120,8 +120,8 @@ class YPwmOutput(YFunction):
 
         On failure, throws an exception or returns YPwmOutput.ENABLED_INVALID.
         """
-        if self._cacheExpiration <= YAPI.GetTickCount():
-            if self.load(YAPI.DefaultCacheValidity) != YAPI.SUCCESS:
+        if self._cacheExpired("enabled"):
+            if self.load(self._cacheValidity()) != YAPI.SUCCESS:
                 return YPwmOutput.ENABLED_INVALID
         return self._enabled
 
@@ -160,8 +160,8 @@ class YPwmOutput(YFunction):
 
         On failure, throws an exception or returns YPwmOutput.FREQUENCY_INVALID.
         """
-        if self._cacheExpiration <= YAPI.GetTickCount():
-            if self.load(YAPI.DefaultCacheValidity) != YAPI.SUCCESS:
+        if self._cacheExpired("frequency"):
+            if self.load(self._cacheValidity()) != YAPI.SUCCESS:
                 return YPwmOutput.FREQUENCY_INVALID
         return self._frequency
 
@@ -186,8 +186,8 @@ class YPwmOutput(YFunction):
 
         On failure, throws an exception or returns YPwmOutput.PERIOD_INVALID.
         """
-        if self._cacheExpiration <= YAPI.GetTickCount():
-            if self.load(YAPI.DefaultCacheValidity) != YAPI.SUCCESS:
+        if self._cacheExpired("period"):
+            if self.load(self._cacheValidity()) != YAPI.SUCCESS:
                 return YPwmOutput.PERIOD_INVALID
         return self._period
 
@@ -212,8 +212,8 @@ class YPwmOutput(YFunction):
 
         On failure, throws an exception or returns YPwmOutput.DUTYCYCLE_INVALID.
         """
-        if self._cacheExpiration <= YAPI.GetTickCount():
-            if self.load(YAPI.DefaultCacheValidity) != YAPI.SUCCESS:
+        if self._cacheExpired("dutyCycle"):
+            if self.load(self._cacheValidity()) != YAPI.SUCCESS:
                 return YPwmOutput.DUTYCYCLE_INVALID
         return self._dutyCycle
 
@@ -240,14 +240,14 @@ class YPwmOutput(YFunction):
 
         On failure, throws an exception or returns YPwmOutput.PULSEDURATION_INVALID.
         """
-        if self._cacheExpiration <= YAPI.GetTickCount():
-            if self.load(YAPI.DefaultCacheValidity) != YAPI.SUCCESS:
+        if self._cacheExpired("pulseDuration"):
+            if self.load(self._cacheValidity()) != YAPI.SUCCESS:
                 return YPwmOutput.PULSEDURATION_INVALID
         return self._pulseDuration
 
     def get_pwmTransition(self):
-        if self._cacheExpiration <= YAPI.GetTickCount():
-            if self.load(YAPI.DefaultCacheValidity) != YAPI.SUCCESS:
+        if self._cacheExpired("pwmTransition"):
+            if self.load(self._cacheValidity()) != YAPI.SUCCESS:
                 return YPwmOutput.PWMTRANSITION_INVALID
         return self._pwmTransition
 
@@ -264,8 +264,8 @@ class YPwmOutput(YFunction):
 
         On failure, throws an exception or returns YPwmOutput.ENABLEDATPOWERON_INVALID.
         """
-        if self._cacheExpiration <= YAPI.GetTickCount():
-            if self.load(YAPI.DefaultCacheValidity) != YAPI.SUCCESS:
+        if self._cacheExpired("enabledAtPowerOn"):
+            if self.load(self._cacheValidity()) != YAPI.SUCCESS:
                 return YPwmOutput.ENABLEDATPOWERON_INVALID
         return self._enabledAtPowerOn
 
@@ -307,8 +307,8 @@ class YPwmOutput(YFunction):
 
         On failure, throws an exception or returns YPwmOutput.DUTYCYCLEATPOWERON_INVALID.
         """
-        if self._cacheExpiration <= YAPI.GetTickCount():
-            if self.load(YAPI.DefaultCacheValidity) != YAPI.SUCCESS:
+        if self._cacheExpired("dutyCycleAtPowerOn"):
+            if self.load(self._cacheValidity()) != YAPI.SUCCESS:
                 return YPwmOutput.DUTYCYCLEATPOWERON_INVALID
         return self._dutyCycleAtPowerOn
 
@@ -88,8 +88,8 @@ class YPwmPowerSource(YFunction):
 
         On failure, throws an exception or returns YPwmPowerSource.POWERMODE_INVALID.
         """
-        if self._cacheExpiration <= YAPI.GetTickCount():
-            if self.load(YAPI.DefaultCacheValidity) != YAPI.SUCCESS:
+        if self._cacheExpired("powerMode"):
+            if self.load(self._cacheValidity()) != YAPI.SUCCESS:
                 return YPwmPowerSource.POWERMODE_INVALID
         return self._powerMode
 
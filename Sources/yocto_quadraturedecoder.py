@@ -104,8 +104,8 @@ class YQuadratureDecoder(YSensor):
 
         On failure, throws an exception or returns YQuadratureDecoder.SPEED_INVALID.
         """
-        if self._cacheExpiration <= YAPI.GetTickCount():
-            if self.load(YAPI.DefaultCacheValidity) != YAPI.SUCCESS:
+        if self._cacheExpired("speed"):
+            if self.load(self._cacheValidity()) != YAPI.SUCCESS:
                 return YQuadratureDecoder.SPEED_INVALID
         return self._speed
 
@@ -118,8 +118,8 @@ class YQuadratureDecoder(YSensor):
 
         On failure, throws an exception or returns YQuadratureDecoder.DECODING_INVALID.
         """
-        if self._cacheExpiration <= YAPI.GetTickCount():
-            if self.load(YAPI.DefaultCacheValidity) != YAPI.SUCCESS:
+        if self._cacheExpired("decoding"):
+            if self.load(self._cacheValidity()) != YAPI.SUCCESS:
                 return YQuadratureDecoder.DECODING_INVALID
         return self._decoding
 
@@ -102,8 +102,8 @@ class YRealTimeClock(YFunction):
 
         On failure, throws an exception or returns YRealTimeClock.UNIXTIME_INVALID.
         """
-        if self._cacheExpiration <= YAPI.GetTickCount():
-            if self.load(YAPI.DefaultCacheValidity) != YAPI.SUCCESS:
+        if self._cacheExpired("unixTime"):
+            if self.load(self._cacheValidity()) != YAPI.SUCCESS:
                 return YRealTimeClock.UNIXTIME_INVALID
         return self._unixTime
 
@@ -128,8 +128,8 @@ class YRealTimeClock(YFunction):
 
         On failure, throws an exception or returns YRealTimeClock.DATETIME_INVALID.
         """
-        if self._cacheExpiration <= YAPI.GetTickCount():
-            if self.load(YAPI.DefaultCacheValidity) != YAPI.SUCCESS:
+        if self._cacheExpired("dateTime"):
+            if self.load(self._cacheValidity()) != YAPI.SUCCESS:
                 return YRealTimeClock.DATETIME_INVALID
         return self._dateTime
 
@@ -141,8 +141,8 @@ class YRealTimeClock(YFunction):
 
         On failure, throws an exception or returns YRealTimeClock.UTCOFFSET_INVALID.
         """
-        if self._cacheExpiration <= YAPI.GetTickCount():
-            if self.load(YAPI.DefaultCacheValidity) != YAPI.SUCCESS:
+        if self._cacheExpired("utcOffset"):
+            if self.load(self._cacheValidity()) != YAPI.SUCCESS:
                 return YRealTimeClock.UTCOFFSET_INVALID
         return self._utcOffset
 
@@ -169,8 +169,8 @@ class YRealTimeClock(YFunction):
 
         On failure, throws an exception or returns YRealTimeClock.TIMESET_INVALID.
         """
-        if self._cacheExpiration <= YAPI.GetTickCount():
-            if self.load(YAPI.DefaultCacheValidity) != YAPI.SUCCESS:
+        if self._cacheExpired("timeSet"):
+            if self.load(self._cacheValidity()) != YAPI.SUCCESS:
                 return YRealTimeClock.TIMESET_INVALID
         return self._timeSet
 
@@ -116,8 +116,8 @@ class YRefFrame(YFunction):
         super(YRefFrame, self)._parseAttr(member)
 
     def get_mountPos(self):
-        if self._cacheExpiration <= YAPI.GetTickCount():
-            if self.load(YAPI.DefaultCacheValidity) != YAPI.SUCCESS:
+        if self._cacheExpired("mountPos"):
+            if self.load(self._cacheValidity()) != YAPI.SUCCESS:
                 return YRefFrame.MOUNTPOS_INVALID
         return self._mountPos
 
@@ -161,14 +161,14 @@ class YRefFrame(YFunction):
 
         On failure, throws an exception or returns YRefFrame.BEARING_INVALID.
         """
-        if self._cacheExpiration <= YAPI.GetTickCount():
-            if self.load(YAPI.DefaultCacheValidity) != YAPI.SUCCESS:
+        if self._cacheExpired("bearing"):
+            if self.load(self._cacheValidity()) != YAPI.SUCCESS:
                 return YRefFrame.BEARING_INVALID
         return self._bearing
 
     def get_calibrationParam(self):
-        if self._cacheExpiration <= YAPI.GetTickCount():
-            if self.load(YAPI.DefaultCacheValidity) != YAPI.SUCCESS:
+        if self._cacheExpired("calibrationParam"):
+            if self.load(self._cacheValidity()) != YAPI.SUCCESS:
                 return YRefFrame.CALIBRATIONPARAM_INVALID
         return self._calibrationParam
 
@@ -342,7 +342,7 @@ class YRefFrame(YFunction):
         self._calibStageProgress = 0
         self._calibProgress = 1
         self._calibInternalPos = 0
-        self._calibPrevTick = (YRelTickCount(YAPI.GetTickCount()) & (0x7FFFFFFF))
+        self._calibPrevTick = (YMonotonicTickCount() & (0x7FFFFFFF))
         del self._calibOrient[:]
         del self._calibDataAccX[:]
         del self._calibDataAccY[:]
@@ -381,7 +381,7 @@ class YRefFrame(YFunction):
         if self._calibProgress == 100:
             return YAPI.SUCCESS
         # // make sure we leave at least 160ms between samples
-        currTick =  (YRelTickCount(YAPI.GetTickCount()) & (0x7FFFFFFF))
+        currTick =  (YMonotonicTickCount() & (0x7FFFFFFF))
         if ((currTick - self._calibPrevTick) & (0x7FFFFFFF)) < 160:
             return YAPI.SUCCESS
         # // load current accelerometer values, make sure we are on a straight angle
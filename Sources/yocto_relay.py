@@ -139,8 +139,8 @@ class YRelay(YFunction):
 
         On failure, throws an exception or returns YRelay.STATE_INVALID.
         """
-        if self._cacheExpiration <= YAPI.GetTickCount():
-            if self.load(YAPI.DefaultCacheValidity) != YAPI.SUCCESS:
+        if self._cacheExpired("state"):
+            if self.load(self._cacheValidity()) != YAPI.SUCCESS:
                 return YRelay.STATE_INVALID
         return self._state
 
@@ -169,8 +169,8 @@ class YRelay(YFunction):
 
         On failure, throws an exception or returns YRelay.STATEATPOWERON_INVALID.
         """
-        if self._cacheExpiration <= YAPI.GetTickCount():
-            if self.load(YAPI.DefaultCacheValidity) != YAPI.SUCCESS:
+        if self._cacheExpired("stateAtPowerOn"):
+            if self.load(self._cacheValidity()) != YAPI.SUCCESS:
                 return YRelay.STATEATPOWERON_INVALID
         return self._stateAtPowerOn
 
@@ -199,8 +199,8 @@ class YRelay(YFunction):
 
         On failure, throws an exception or returns YRelay.MAXTIMEONSTATEA_INVALID.
         """
-        if self._cacheExpiration <= YAPI.GetTickCount():
-            if self.load(YAPI.DefaultCacheValidity) != YAPI.SUCCESS:
+        if self._cacheExpired("maxTimeOnStateA"):
+            if self.load(self._cacheValidity()) != YAPI.SUCCESS:
                 return YRelay.MAXTIMEONSTATEA_INVALID
         return self._maxTimeOnStateA
 
@@ -227,8 +227,8 @@ class YRelay(YFunction):
 
         On failure, throws an exception or returns YRelay.MAXTIMEONSTATEB_INVALID.
         """
-        if self._cacheExpiration <= YAPI.GetTickCount():
-            if self.load(YAPI.DefaultCacheValidity) != YAPI.SUCCESS:
+        if self._cacheExpired("maxTimeOnStateB"):
+            if self.load(self._cacheValidity()) != YAPI.SUCCESS:
                 return YRelay.MAXTIMEONSTATEB_INVALID
         return self._maxTimeOnStateB
 
@@ -255,8 +255,8 @@ class YRelay(YFunction):
 
         On failure, throws an exception or returns YRelay.OUTPUT_INVALID.
         """
-        if self._cacheExpiration <= YAPI.GetTickCount():
-            if self.load(YAPI.DefaultCacheValidity) != YAPI.SUCCESS:
+        if self._cacheExpired("output"):
+            if self.load(self._cacheValidity()) != YAPI.SUCCESS:
                 return YRelay.OUTPUT_INVALID
         return self._output
 
@@ -285,8 +285,8 @@ class YRelay(YFunction):
 
         On failure, throws an exception or returns YRelay.PULSETIMER_INVALID.
         """
-        if self._cacheExpiration <= YAPI.GetTickCount():
-            if self.load(YAPI.DefaultCacheValidity) != YAPI.SUCCESS:
+        if self._cacheExpired("pulseTimer"):
+            if self.load(self._cacheValidity()) != YAPI.SUCCESS:
                 return YRelay.PULSETIMER_INVALID
         return self._pulseTimer
 
@@ -309,8 +309,8 @@ class YRelay(YFunction):
         return self._setAttr("pulseTimer", rest_val)
 
     def get_delayedPulseTimer(self):
-        if self._cacheExpiration <= YAPI.GetTickCount():
-            if self.load(YAPI.DefaultCacheValidity) != YAPI.SUCCESS:
+        if self._cacheExpired("delayedPulseTimer"):
+            if self.load(self._cacheValidity()) != YAPI.SUCCESS:
                 return YRelay.DELAYEDPULSETIMER_INVALID
         return self._delayedPulseTimer
 
@@ -342,8 +342,8 @@ class YRelay(YFunction):
 
         On failure, throws an exception or returns YRelay.COUNTDOWN_INVALID.
         """
-        if self._cacheExpiration <= YAPI.GetTickCount():
-            if self.load(YAPI.DefaultCacheValidity) != YAPI.SUCCESS:
+        if self._cacheExpired("countdown"):
+            if self.load(self._cacheValidity()) != YAPI.SUCCESS:
                 return YRelay.COUNTDOWN_INVALID
         return self._countdown
 
@@ -90,8 +90,8 @@ class YSegmentedDisplay(YFunction):
 
         On failure, throws an exception or returns YSegmentedDisplay.DISPLAYEDTEXT_INVALID.
         """
-        if self._cacheExpiration <= YAPI.GetTickCount():
-            if self.load(YAPI.DefaultCacheValidity) != YAPI.SUCCESS:
+        if self._cacheExpired("displayedText"):
+            if self.load(self._cacheValidity()) != YAPI.SUCCESS:
                 return YSegmentedDisplay.DISPLAYEDTEXT_INVALID
         return self._displayedText
 
@@ -109,8 +109,8 @@ class YSegmentedDisplay(YFunction):
         return self._setAttr("displayedText", rest_val)
 
     def get_displayMode(self):
-        if self._cacheExpiration <= YAPI.GetTickCount():
-            if self.load(YAPI.DefaultCacheValidity) != YAPI.SUCCESS:
+        if self._cacheExpired("displayMode"):
+            if self.load(self._cacheValidity()) != YAPI.SUCCESS:
                 return YSegmentedDisplay.DISPLAYMODE_INVALID
         return self._displayMode
 
@@ -154,8 +154,8 @@ class YSerialPort(YFunction):
 
         On failure, throws an exception or returns YSerialPort.SERIALMODE_INVALID.
         """
-        if self._cacheExpiration <= YAPI.GetTickCount():
-            if self.load(YAPI.DefaultCacheValidity) != YAPI.SUCCESS:
+        if self._cacheExpired("serialMode"):
+            if self.load(self._cacheValidity()) != YAPI.SUCCESS:
                 return YSerialPort.SERIALMODE_INVALID
         return self._serialMode
 
@@ -192,8 +192,8 @@ class YSerialPort(YFunction):
 
         On failure, throws an exception or returns YSerialPort.PROTOCOL_INVALID.
         """
-        if self._cacheExpiration <= YAPI.GetTickCount():
-            if self.load(YAPI.DefaultCacheValidity) != YAPI.SUCCESS:
+        if self._cacheExpired("protocol"):
+            if self.load(self._cacheValidity()) != YAPI.SUCCESS:
                 return YSerialPort.PROTOCOL_INVALID
         return self._protocol
 
@@ -229,8 +229,8 @@ class YSerialPort(YFunction):
 
         On failure, throws an exception or returns YSerialPort.VOLTAGELEVEL_INVALID.
         """
-        if self._cacheExpiration <= YAPI.GetTickCount():
-            if self.load(YAPI.DefaultCacheValidity) != YAPI.SUCCESS:
+        if self._cacheExpired("voltageLevel"):
+            if self.load(self._cacheValidity()) != YAPI.SUCCESS:
                 return YSerialPort.VOLTAGELEVEL_INVALID
         return self._voltageLevel
 
@@ -262,8 +262,8 @@ class YSerialPort(YFunction):
 
         On failure, throws an exception or returns YSerialPort.RXCOUNT_INVALID.
         """
-        if self._cacheExpiration <= YAPI.GetTickCount():
-            if self.load(YAPI.DefaultCacheValidity) != YAPI.SUCCESS:
+        if self._cacheExpired("rxCount"):
+            if self.load(self._cacheValidity()) != YAPI.SUCCESS:
                 return YSerialPort.RXCOUNT_INVALID
         return self._rxCount
 
@@ -275,8 +275,8 @@ class YSerialPort(YFunction):
 
         On failure, throws an exception or returns YSerialPort.TXCOUNT_INVALID.
         """
-        if self._cacheExpiration <= YAPI.GetTickCount():
-            if self.load(YAPI.DefaultCacheValidity) != YAPI.SUCCESS:
+        if self._cacheExpired("txCount"):
+            if self.load(self._cacheValidity()) != YAPI.SUCCESS:
                 return YSerialPort.TXCOUNT_INVALID
         return self._txCount
 
@@ -288,8 +288,8 @@ class YSerialPort(YFunction):
 
         On failure, throws an exception or returns YSerialPort.ERRCOUNT_INVALID.
         """
-        if self._cacheExpiration <= YAPI.GetTickCount():
-            if self.load(YAPI.DefaultCacheValidity) != YAPI.SUCCESS:
+        if self._cacheExpired("errCount"):
+            if self.load(self._cacheValidity()) != YAPI.SUCCESS:
                 return YSerialPort.ERRCOUNT_INVALID
         return self._errCount
 
@@ -301,8 +301,8 @@ class YSerialPort(YFunction):
 
         On failure, throws an exception or returns YSerialPort.RXMSGCOUNT_INVALID.
         """
-        if self._cacheExpiration <= YAPI.GetTickCount():
-            if self.load(YAPI.DefaultCacheValidity) != YAPI.SUCCESS:
+        if self._cacheExpired("rxMsgCount"):
+            if self.load(self._cacheValidity()) != YAPI.SUCCESS:
                 return YSerialPort.RXMSGCOUNT_INVALID
         return self._rxMsgCount
 
@@ -314,8 +314,8 @@ class YSerialPort(YFunction):
 
         On failure, throws an exception or returns YSerialPort.TXMSGCOUNT_INVALID.
         """
-        if self._cacheExpiration <= YAPI.GetTickCount():
-            if self.load(YAPI.DefaultCacheValidity) != YAPI.SUCCESS:
+        if self._cacheExpired("txMsgCount"):
+            if self.load(self._cacheValidity()) != YAPI.SUCCESS:
                 return YSerialPort.TXMSGCOUNT_INVALID
         return self._txMsgCount
 
@@ -327,8 +327,8 @@ class YSerialPort(YFunction):
 
         On failure, throws an exception or returns YSerialPort.LASTMSG_INVALID.
         """
-        if self._cacheExpiration <= YAPI.GetTickCount():
-            if self.load(YAPI.DefaultCacheValidity) != YAPI.SUCCESS:
+        if self._cacheExpired("lastMsg"):
+            if self.load(self._cacheValidity()) != YAPI.SUCCESS:
                 return YSerialPort.LASTMSG_INVALID
         return self._lastMsg
 
@@ -340,8 +340,8 @@ class YSerialPort(YFunction):
 
         On failure, throws an exception or returns YSerialPort.CURRENTJOB_INVALID.
         """
-        if self._cacheExpiration <= YAPI.GetTickCount():
-            if self.load(YAPI.DefaultCacheValidity) != YAPI.SUCCESS:
+        if self._cacheExpired("currentJob"):
+            if self.load(self._cacheValidity()) != YAPI.SUCCESS:
                 return YSerialPort.CURRENTJOB_INVALID
         return self._currentJob
 
@@ -368,8 +368,8 @@ class YSerialPort(YFunction):
 
         On failure, throws an exception or returns YSerialPort.STARTUPJOB_INVALID.
         """
-        if self._cacheExpiration <= YAPI.GetTickCount():
-            if self.load(YAPI.DefaultCacheValidity) != YAPI.SUCCESS:
+        if self._cacheExpired("startupJob"):
+            if self.load(self._cacheValidity()) != YAPI.SUCCESS:
                 return YSerialPort.STARTUPJOB_INVALID
         return self._startupJob
 
@@ -389,8 +389,8 @@ class YSerialPort(YFunction):
         return self._setAttr("startupJob", rest_val)
 
     def get_command(self):
-        if self._cacheExpiration <= YAPI.GetTickCount():
-            if self.load(YAPI.DefaultCacheValidity) != YAPI.SUCCESS:
+        if self._cacheExpired("command"):
+            if self.load(self._cacheValidity()) != YAPI.SUCCESS:
                 return YSerialPort.COMMAND_INVALID
         return self._command
 
@@ -127,8 +127,8 @@ class YServo(YFunction):
 
         On failure, throws an exception or returns YServo.POSITION_INVALID.
         """
-        if self._cacheExpiration <= YAPI.GetTickCount():
-            if self.load(YAPI.DefaultCacheValidity) != YAPI.SUCCESS:
+        if self._cacheExpired("position"):
+            if self.load(self._cacheValidity()) != YAPI.SUCCESS:
                 return YServo.POSITION_INVALID
         return self._position
 
@@ -153,8 +153,8 @@ class YServo(YFunction):
 
         On failure, throws an exception or returns YServo.ENABLED_INVALID.
         """
-        if self._cacheExpiration <= YAPI.GetTickCount():
-            if self.load(YAPI.DefaultCacheValidity) != YAPI.SUCCESS:
+        if self._cacheExpired("enabled"):
+            if self.load(self._cacheValidity()) != YAPI.SUCCESS:
                 return YServo.ENABLED_INVALID
         return self._enabled
 
@@ -179,8 +179,8 @@ class YServo(YFunction):
 
         On failure, throws an exception or returns YServo.RANGE_INVALID.
         """
-        if self._cacheExpiration <= YAPI.GetTickCount():
-            if self.load(YAPI.DefaultCacheValidity) != YAPI.SUCCESS:
+        if self._cacheExpired("range"):
+            if self.load(self._cacheValidity()) != YAPI.SUCCESS:
                 return YServo.RANGE_INVALID
         return self._range
 
@@ -211,8 +211,8 @@ class YServo(YFunction):
 
         On failure, throws an exception or returns YServo.NEUTRAL_INVALID.
         """
-        if self._cacheExpiration <= YAPI.GetTickCount():
-            if self.load(YAPI.DefaultCacheValidity) != YAPI.SUCCESS:
+        if self._cacheExpired("neutral"):
+            if self.load(self._cacheValidity()) != YAPI.SUCCESS:
                 return YServo.NEUTRAL_INVALID
         return self._neutral
 
@@ -236,8 +236,8 @@ class YServo(YFunction):
         return self._setAttr("neutral", rest_val)
 
     def get_move(self):
-        if self._cacheExpiration <= YAPI.GetTickCount():
-            if self.load(YAPI.DefaultCacheValidity) != YAPI.SUCCESS:
+        if self._cacheExpired("move"):
+            if self.load(self._cacheValidity()) != YAPI.SUCCESS:
                 return YServo.MOVE_INVALID
         return self._move
 
@@ -267,8 +267,8 @@ class YServo(YFunction):
 
         On failure, throws an exception or returns YServo.POSITIONATPOWERON_INVALID.
         """
-        if self._cacheExpiration <= YAPI.GetTickCount():
-            if self.load(YAPI.DefaultCacheValidity) != YAPI.SUCCESS:
+        if self._cacheExpired("positionAtPowerOn"):
+            if self.load(self._cacheValidity()) != YAPI.SUCCESS:
                 return YServo.POSITIONATPOWERON_INVALID
         return self._positionAtPowerOn
 
@@ -295,8 +295,8 @@ class YServo(YFunction):
 
         On failure, throws an exception or returns YServo.ENABLEDATPOWERON_INVALID.
         """
-        if self._cacheExpiration <= YAPI.GetTickCount():
-            if self.load(YAPI.DefaultCacheValidity) != YAPI.SUCCESS:
+        if self._cacheExpired("enabledAtPowerOn"):
+            if self.load(self._cacheValidity()) != YAPI.SUCCESS:
                 return YServo.ENABLEDATPOWERON_INVALID
         return self._enabledAtPowerOn
 
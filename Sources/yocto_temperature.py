@@ -131,8 +131,8 @@ class YTemperature(YSensor):
 
         On failure, throws an exception or returns YTemperature.SENSORTYPE_INVALID.
         """
-        if self._cacheExpiration <= YAPI.GetTickCount():
-            if self.load(YAPI.DefaultCacheValidity) != YAPI.SUCCESS:
+        if self._cacheExpired("sensorType"):
+            if self.load(self._cacheValidity()) != YAPI.SUCCESS:
                 return YTemperature.SENSORTYPE_INVALID
         return self._sensorType
 
@@ -159,8 +159,8 @@ class YTemperature(YSensor):
         return self._setAttr("sensorType", rest_val)
 
     def get_command(self):
-        if self._cacheExpiration <= YAPI.GetTickCount():
-            if self.load(YAPI.DefaultCacheValidity) != YAPI.SUCCESS:
+        if self._cacheExpired("command"):
+            if self.load(self._cacheValidity()) != YAPI.SUCCESS:
                 return YTemperature.COMMAND_INVALID
         return self._command
 
@@ -85,8 +85,8 @@ class YTilt(YSensor):
         super(YTilt, self)._parseAttr(member)
 
     def get_axis(self):
-        if self._cacheExpiration <= YAPI.GetTickCount():
-            if self.load(YAPI.DefaultCacheValidity) != YAPI.SUCCESS:
+        if self._cacheExpired("axis"):
+            if self.load(self._cacheValidity()) != YAPI.SUCCESS:
                 return YTilt.AXIS_INVALID
         return self._axis
 
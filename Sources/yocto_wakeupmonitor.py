@@ -116,8 +116,8 @@ class YWakeUpMonitor(YFunction):
 
         On failure, throws an exception or returns YWakeUpMonitor.POWERDURATION_INVALID.
         """
-        if self._cacheExpiration <= YAPI.GetTickCount():
-            if self.load(YAPI.DefaultCacheValidity) != YAPI.SUCCESS:
+        if self._cacheExpired("powerDuration"):
+            if self.load(self._cacheValidity()) != YAPI.SUCCESS:
                 return YWakeUpMonitor.POWERDURATION_INVALID
         return self._powerDuration
 
@@ -143,8 +143,8 @@ class YWakeUpMonitor(YFunction):
 
         On failure, throws an exception or returns YWakeUpMonitor.SLEEPCOUNTDOWN_INVALID.
         """
-        if self._cacheExpiration <= YAPI.GetTickCount():
-            if self.load(YAPI.DefaultCacheValidity) != YAPI.SUCCESS:
+        if self._cacheExpired("sleepCountdown"):
+            if self.load(self._cacheValidity()) != YAPI.SUCCESS:
                 return YWakeUpMonitor.SLEEPCOUNTDOWN_INVALID
         return self._sleepCountdown
 
@@ -169,8 +169,8 @@ class YWakeUpMonitor(YFunction):
 
         On failure, throws an exception or returns YWakeUpMonitor.NEXTWAKEUP_INVALID.
         """
-        if self._cacheExpiration <= YAPI.GetTickCount():
-            if self.load(YAPI.DefaultCacheValidity) != YAPI.SUCCESS:
+        if self._cacheExpired("nextWakeUp"):
+            if self.load(self._cacheValidity()) != YAPI.SUCCESS:
                 return YWakeUpMonitor.NEXTWAKEUP_INVALID
         return self._nextWakeUp
 
@@ -198,8 +198,8 @@ class YWakeUpMonitor(YFunction):
 
         On failure, throws an exception or returns YWakeUpMonitor.WAKEUPREASON_INVALID.
         """
-        if self._cacheExpiration <= YAPI.GetTickCount():
-            if self.load(YAPI.DefaultCacheValidity) != YAPI.SUCCESS:
+        if self._cacheExpired("wakeUpReason"):
+            if self.load(self._cacheValidity()) != YAPI.SUCCESS:
                 return YWakeUpMonitor.WAKEUPREASON_INVALID
         return self._wakeUpReason
 
@@ -212,8 +212,8 @@ class YWakeUpMonitor(YFunction):
 
         On failure, throws an exception or returns YWakeUpMonitor.WAKEUPSTATE_INVALID.
         """
-        if self._cacheExpiration <= YAPI.GetTickCount():
-            if self.load(YAPI.DefaultCacheValidity) != YAPI.SUCCESS:
+        if self._cacheExpired("wakeUpState"):
+            if self.load(self._cacheValidity()) != YAPI.SUCCESS:
                 return YWakeUpMonitor.WAKEUPSTATE_INVALID
         return self._wakeUpState
 
@@ -222,8 +222,8 @@ class YWakeUpMonitor(YFunction):
         return self._setAttr("wakeUpState", rest_val)
 
     def get_rtcTime(self):
-        if self._cacheExpiration <= YAPI.GetTickCount():
-            if self.load(YAPI.DefaultCacheValidity) != YAPI.SUCCESS:
+        if self._cacheExpired("rtcTime"):
+            if self.load(self._cacheValidity()) != YAPI.SUCCESS:
                 return YWakeUpMonitor.RTCTIME_INVALID
         return self._rtcTime
 
@@ -263,7 +263,7 @@ class YWakeUpMonitor(YFunction):
         """
         Forces a wake up.
         """
-        # // may throw an exception
+        # // may throw an exception
         return self.set_wakeUpState(YWakeUpMonitor.WAKEUPSTATE_AWAKE)
 
     def sleep(self, secBeforeSleep):
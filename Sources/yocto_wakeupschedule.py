@@ -113,8 +113,8 @@ class YWakeUpSchedule(YFunction):
 
         On failure, throws an exception or returns YWakeUpSchedule.MINUTESA_INVALID.
         """
-        if self._cacheExpiration <= YAPI.GetTickCount():
-            if self.load(YAPI.DefaultCacheValidity) != YAPI.SUCCESS:
+        if self._cacheExpired("minutesA"):
+            if self.load(self._cacheValidity()) != YAPI.SUCCESS:
                 return YWakeUpSchedule.MINUTESA_INVALID
         return self._minutesA
 
@@ -139,8 +139,8 @@ class YWakeUpSchedule(YFunction):
 
         On failure, throws an exception or returns YWakeUpSchedule.MINUTESB_INVALID.
         """
-        if self._cacheExpiration <= YAPI.GetTickCount():
-            if self.load(YAPI.DefaultCacheValidity) != YAPI.SUCCESS:
+        if self._cacheExpired("minutesB"):
+            if self.load(self._cacheValidity()) != YAPI.SUCCESS:
                 return YWakeUpSchedule.MINUTESB_INVALID
         return self._minutesB
 
@@ -165,8 +165,8 @@ class YWakeUpSchedule(YFunction):
 
         On failure, throws an exception or returns YWakeUpSchedule.HOURS_INVALID.
         """
-        if self._cacheExpiration <= YAPI.GetTickCount():
-            if self.load(YAPI.DefaultCacheValidity) != YAPI.SUCCESS:
+        if self._cacheExpired("hours"):
+            if self.load(self._cacheValidity()) != YAPI.SUCCESS:
                 return YWakeUpSchedule.HOURS_INVALID
         return self._hours
 
@@ -191,8 +191,8 @@ class YWakeUpSchedule(YFunction):
 
         On failure, throws an exception or returns YWakeUpSchedule.WEEKDAYS_INVALID.
         """
-        if self._cacheExpiration <= YAPI.GetTickCount():
-            if self.load(YAPI.DefaultCacheValidity) != YAPI.SUCCESS:
+        if self._cacheExpired("weekDays"):
+            if self.load(self._cacheValidity()) != YAPI.SUCCESS:
                 return YWakeUpSchedule.WEEKDAYS_INVALID
         return self._weekDays
 
@@ -217,8 +217,8 @@ class YWakeUpSchedule(YFunction):
 
         On failure, throws an exception or returns YWakeUpSchedule.MONTHDAYS_INVALID.
         """
-        if self._cacheExpiration <= YAPI.GetTickCount():
-            if self.load(YAPI.DefaultCacheValidity) != YAPI.SUCCESS:
+        if self._cacheExpired("monthDays"):
+            if self.load(self._cacheValidity()) != YAPI.SUCCESS:
                 return YWakeUpSchedule.MONTHDAYS_INVALID
         return self._monthDays
 
@@ -243,8 +243,8 @@ class YWakeUpSchedule(YFunction):
 
         On failure, throws an exception or returns YWakeUpSchedule.MONTHS_INVALID.
         """
-        if self._cacheExpiration <= YAPI.GetTickCount():
-            if self.load(YAPI.DefaultCacheValidity) != YAPI.SUCCESS:
+        if self._cacheExpired("months"):
+            if self.load(self._cacheValidity()) != YAPI.SUCCESS:
                 return YWakeUpSchedule.MONTHS_INVALID
         return self._months
 
@@ -269,8 +269,8 @@ class YWakeUpSchedule(YFunction):
 
         On failure, throws an exception or returns YWakeUpSchedule.NEXTOCCURENCE_INVALID.
         """
-        if self._cacheExpiration <= YAPI.GetTickCount():
-            if self.load(YAPI.DefaultCacheValidity) != YAPI.SUCCESS:
+        if self._cacheExpired("nextOccurence"):
+            if self.load(self._cacheValidity()) != YAPI.SUCCESS:
                 return YWakeUpSchedule.NEXTOCCURENCE_INVALID
         return self._nextOccurence
 
@@ -311,7 +311,7 @@ class YWakeUpSchedule(YFunction):
         Returns all the minutes of each hour that are scheduled for wake up.
         """
         # res
-        # // may throw an exception
+        # // may throw an exception
         res = self.get_minutesB()
         res = ((res) << (30))
         res = res + self.get_minutesA()
@@ -327,7 +327,7 @@ class YWakeUpSchedule(YFunction):
 
         On failure, throws an exception or returns a negative error code.
         """
-        # // may throw an exception
+        # // may throw an exception
         self.set_minutesA(((bitmap) & (0x3fffffff)))
         bitmap = ((bitmap) >> (30))
         return self.set_minutesB(((bitmap) & (0x3fffffff)))
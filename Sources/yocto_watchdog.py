@@ -162,8 +162,8 @@ class YWatchdog(YFunction):
 
         On failure, throws an exception or returns YWatchdog.STATE_INVALID.
         """
-        if self._cacheExpiration <= YAPI.GetTickCount():
-            if self.load(YAPI.DefaultCacheValidity) != YAPI.SUCCESS:
+        if self._cacheExpired("state"):
+            if self.load(self._cacheValidity()) != YAPI.SUCCESS:
                 return YWatchdog.STATE_INVALID
         return self._state
 
@@ -192,8 +192,8 @@ class YWatchdog(YFunction):
 
         On failure, throws an exception or returns YWatchdog.STATEATPOWERON_INVALID.
         """
-        if self._cacheExpiration <= YAPI.GetTickCount():
-            if self.load(YAPI.DefaultCacheValidity) != YAPI.SUCCESS:
+        if self._cacheExpired("stateAtPowerOn"):
+            if self.load(self._cacheValidity()) != YAPI.SUCCESS:
                 return YWatchdog.STATEATPOWERON_INVALID
         return self._stateAtPowerOn
 
@@ -222,8 +222,8 @@ class YWatchdog(YFunction):
 
         On failure, throws an exception or returns YWatchdog.MAXTIMEONSTATEA_INVALID.
         """
-        if self._cacheExpiration <= YAPI.GetTickCount():
-            if self.load(YAPI.DefaultCacheValidity) != YAPI.SUCCESS:
+        if self._cacheExpired("maxTimeOnStateA"):
+            if self.load(self._cacheValidity()) != YAPI.SUCCESS:
                 return YWatchdog.MAXTIMEONSTATEA_INVALID
         return self._maxTimeOnStateA
 
@@ -250,8 +250,8 @@ class YWatchdog(YFunction):
 
         On failure, throws an exception or returns YWatchdog.MAXTIMEONSTATEB_INVALID.
         """
-        if self._cacheExpiration <= YAPI.GetTickCount():
-            if self.load(YAPI.DefaultCacheValidity) != YAPI.SUCCESS:
+        if self._cacheExpired("maxTimeOnStateB"):
+            if self.load(self._cacheValidity()) != YAPI.SUCCESS:
                 return YWatchdog.MAXTIMEONSTATEB_INVALID
         return self._maxTimeOnStateB
 
@@ -278,8 +278,8 @@ class YWatchdog(YFunction):
 
         On failure, throws an exception or returns YWatchdog.OUTPUT_INVALID.
         """
-        if self._cacheExpiration <= YAPI.GetTickCount():
-            if self.load(YAPI.DefaultCacheValidity) != YAPI.SUCCESS:
+        if self._cacheExpired("output"):
+            if self.load(self._cacheValidity()) != YAPI.SUCCESS:
                 return YWatchdog.OUTPUT_INVALID
         return self._output
 
@@ -308,8 +308,8 @@ class YWatchdog(YFunction):
 
         On failure, throws an exception or returns YWatchdog.PULSETIMER_INVALID.
         """
-        if self._cacheExpiration <= YAPI.GetTickCount():
-            if self.load(YAPI.DefaultCacheValidity) != YAPI.SUCCESS:
+        if self._cacheExpired("pulseTimer"):
+            if self.load(self._cacheValidity()) != YAPI.SUCCESS:
                 return YWatchdog.PULSETIMER_INVALID
         return self._pulseTimer
 
@@ -332,8 +332,8 @@ class YWatchdog(YFunction):
         return self._setAttr("pulseTimer", rest_val)
 
     def get_delayedPulseTimer(self):
-        if self._cacheExpiration <= YAPI.GetTickCount():
-            if self.load(YAPI.DefaultCacheValidity) != YAPI.SUCCESS:
+        if self._cacheExpired("delayedPulseTimer"):
+            if self.load(self._cacheValidity()) != YAPI.SUCCESS:
                 return YWatchdog.DELAYEDPULSETIMER_INVALID
         return self._delayedPulseTimer
 
@@ -365,8 +365,8 @@ class YWatchdog(YFunction):
 
         On failure, throws an exception or returns YWatchdog.COUNTDOWN_INVALID.
         """
-        if self._cacheExpiration <= YAPI.GetTickCount():
-            if self.load(YAPI.DefaultCacheValidity) != YAPI.SUCCESS:
+        if self._cacheExpired("countdown"):
+            if self.load(self._cacheValidity()) != YAPI.SUCCESS:
                 return YWatchdog.COUNTDOWN_INVALID
         return self._countdown
 
@@ -379,8 +379,8 @@ class YWatchdog(YFunction):
 
         On failure, throws an exception or returns YWatchdog.AUTOSTART_INVALID.
         """
-        if self._cacheExpiration <= YAPI.GetTickCount():
-            if self.load(YAPI.DefaultCacheValidity) != YAPI.SUCCESS:
+        if self._cacheExpired("autoStart"):
+            if self.load(self._cacheValidity()) != YAPI.SUCCESS:
                 return YWatchdog.AUTOSTART_INVALID
         return self._autoStart
 
@@ -407,8 +407,8 @@ class YWatchdog(YFunction):
 
         On failure, throws an exception or returns YWatchdog.RUNNING_INVALID.
         """
-        if self._cacheExpiration <= YAPI.GetTickCount():
-            if self.load(YAPI.DefaultCacheValidity) != YAPI.SUCCESS:
+        if self._cacheExpired("running"):
+            if self.load(self._cacheValidity()) != YAPI.SUCCESS:
                 return YWatchdog.RUNNING_INVALID
         return self._running
 
@@ -448,8 +448,8 @@ class YWatchdog(YFunction):
 
         On failure, throws an exception or returns YWatchdog.TRIGGERDELAY_INVALID.
         """
-        if self._cacheExpiration <= YAPI.GetTickCount():
-            if self.load(YAPI.DefaultCacheValidity) != YAPI.SUCCESS:
+        if self._cacheExpired("triggerDelay"):
+            if self.load(self._cacheValidity()) != YAPI.SUCCESS:
                 return YWatchdog.TRIGGERDELAY_INVALID
         return self._triggerDelay
 
@@ -475,8 +475,8 @@ class YWatchdog(YFunction):
 
         On failure, throws an exception or returns YWatchdog.TRIGGERDURATION_INVALID.
         """
-        if self._cacheExpiration <= YAPI.GetTickCount():
-            if self.load(YAPI.DefaultCacheValidity) != YAPI.SUCCESS:
+        if self._cacheExpired("triggerDuration"):
+            if self.load(self._cacheValidity()) != YAPI.SUCCESS:
                 return YWatchdog.TRIGGERDURATION_INVALID
         return self._triggerDuration
 
@@ -155,8 +155,8 @@ class YWireless(YFunction):
 
         On failure, throws an exception or returns YWireless.LINKQUALITY_INVALID.
         """
-        if self._cacheExpiration <= YAPI.GetTickCount():
-            if self.load(YAPI.DefaultCacheValidity) != YAPI.SUCCESS:
+        if self._cacheExpired("linkQuality"):
+            if self.load(self._cacheValidity()) != YAPI.SUCCESS:
                 return YWireless.LINKQUALITY_INVALID
         return self._linkQuality
 
@@ -168,8 +168,8 @@ class YWireless(YFunction):
 
         On failure, throws an exception or returns YWireless.SSID_INVALID.
         """
-        if self._cacheExpiration <= YAPI.GetTickCount():
-            if self.load(YAPI.DefaultCacheValidity) != YAPI.SUCCESS:
+        if self._cacheExpired("ssid"):
+            if self.load(self._cacheValidity()) != YAPI.SUCCESS:
                 return YWireless.SSID_INVALID
         return self._ssid
 
@@ -182,8 +182,8 @@ class YWireless(YFunction):
 
         On failure, throws an exception or returns YWireless.CHANNEL_INVALID.
         """
-        if self._cacheExpiration <= YAPI.GetTickCount():
-            if self.load(YAPI.DefaultCacheValidity) != YAPI.SUCCESS:
+        if self._cacheExpired("channel"):
+            if self.load(self._cacheValidity()) != YAPI.SUCCESS:
                 return YWireless.CHANNEL_INVALID
         return self._channel
 
@@ -197,8 +197,8 @@ class YWireless(YFunction):
 
         On failure, throws an exception or returns YWireless.SECURITY_INVALID.
         """
-        if self._cacheExpiration <= YAPI.GetTickCount():
-            if self.load(YAPI.DefaultCacheValidity) != YAPI.SUCCESS:
+        if self._cacheExpired("security"):
+            if self.load(self._cacheValidity()) != YAPI.SUCCESS:
                 return YWireless.SECURITY_INVALID
         return self._security
 
@@ -210,14 +210,14 @@ class YWireless(YFunction):
 
         On failure, throws an exception or returns YWireless.MESSAGE_INVALID.
         """
-        if self._cacheExpiration <= YAPI.GetTickCount():
-            if self.load(YAPI.DefaultCacheValidity) != YAPI.SUCCESS:
+        if self._cacheExpired("message"):
+            if self.load(self._cacheValidity()) != YAPI.SUCCESS:
                 return YWireless.MESSAGE_INVALID
         return self._message
 
     def get_wlanConfig(self):
-        if self._cacheExpiration <= YAPI.GetTickCount():
-            if self.load(YAPI.DefaultCacheValidity) != YAPI.SUCCESS:
+        if self._cacheExpired("wlanConfig"):
+            if self.load(self._cacheValidity()) != YAPI.SUCCESS:
                 return YWireless.WLANCONFIG_INVALID
         return self._wlanConfig
 
@@ -0,0 +1,107 @@
+# Tests of the asyncio front end against a stand-in hub, no device needed.
+# Run with: python -m unittest discover tests
+import asyncio
+import os
+import sys
+import unittest
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "Sources"))
+
+from yocto_api import YAPI, YSensor
+from yocto_asyncio import YAsyncAPI
+
+
+class FakeHub(object):
+    # stand-in for YAPI: value callbacks are invoked by HandleEvents()
+    def __init__(self):
+        self.urls = []
+        self.functions = {}
+        self.freed = False
+
+    def RegisterHub(self, url, errmsg=None):
+        self.urls.append(url)
+        return YAPI.SUCCESS
+
+    def UpdateDeviceList(self, errmsg=None):
+        return YAPI.SUCCESS
+
+    def HandleEvents(self, errmsg=None):
+        for func in self.functions.values():
+            func.deliver()
+        return YAPI.SUCCESS
+
+    def FreeAPI(self):
+        self.freed = True
+
+    def find(self, cls, name):
+        if name not in self.functions:
+            self.functions[name] = FakeSensor(name)
+        return self.functions[name]
+
+
+class FakeSensor(object):
+    def __init__(self, name):
+        self.name = name
+        self.value = 21.5
+        self.callback = None
+        self.queued = []
+
+    def get_currentValue(self):
+        return self.value
+
+    def set_lowestValue(self, value):
+        self.value = value
+        return YAPI.SUCCESS
+
+    def registerValueCallback(self, callback):
+        self.callback = callback
+        return YAPI.SUCCESS
+
+    def deliver(self):
+        while self.callback is not None and self.queued:
+            self.callback(self, self.queued.pop(0))
+
+
+class YAsyncAPITest(unittest.TestCase):
+    def setUp(self):
+        self.hub = FakeHub()
+        self.loop = asyncio.new_event_loop()
+        self.yapi = YAsyncAPI(api=self.hub, loop=self.loop, finder=self.hub.find)
+
+    def tearDown(self):
+        self.loop.run_until_complete(self.yapi.FreeAPI())
+        self.loop.close()
+        self.assertTrue(self.hub.freed)
+
+    def test_round_trip(self):
+        async def scenario():
+            self.assertEqual(await self.yapi.RegisterHub("127.0.0.1"), YAPI.SUCCESS)
+            sensor = await self.yapi.find(YSensor, "temp1")
+            self.assertIs(sensor, await self.yapi.find(YSensor, "temp1"))
+            self.assertEqual(await sensor.get_currentValue(), 21.5)
+            self.assertEqual(await sensor.set_lowestValue(3.0), YAPI.SUCCESS)
+            return await sensor.get_currentValue()
+
+        self.assertEqual(self.loop.run_until_complete(scenario()), 3.0)
+        self.assertEqual(self.hub.urls, ["127.0.0.1"])
+
+    def test_values(self):
+        async def scenario():
+            sensor = await self.yapi.find(YSensor, "temp1")
+            self.hub.functions["temp1"].queued = ["1.0", "2.0"]
+            received = []
+            async with sensor.values() as values:
+                self.yapi.startPump(msInterval=1)
+                async for (func, value) in values:
+                    received.append(value)
+                    if len(received) == 2:
+                        break
+            await self.yapi.stopPump()
+            return received
+
+        self.assertEqual(self.loop.run_until_complete(asyncio.wait_for(scenario(), 5)), ["1.0", "2.0"])
+        self.assertIsNone(self.hub.functions["temp1"].callback)
+
+
+if __name__ == "__main__":
+    unittest.main()
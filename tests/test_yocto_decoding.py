@@ -0,0 +1,208 @@
+# Reference vectors for the data stream decoders, no device needed.
+# Run with: python -m unittest discover tests
+import os
+import sys
+import unittest
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "Sources"))
+
+from yocto_api import YAPI, YDataStream, YRefParam
+from yocto_datalogger import YOldDataStream
+
+
+# encoded string, decoded words (as produced by the original character loop)
+WORD_VECTORS = [
+    ("", []),
+    ("*", [0]),
+    ("XY*", [65535, 32767, 0]),
+    ("000", [0]),
+    ("0z0", [2368]),
+    ("A0o", [64529]),
+    ("OOo", [65535]),
+    ("000a", [0, 0]),
+    ("123bc", [3137, 0, 0]),
+    ("a", [0]),
+    ("zzz", [0, 0, 0]),
+    ("*XYab", [0, 65535, 32767, 32767, 32767]),
+    ("Ot_Ot_a", [50335, 50335, 50335]),
+    ("!!!", [-15855]),
+    ("1@z", [45569]),
+    ("`0o", [64560]),
+    # truncated groups are dropped
+    ("AB", []),
+    ("12", []),
+    ("0000", [0]),
+    ("5K1h0b", [1893, 0]),
+]
+
+# encoded string, decoded values in thousandths
+FLOAT_VECTORS = [
+    ("", []),
+    ("1000,", [1000000]),
+    ("1000,2000,", [1000000, 2000000]),
+    ("-1500,250.5,", [-1500000, 250500]),
+    ("12.345,-0.5,", [12345, -500]),
+    ("3,0,0,1000,1100,", [3000, 0, 0, 1000000, 1100000]),
+    ("1.,-2.25,3.125,", [1000, -2250, 3125]),
+    ("0.001,999999,", [1, 999999000]),
+    ("  7,,8,", [7000, 8000]),
+    ("10-20,", [10000, 20000]),
+    ("1e5,", [1000, 5000]),
+    ("-,", [0]),
+    ("abc", []),
+    # the last value needs no separator
+    ("0", [0]),
+    ("12", [12000]),
+    ("1,-3", [1000, -3000]),
+]
+
+# 16-bit decimal float, decoded value
+DECIMAL_VECTORS = [
+    (0, 0.0),
+    (1, 1e-06),
+    (2047, 0.0020469999999999998),
+    (2048, 0.0),
+    (4095, 0.020470000000000002),
+    (12345, 57.0),
+    (30720, 0.0),
+    (32767, 2047000000000.0),
+    (32768, 0.0),
+    (32769, -1000000000.0),
+    (40000, -1088000000.0),
+    (65535, -0.0020469999999999998),
+    # out of range values, negative ones decode like their low 16 bits
+    (-1, -0.0020469999999999998),
+    (-2048, 0.0),
+    (-32768, 0.0),
+    (65536, 0.0),
+    (70000, -0.0368),
+]
+
+# calibration type, raw points, reference points, calibrated values of CALIB_INPUTS
+CALIB_INPUTS = [-5.0, 0.0, 2.5, 5.0, 10.0, 15.0, 20.0, 25.0, 150.0, 250.0]
+CALIB_VECTORS = [
+    (2, [0.0, 10.0], [1.0, 12.0], [-4.0, 1.0, 3.75, 6.5, 12.0, 17.0, 22.0, 27.0, 152.0, 252.0]),
+    (3, [0.0, 10.0, 20.0], [1.0, 12.0, 19.0], [-4.0, 1.0, 3.75, 6.5, 12.0, 15.5, 19.0, 24.0, 149.0, 249.0]),
+    (30, [100.0, 200.0], [110.0, 190.0], [5.0, 10.0, 12.5, 15.0, 20.0, 25.0, 30.0, 35.0, 150.0, 240.0]),
+    # raw points not increasing, left to the handler
+    (3, [10.0, 0.0, 20.0], [12.0, 1.0, 19.0], [-3.0, 2.0, 4.5, 7.0, 12.0, 14.5, 19.0, 24.0, 149.0, 249.0]),
+]
+
+
+class DecodeWordsTest(unittest.TestCase):
+    def test_vectors(self):
+        for sdat, expected in WORD_VECTORS:
+            self.assertEqual(list(YAPI._decodeWords(sdat)), expected, sdat)
+
+    def test_repeated_decoding(self):
+        # groups cached by a previous call decode the same way
+        for sdat, expected in WORD_VECTORS + WORD_VECTORS:
+            self.assertEqual(list(YAPI._decodeWords(sdat)), expected, sdat)
+
+
+class DecodeFloatsTest(unittest.TestCase):
+    def test_vectors(self):
+        for sdat, expected in FLOAT_VECTORS:
+            self.assertEqual(list(YAPI._decodeFloats(sdat)), expected, sdat)
+
+
+class DecimalTest(unittest.TestCase):
+    def setUp(self):
+        self.builds = 0
+        self.buildTable = YAPI.__dict__["_buildDecimalTable"]
+        build = self.buildTable.__func__
+
+        def countingBuild():
+            self.builds += 1
+            return build()
+
+        YAPI._buildDecimalTable = staticmethod(countingBuild)
+        YAPI._decimalTable = YAPI._DecimalTable()
+
+    def tearDown(self):
+        YAPI._buildDecimalTable = self.buildTable
+
+    def test_vectors(self):
+        for val, expected in DECIMAL_VECTORS:
+            self.assertEqual(YAPI._decimalToDouble(val), expected, val)
+        self.assertEqual(YAPI._decimalsToDoubles([val for val, expected in DECIMAL_VECTORS]),
+                         [expected for val, expected in DECIMAL_VECTORS])
+
+    def test_out_of_range(self):
+        self.assertRaises(IndexError, YAPI._decimalToDouble, -40000)
+
+    def test_table_built_once(self):
+        words = list(range(0, 65536, 97))
+        self.assertEqual(YAPI._decimalsToDoubles(words), [YAPI._computeDecimalToDouble(w) for w in words])
+        self.assertEqual(YAPI._decimalsToDoubles(words), [YAPI._computeDecimalToDouble(w) for w in words])
+        YAPI._decimalToDouble(12345)
+        self.assertEqual(self.builds, 1)
+
+
+class CalibrationTest(unittest.TestCase):
+    def test_vectors(self):
+        for calibType, rawValues, refValues, expected in CALIB_VECTORS:
+            calib = YAPI._Calibration(YAPI.LinearCalibrationHandler, calibType, [], rawValues, refValues)
+            self.assertEqual([calib.apply(v) for v in CALIB_INPUTS], expected, rawValues)
+            self.assertEqual(calib.applyMany(CALIB_INPUTS), expected, rawValues)
+
+    def test_same_as_handler(self):
+        handler = YAPI.LinearCalibrationHandler
+        inputs = [x * 0.25 - 10.0 for x in range(200)]
+        for calibType, rawValues, refValues, expected in CALIB_VECTORS:
+            calib = YAPI._Calibration(handler, calibType, [], rawValues, refValues)
+            self.assertEqual(calib.applyMany(inputs),
+                             [handler(v, calibType, [], rawValues, refValues) for v in inputs])
+
+    def test_custom_handler(self):
+        calib = YAPI._Calibration(lambda v, t, p, raw, ref: v * 2, 1, [], [0.0], [0.0])
+        self.assertEqual(calib.applyMany([1.0, 2.5]), [2.0, 5.0])
+
+
+class FakeDataLogger(object):
+    # stand-in for YDataLogger, serves the reply of an old firmware
+    def __init__(self, reply):
+        self.reply = reply
+        self.requests = []
+
+    def getData(self, runIdx, timeIdx, jsonRef):
+        self.requests.append((runIdx, timeIdx))
+        jsonRef.value = YAPI.TJsonParser(self.reply, False)
+        return YAPI.SUCCESS
+
+
+class OldDataStreamTest(unittest.TestCase):
+    REPLY = ('{"time":120,"UTC":1400000000,"interval":60,"nRows":2,'
+             '"keys":["temperature","voltage"],"div":[1,1],"type":[0,2],"scal":[65536,32768],'
+             '"data":[100,45112,300,32768,500]}')
+
+    def setUp(self):
+        self.logger = FakeDataLogger(self.REPLY)
+        self.stream = YOldDataStream(self.logger, 1, 120, 0, 60)
+
+    def test_get_data(self):
+        self.assertEqual(self.stream.get_data(0, 0), 100.0)
+        self.assertEqual(self.stream.get_data(0, 1), 57.0)
+        self.assertEqual(self.stream.get_data(1, 0), 300.0)
+        self.assertEqual(self.stream.get_data(1, 1), 1e-06)
+        # the trailing partial row is dropped
+        self.assertEqual(self.stream.get_data(2, 0), YDataStream.DATA_INVALID)
+        self.assertEqual(self.stream.get_data(0, 2), YDataStream.DATA_INVALID)
+        self.assertEqual(self.logger.requests, [(1, 120)])
+
+    def test_columns(self):
+        self.assertEqual(self.stream.loadStream(), YAPI.SUCCESS)
+        self.assertEqual(self.stream.get_columnNames(), ["temperature", "voltage"])
+        self.assertEqual([list(col) for col in self.stream.get_dataColumns()], [[100.0, 300.0], [57.0, 1e-06]])
+        self.assertEqual([list(row) for row in self.stream.get_dataRows()], [[100.0, 57.0], [300.0, 1e-06]])
+        self.assertEqual(self.stream.get_startTimeUTC(), 1400000000)
+
+    def test_reload(self):
+        self.stream.loadStream()
+        self.assertEqual(self.stream.loadStream(), YAPI.SUCCESS)
+        self.assertEqual(self.stream.get_columnNames(), ["temperature", "voltage"])
+        self.assertEqual(self.stream.get_data(1, 0), 300.0)
+
+
+if __name__ == "__main__":
+    unittest.main()